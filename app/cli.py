@@ -0,0 +1,122 @@
+"""
+Command line maintenance tasks for DevOpsMCP
+
+Usage:
+    python -m app.cli migrate [--status]
+    python -m app.cli rollup-check [--repair]
+    python -m app.cli ingest FILE [FILE ...]
+    python -m app.cli sync --source-file FILE [--interval SECONDS]
+"""
+import argparse
+import json
+import logging
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+
+def migrate(args: argparse.Namespace) -> int:
+    """Apply pending schema migrations, or only report them with --status"""
+    from app.config import get_settings
+    from app.migrations import migration_status
+
+    if args.status:
+        # Read-only, so checking a missing database does not create it
+        path = Path(get_settings().database_path)
+        conn = sqlite3.connect(f"{path.as_uri()}?mode=ro", uri=True) if path.exists() else sqlite3.connect(":memory:")
+        try:
+            print(json.dumps(migration_status(conn), indent=2))
+        finally:
+            conn.close()
+        return 0
+
+    # Creating the manager migrates the database
+    from app.database import db_manager
+
+    with db_manager.get_connection() as conn:
+        print(json.dumps(migration_status(conn), indent=2))
+    return 0
+
+
+def rollup_check(args: argparse.Namespace) -> int:
+    """Diff the BugDailyFixes rollup and the time-to-fix sketches against Bugs, optionally rebuilding them"""
+    from app.services.fix_rollup import bug_fix_rollup
+    from app.services.cycle_time import cycle_time_sketches
+
+    results = {
+        "BugDailyFixes": bug_fix_rollup.check(repair=args.repair),
+        "BugCycleTimeSketches": cycle_time_sketches.check(repair=args.repair)
+    }
+    print(json.dumps(results, indent=2, default=str))
+    if all(result["consistent"] or result["repaired"] for result in results.values()):
+        return 0
+    return 1
+
+
+def ingest(args: argparse.Namespace) -> int:
+    """Bulk upsert JSON batch files (IngestRequest bodies; "-" reads stdin)"""
+    from app.schemas.ingest_schemas import IngestRequest
+    from app.services.ingest_service import ingest_service
+
+    for path in args.files:
+        if path == "-":
+            payload = sys.stdin.read()
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = f.read()
+        result = ingest_service.upsert(IngestRequest.model_validate_json(payload))
+        print(json.dumps({"file": path, **result.model_dump()}, indent=2))
+    return 0
+
+
+def sync(args: argparse.Namespace) -> int:
+    """Run an incremental sync once, or every --interval seconds"""
+    from app.services.sync_engine import SyncEngine
+    from app.services.sync_sources import FileSyncSource
+
+    engine = SyncEngine(FileSyncSource(args.source_file), batch_size=args.batch_size)
+    while True:
+        result = engine.run()
+        print(json.dumps(result, indent=2))
+        if not args.interval:
+            return 1 if any(project["error"] for project in result["projects"]) else 0
+        time.sleep(args.interval)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with one sub-command per task"""
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="DevOpsMCP maintenance tasks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    upgrade = subparsers.add_parser("migrate", help="Bring the database schema up to the latest version")
+    upgrade.add_argument("--status", action="store_true", help="Only report the schema version and pending steps")
+    upgrade.set_defaults(func=migrate)
+
+    check = subparsers.add_parser("rollup-check", help="Verify the bug-fix rollup and time-to-fix sketches against raw bugs")
+    check.add_argument("--repair", action="store_true", help="Rebuild whatever has drifted")
+    check.set_defaults(func=rollup_check)
+
+    load = subparsers.add_parser("ingest", help="Bulk upsert projects, work items and bugs from JSON batch files")
+    load.add_argument("files", nargs="+", help="JSON files shaped like the /api/ingest/upsert body, or - for stdin")
+    load.set_defaults(func=ingest)
+
+    run_sync = subparsers.add_parser("sync", help="Pull work items and bugs changed since the last sync")
+    run_sync.add_argument("--source-file", required=True, help="Azure DevOps export served by FileSyncSource")
+    run_sync.add_argument("--batch-size", type=int, default=None, help="Work items per transaction")
+    run_sync.add_argument("--interval", type=float, default=None, help="Repeat every N seconds")
+    run_sync.set_defaults(func=sync)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point"""
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ Loads environment variables and provides application settings
 """
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 import os
 from pathlib import Path
 
@@ -14,16 +15,57 @@ class Settings(BaseSettings):
     # Database Configuration - SQLite
     db_path: str = "devops_mcp.db"
     
+    # Connection Pool Configuration
+    db_pool_size: int = 5
+    db_pool_timeout: float = 30.0  # Seconds to wait for a free connection
+    db_busy_timeout_ms: int = 5000
+    db_cache_size_kib: int = 16384  # Page cache per connection (16 MiB)
+    db_mmap_size: int = 268435456  # Memory-mapped I/O window (256 MiB)
+    
+    # Read Replica Configuration
+    read_replica_enabled: bool = False  # Serve analytics reads from published read-only snapshots
+    read_replica_dir: Optional[str] = None  # Snapshot directory (default: "<database path>-snapshots")
+    read_replica_interval_seconds: float = 60.0  # Publish interval; skipped while the database is unchanged
+    
+    # Async Execution Configuration
+    db_async_workers: int = 5  # Threads running blocking queries for async routes
+    
+    # Streaming Configuration
+    stream_batch_size: int = 500  # Rows fetched and flushed per chunk in NDJSON responses
+    
+    # Response Cache Configuration
+    response_cache_enabled: bool = True
+    response_cache_ttl_seconds: float = 30.0
+    response_cache_max_entries: int = 256
+    
+    # Project Catalog Configuration
+    project_catalog_refresh_seconds: float = 30.0  # Min interval between Projects change checks
+    
+    # Sync Configuration
+    sync_batch_size: int = 1000  # Work items applied per transaction
+    sync_source_file: Optional[str] = None  # JSON file served by FileSyncSource; enables scheduled sync
+    sync_interval_seconds: float = 300.0
+    
     # Application Configuration
     app_host: str = "0.0.0.0"
     app_port: int = 8000
     log_level: str = "INFO"
+    app_env: str = "development"  # "production" never loads the sample seed data
+    
+    # Logging Configuration
+    log_format: str = "text"  # "text" or "json" (one object per line)
+    db_log_sample_rate: float = 1.0  # Fraction of DEBUG/INFO database events kept
     
     class Config:
         env_file = ".env"
         case_sensitive = False
         extra = "ignore"  # Ignore extra fields from .env
     
+    @property
+    def seed_sample_data(self) -> bool:
+        """Whether a newly created database gets the sample data"""
+        return self.app_env.lower() != "production"
+    
     @property
     def database_path(self) -> str:
         """Get absolute path to SQLite database"""
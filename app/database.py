@@ -1,15 +1,191 @@
 """
 Database connection and management for SQLite Database
 """
+import asyncio
+import contextvars
+import functools
 import sqlite3
 import logging
-from typing import Optional, List, Dict, Any
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Callable, Iterator, TypeVar, Union
 from contextlib import contextmanager
 from pathlib import Path
 from app.config import get_settings
+from app.migrations import migrate
+from app.metrics import metrics, db_query_duration_seconds, db_query_rows, db_query_errors_total
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+class PoolTimeoutError(sqlite3.OperationalError):
+    """Raised when no pooled connection becomes available in time"""
+
+
+class ConnectionPool:
+    """
+    Bounded pool of pre-configured SQLite connections
+    
+    Connections are opened lazily up to ``size`` and then reused, so the
+    connect cost and the per-connection page cache survive across queries.
+    Idle connections are handed out LIFO to keep the warmest cache in use.
+    A ``read_only`` pool opens the file as immutable: no locks, no journal,
+    for database files nobody writes to (published read snapshots).
+    """
+    
+    def __init__(
+        self,
+        db_path: str,
+        size: int = 5,
+        timeout: float = 30.0,
+        busy_timeout_ms: int = 5000,
+        cache_size_kib: int = 16384,
+        mmap_size: int = 268435456,
+        read_only: bool = False
+    ):
+        self.db_path = db_path
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cache_size_kib = cache_size_kib
+        self.mmap_size = mmap_size
+        self.read_only = read_only
+        
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._open = 0
+        self._closed = False
+        
+        # Statistics
+        self._acquisitions = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection and apply the performance PRAGMAs"""
+        if self.read_only:
+            conn = sqlite3.connect(
+                f"{Path(self.db_path).resolve().as_uri()}?mode=ro&immutable=1",
+                uri=True,
+                check_same_thread=False
+            )
+        else:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout_ms / 1000,
+                check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kib)}")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        logger.debug("Database connection opened (%s/%s)", self._open, self.size)
+        return conn
+    
+    def acquire(self) -> sqlite3.Connection:
+        """
+        Take a connection from the pool, opening one if below capacity
+        
+        Raises:
+            PoolTimeoutError: If the pool is exhausted for longer than ``timeout``
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError("Connection pool is closed")
+        
+        started = time.perf_counter()
+        waited = False
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._open < self.size
+                if can_open:
+                    self._open += 1
+            if can_open:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._open -= 1
+                    raise
+            else:
+                waited = True
+                try:
+                    conn = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    with self._lock:
+                        self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"Timed out after {self.timeout}s waiting for a database connection"
+                    )
+        
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._acquisitions += 1
+            if waited:
+                self._waits += 1
+                self._total_wait += elapsed
+                self._max_wait = max(self._max_wait, elapsed)
+        return conn
+    
+    def release(self, conn: sqlite3.Connection, discard: bool = False):
+        """Return a connection to the pool, or close it if broken or the pool is closed"""
+        if not discard:
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except sqlite3.Error:
+                discard = True
+        
+        if discard or self._closed:
+            try:
+                conn.close()
+            finally:
+                with self._lock:
+                    self._open -= 1
+            return
+        
+        self._idle.put(conn)
+    
+    def close(self):
+        """Close every idle connection and refuse further acquisitions"""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._open -= 1
+        logger.info("Database connection pool closed")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool utilisation and wait-time statistics"""
+        with self._lock:
+            idle = self._idle.qsize()
+            return {
+                "pool_size": self.size,
+                "connections_open": self._open,
+                "connections_idle": idle,
+                "connections_in_use": self._open - idle,
+                "acquisitions": self._acquisitions,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "total_wait_ms": round(self._total_wait * 1000, 3),
+                "max_wait_ms": round(self._max_wait * 1000, 3),
+                "avg_wait_ms": round(self._total_wait * 1000 / self._waits, 3) if self._waits else 0.0
+            }
+
 
 class DatabaseManager:
     """Manages database connections and queries for SQLite"""
@@ -17,66 +193,117 @@ class DatabaseManager:
     def __init__(self):
         self.settings = get_settings()
         self.db_path = self.settings.database_path
-        self._ensure_database_exists()
-        
-    def _ensure_database_exists(self):
-        """Create database and schema if it doesn't exist"""
-        db_file = Path(self.db_path)
-        if not db_file.exists():
-            logger.info(f"Database not found at {self.db_path}, creating new database")
-            # Create empty database
-            conn = sqlite3.connect(self.db_path)
-            conn.close()
-            # Initialize schema
-            self._initialize_schema()
-        else:
-            logger.info(f"Using existing database at {self.db_path}")
-    
-    def _initialize_schema(self):
-        """Initialize database schema from schema_sqlite.sql"""
-        schema_path = Path(__file__).parent.parent / "schema_sqlite.sql"
-        if schema_path.exists():
-            logger.info(f"Initializing database schema from {schema_path}")
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                schema_sql = f.read()
-            
-            with self.get_connection() as conn:
-                conn.executescript(schema_sql)
-                conn.commit()
-            logger.info("Database schema initialized successfully")
+        self.pool = ConnectionPool(
+            self.db_path,
+            size=self.settings.db_pool_size,
+            timeout=self.settings.db_pool_timeout,
+            busy_timeout_ms=self.settings.db_busy_timeout_ms,
+            cache_size_kib=self.settings.db_cache_size_kib,
+            mmap_size=self.settings.db_mmap_size
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.settings.db_async_workers),
+            thread_name_prefix="db-worker"
+        )
+        # Read-only watcher used for PRAGMA data_version (see data_version)
+        self._watch_conn: Optional[sqlite3.Connection] = None
+        self._watch_lock = threading.Lock()
+        # Connection bound by read_snapshot for the current context
+        self._snapshot_conn: contextvars.ContextVar[Optional[sqlite3.Connection]] = contextvars.ContextVar(
+            "snapshot_conn", default=None
+        )
+        self.migrate()
+        
+    def migrate(self) -> List[int]:
+        """
+        Create the database if needed and apply pending schema migrations
+        
+        Sample data is loaded only into a newly created database, and never
+        when APP_ENV is production.
+        
+        Returns:
+            Schema versions applied
+        """
+        if not Path(self.db_path).exists():
+            logger.info("Database not found at %s, creating new database", self.db_path)
         else:
-            logger.warning(f"Schema file not found at {schema_path}")
+            logger.info("Using existing database at %s", self.db_path)
+        # The first pooled connection creates the file
+        with self.get_connection() as conn:
+            return migrate(conn, seed=self.settings.seed_sample_data)
         
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
+        """
+        Context manager that borrows a pooled database connection
+        
+        Inside a ``read_snapshot`` block the snapshot's connection is reused
+        instead, so every query sees the same read transaction.
+        """
+        snapshot_conn = self._snapshot_conn.get()
+        if snapshot_conn is not None:
+            yield snapshot_conn
+            return
+        
         conn = None
+        discard = False
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Enable column access by name
-            logger.info("Database connection established")
+            conn = self.pool.acquire()
             yield conn
         except sqlite3.Error as e:
-            logger.error(f"Database connection error: {e}")
+            # Interface/programming errors can leave the connection unusable
+            discard = isinstance(e, (sqlite3.InterfaceError, sqlite3.ProgrammingError))
+            logger.error("Database connection error: %s", e)
             raise
         finally:
             if conn:
-                conn.close()
-                logger.info("Database connection closed")
+                self.pool.release(conn, discard=discard)
     
-    def execute_query(self, query: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
+    @contextmanager
+    def read_snapshot(self):
+        """
+        Run every query in the block on one connection and one read transaction
+        
+        All reads issued through this manager inside the block (from any
+        service) see the same consistent snapshot and share a single pooled
+        connection. Blocks nest; only the outermost one owns the transaction.
+        The block must not write: the transaction is rolled back on exit.
+        
+        Yields:
+            The snapshot's sqlite3 connection
+        """
+        current = self._snapshot_conn.get()
+        if current is not None:
+            yield current
+            return
+        
+        with self.get_connection() as conn:
+            conn.execute("BEGIN")
+            token = self._snapshot_conn.set(conn)
+            try:
+                yield conn
+            finally:
+                self._snapshot_conn.reset(token)
+                conn.rollback()
+    
+    def execute_query(self, query: str, params: Optional[Union[tuple, dict]] = None, as_tuples: bool = False) -> List[Any]:
         """
         Execute a SELECT query and return results as list of dictionaries
         
         Args:
             query: SQL query string
-            params: Optional tuple of query parameters
+            params: Optional tuple of positional or dict of named query parameters
+            as_tuples: Return plain tuples in column order instead, skipping
+                the per-row dictionary (for hot paths that map by position)
             
         Returns:
-            List of dictionaries containing query results
+            List of dictionaries (or tuples) containing query results
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            if as_tuples:
+                cursor.row_factory = None
+            started = time.perf_counter()
             try:
                 if params:
                     cursor.execute(query, params)
@@ -85,30 +312,92 @@ class DatabaseManager:
                 
                 # Fetch all rows and convert to dictionaries
                 rows = cursor.fetchall()
-                results = [dict(row) for row in rows]
+                results = rows if as_tuples else [dict(row) for row in rows]
                 
-                logger.info(f"Query executed successfully, returned {len(results)} rows")
+                db_query_duration_seconds.observe(time.perf_counter() - started, kind="query")
+                db_query_rows.observe(len(results), kind="query")
+                logger.debug("Query executed successfully, returned %s rows", len(results))
                 return results
                 
             except sqlite3.Error as e:
-                logger.error(f"Query execution error: {e}")
+                db_query_errors_total.inc(kind="query")
+                logger.error("Query execution error: %s", e)
+                raise
+            finally:
+                cursor.close()
+    
+    def iter_query(
+        self,
+        query: str,
+        params: Optional[Union[tuple, dict]] = None,
+        batch_size: int = 500,
+        as_tuples: bool = False
+    ) -> Iterator[List[Any]]:
+        """
+        Execute a SELECT query and yield its results in batches
+        
+        Rows are pulled with ``fetchmany`` so only one batch is held in
+        memory. The pooled connection stays checked out until the iterator
+        is exhausted or closed.
+        
+        Args:
+            query: SQL query string
+            params: Optional tuple of positional or dict of named query parameters
+            batch_size: Number of rows per yielded batch
+            as_tuples: Yield plain tuples in column order instead of dictionaries
+            
+        Yields:
+            Lists of up to ``batch_size`` dictionaries (or tuples)
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            if as_tuples:
+                cursor.row_factory = None
+            # Time spent in SQLite only, excluding the consumer between batches
+            elapsed = 0.0
+            try:
+                started = time.perf_counter()
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                
+                total = 0
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    batch = rows if as_tuples else [dict(row) for row in rows]
+                    elapsed += time.perf_counter() - started
+                    if not batch:
+                        break
+                    total += len(batch)
+                    yield batch
+                    started = time.perf_counter()
+                
+                db_query_duration_seconds.observe(elapsed, kind="stream")
+                db_query_rows.observe(total, kind="stream")
+                logger.debug("Streaming query completed, returned %s rows", total)
+                
+            except sqlite3.Error as e:
+                db_query_errors_total.inc(kind="stream")
+                logger.error("Query execution error: %s", e)
                 raise
             finally:
                 cursor.close()
     
-    def execute_non_query(self, query: str, params: Optional[tuple] = None) -> int:
+    def execute_non_query(self, query: str, params: Optional[Union[tuple, dict]] = None) -> int:
         """
         Execute an INSERT, UPDATE, or DELETE query
         
         Args:
             query: SQL query string
-            params: Optional tuple of query parameters
+            params: Optional tuple of positional or dict of named query parameters
             
         Returns:
             Number of rows affected
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            started = time.perf_counter()
             try:
                 if params:
                     cursor.execute(query, params)
@@ -117,16 +406,48 @@ class DatabaseManager:
                 
                 conn.commit()
                 rows_affected = cursor.rowcount
-                logger.info(f"Non-query executed successfully, {rows_affected} rows affected")
+                db_query_duration_seconds.observe(time.perf_counter() - started, kind="non_query")
+                db_query_rows.observe(max(rows_affected, 0), kind="non_query")
+                logger.debug("Non-query executed successfully, %s rows affected", rows_affected)
                 return rows_affected
                 
             except sqlite3.Error as e:
+                db_query_errors_total.inc(kind="non_query")
                 conn.rollback()
-                logger.error(f"Non-query execution error: {e}")
+                logger.error("Non-query execution error: %s", e)
                 raise
             finally:
                 cursor.close()
     
+    async def run_async(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run a blocking database callable on the dedicated worker pool
+        
+        The event loop stays free while SQLite works; concurrency is bounded
+        by the ``db_async_workers`` setting. Context variables are carried
+        into the worker thread.
+        
+        Args:
+            func: Blocking callable to execute
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+            
+        Returns:
+            Whatever ``func`` returns
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs)
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(self._executor, ctx.run, call)
+    
+    async def execute_query_async(self, query: str, params: Optional[Union[tuple, dict]] = None) -> List[Dict[str, Any]]:
+        """Async variant of execute_query"""
+        return await self.run_async(self.execute_query, query, params)
+    
+    async def execute_non_query_async(self, query: str, params: Optional[Union[tuple, dict]] = None) -> int:
+        """Async variant of execute_non_query"""
+        return await self.run_async(self.execute_non_query, query, params)
+    
     def test_connection(self) -> bool:
         """Test database connectivity"""
         try:
@@ -134,12 +455,65 @@ class DatabaseManager:
                 cursor = conn.cursor()
                 cursor.execute("SELECT 1")
                 cursor.fetchone()
-                logger.info("Database connection test successful")
+                logger.debug("Database connection test successful")
                 return True
         except Exception as e:
-            logger.error(f"Database connection test failed: {e}")
+            logger.error("Database connection test failed: %s", e)
             return False
+    
+    def data_version(self) -> int:
+        """
+        Get a token that changes whenever the database content changes
+        
+        ``PRAGMA data_version`` only changes for commits made by *other*
+        connections, so it is read from a dedicated connection that never
+        writes; commits from the pool and from other processes both bump it.
+        
+        Returns:
+            Opaque integer; compare for equality only
+        """
+        with self._watch_lock:
+            if self._watch_conn is None:
+                self._watch_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            return self._watch_conn.execute("PRAGMA data_version").fetchone()[0]
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics"""
+        return self.pool.stats()
+    
+    def close(self):
+        """Stop the async worker pool and close all pooled connections"""
+        self._executor.shutdown(wait=True)
+        with self._watch_lock:
+            if self._watch_conn is not None:
+                self._watch_conn.close()
+                self._watch_conn = None
+        self.pool.close()
 
 
 # Singleton instance
 db_manager = DatabaseManager()
+
+
+def _pool_metrics():
+    """Expose connection pool statistics as Prometheus gauges and counters"""
+    stats = db_manager.pool_stats()
+    return [
+        ("devops_mcp_db_pool_size", "gauge", "Maximum number of pooled connections",
+         [({}, stats["pool_size"])]),
+        ("devops_mcp_db_connections", "gauge", "Pooled database connections by state",
+         [({"state": "open"}, stats["connections_open"]),
+          ({"state": "idle"}, stats["connections_idle"]),
+          ({"state": "in_use"}, stats["connections_in_use"])]),
+        ("devops_mcp_db_pool_acquisitions_total", "counter", "Connections handed out by the pool",
+         [({}, stats["acquisitions"])]),
+        ("devops_mcp_db_pool_waits_total", "counter", "Acquisitions that had to wait for a free connection",
+         [({}, stats["waits"])]),
+        ("devops_mcp_db_pool_timeouts_total", "counter", "Acquisitions that timed out",
+         [({}, stats["timeouts"])]),
+        ("devops_mcp_db_pool_wait_seconds_total", "counter", "Total time spent waiting for a connection",
+         [({}, stats["total_wait_ms"] / 1000)])
+    ]
+
+
+metrics.register_collector(_pool_metrics)
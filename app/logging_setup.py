@@ -0,0 +1,140 @@
+"""
+Logging configuration for DevOpsMCP
+
+Log records are handed to a queue and written to stdout by a background
+listener thread, so request handlers never block on I/O or spend time
+formatting. Every record carries the correlation id of the request that
+produced it, and DB-level events can be sampled to keep volume down.
+"""
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+from app.config import Settings, get_settings
+
+# Correlation id of the request being served; copied into worker threads by
+# DatabaseManager.run_async along with the rest of the context
+correlation_id: contextvars.ContextVar[str] = contextvars.ContextVar("correlation_id", default="-")
+
+# Loggers whose DEBUG/INFO records are subject to db_log_sample_rate
+SAMPLED_LOGGERS = ("app.database",)
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(correlation_id)s] %(message)s"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class CorrelationIdFilter(logging.Filter):
+    """Stamp each record with the current correlation id"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = correlation_id.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a random fraction of low-severity records
+    
+    Warnings and errors always pass; DEBUG and INFO records pass with
+    probability ``rate``.
+    """
+    
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate >= 1.0:
+            return True
+        return self.rate > 0.0 and random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """Render records as one JSON object per line"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "correlation_id": getattr(record, "correlation_id", "-"),
+            "message": record.getMessage()
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread
+    
+    The stock ``QueueHandler.prepare`` renders the message in the calling
+    thread; here the record is enqueued as is, with its arguments, so the
+    request thread only pays for creating the record.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def build_formatter(log_format: str) -> logging.Formatter:
+    """Build the formatter for the ``log_format`` setting ("text" or "json")"""
+    if log_format.lower() == "json":
+        return JsonFormatter()
+    return logging.Formatter(TEXT_FORMAT)
+
+
+def configure_logging(settings: Optional[Settings] = None):
+    """
+    Install the queue-based logging pipeline on the root logger
+    
+    Safe to call more than once; a previous listener is stopped first.
+    
+    Args:
+        settings: Application settings (defaults to get_settings())
+    """
+    global _listener
+    settings = settings or get_settings()
+    shutdown_logging()
+    
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(build_formatter(settings.log_format))
+    
+    handler = DeferredQueueHandler(queue.SimpleQueue())
+    handler.addFilter(CorrelationIdFilter())
+    
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        if isinstance(existing, DeferredQueueHandler):
+            root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(settings.log_level.upper())
+    
+    for name in SAMPLED_LOGGERS:
+        sampled = logging.getLogger(name)
+        for existing in list(sampled.filters):
+            if isinstance(existing, SamplingFilter):
+                sampled.removeFilter(existing)
+        sampled.addFilter(SamplingFilter(settings.db_log_sample_rate))
+    
+    _listener = logging.handlers.QueueListener(handler.queue, output, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
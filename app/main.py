@@ -2,25 +2,31 @@
 DevOpsMCP - Model Context Protocol API for DevOps Analytics
 Main FastAPI application entry point
 """
+import asyncio
 import logging
-import sys
+import time
+import uuid
+from datetime import datetime, timezone
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.exceptions import RequestValidationError
+from fastapi.encoders import jsonable_encoder
+from starlette.routing import Match
 from app.config import get_settings
 from app.database import db_manager
-from app.routers import bugs
+from app.logging_setup import configure_logging, correlation_id
+from app.replica import read_db, publish_periodically
+from app.metrics import metrics, http_requests_total, http_request_duration_seconds, http_requests_in_flight
+from app.services.project_catalog import project_catalog
+from app.services.response_cache import response_cache
+from app.services.sync_engine import SyncEngine, run_periodically
+from app.services.sync_sources import FileSyncSource
+from app.routers import bugs, commits, ingest, pipelines
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -30,18 +36,40 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting DevOpsMCP application...")
     settings = get_settings()
-    logger.info(f"Database path: {settings.database_path}")
+    logger.info("Database path: %s", settings.database_path)
     
     # Test database connection
     if db_manager.test_connection():
         logger.info("Database connection successful")
+        project_catalog.load()
     else:
         logger.error("Database connection failed")
     
+    # Read snapshots for the analytics endpoints: the first one is published
+    # before serving so reads never start on the primary under write load
+    publish_task = None
+    if settings.read_replica_enabled:
+        await read_db.run_async(read_db.publish)
+        publish_task = asyncio.create_task(publish_periodically(read_db, settings.read_replica_interval_seconds))
+        logger.info("Publishing read snapshots every %ss to %s", settings.read_replica_interval_seconds, read_db.directory)
+    
+    # Scheduled incremental sync
+    sync_task = None
+    if settings.sync_source_file:
+        engine = SyncEngine(FileSyncSource(settings.sync_source_file))
+        sync_task = asyncio.create_task(run_periodically(engine, settings.sync_interval_seconds))
+        logger.info("Scheduled sync every %ss from %s", settings.sync_interval_seconds, settings.sync_source_file)
+    
     yield
     
     # Shutdown
     logger.info("Shutting down DevOpsMCP application...")
+    if sync_task is not None:
+        sync_task.cancel()
+    if publish_task is not None:
+        publish_task.cancel()
+        read_db.close()
+    db_manager.close()
 
 
 # Create FastAPI application
@@ -69,15 +97,51 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Record per-endpoint latency, status codes and in-flight requests"""
+    # The matched route template keeps label cardinality bounded
+    # (one series per endpoint, not per URL)
+    route = next(
+        (r.path for r in request.app.router.routes if r.matches(request.scope)[0] == Match.FULL),
+        "unmatched"
+    )
+    method = request.method
+    http_requests_in_flight.inc(route=route)
+    started = time.perf_counter()
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        http_request_duration_seconds.observe(time.perf_counter() - started, method=method, route=route)
+        http_requests_total.inc(method=method, route=route, status=status_code)
+        http_requests_in_flight.dec(route=route)
+
+
+@app.middleware("http")
+async def assign_correlation_id(request: Request, call_next):
+    """Tag every log record of a request with its X-Request-ID (generated if absent)"""
+    request_id = request.headers.get("x-request-id") or uuid.uuid4().hex[:16]
+    token = correlation_id.set(request_id)
+    try:
+        response = await call_next(request)
+    finally:
+        correlation_id.reset(token)
+    response.headers["X-Request-ID"] = request_id
+    return response
+
+
 # Global exception handlers
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle request validation errors"""
-    logger.error(f"Validation error: {exc.errors()}")
+    logger.error("Validation error: %s", exc.errors())
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
-            "detail": exc.errors(),
+            "detail": jsonable_encoder(exc.errors()),
             "message": "Request validation failed"
         }
     )
@@ -86,7 +150,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
@@ -98,6 +162,9 @@ async def general_exception_handler(request: Request, exc: Exception):
 
 # Include routers
 app.include_router(bugs.router)
+app.include_router(ingest.router)
+app.include_router(pipelines.router)
+app.include_router(commits.router)
 
 
 # Root endpoint
@@ -125,16 +192,30 @@ async def root():
 )
 async def health():
     """Health check endpoint"""
-    db_healthy = db_manager.test_connection()
+    db_healthy = await db_manager.run_async(db_manager.test_connection)
     
     return {
         "status": "healthy" if db_healthy else "unhealthy",
         "api": "operational",
         "database": "connected" if db_healthy else "disconnected",
-        "timestamp": "2025-11-20T00:00:00Z"
+        "database_pool": db_manager.pool_stats(),
+        "read_replica": read_db.status() if get_settings().read_replica_enabled else {"enabled": False},
+        "response_cache": response_cache.stats(),
+        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     }
 
 
+@app.get(
+    "/metrics",
+    summary="Prometheus Metrics",
+    description="Request latency, query timing, connection pool and cache metrics in Prometheus text format",
+    response_class=PlainTextResponse
+)
+async def get_metrics():
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @app.get(
     "/mcp.json",
     summary="MCP Configuration",
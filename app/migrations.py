@@ -0,0 +1,655 @@
+"""
+Versioned schema migrations tracked by PRAGMA user_version
+
+Every step is idempotent (``IF NOT EXISTS`` DDL, backfills that clear
+before they insert), so a database created by an older release that
+already has some of the objects upgrades cleanly from version 0. A step
+commits together with its new user_version; a failed step rolls back and
+leaves the database on the previous version.
+"""
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Callable
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).parent.parent
+SCHEMA_PATH = ROOT / "schema_sqlite.sql"
+SEED_PATH = ROOT / "seed_sqlite.sql"
+
+
+# Version 2: covering indexes for the bug analytics queries
+COVERING_INDEXES_DDL = """
+CREATE INDEX IF NOT EXISTS IX_Bugs_Status_FixedDate ON Bugs(Status, FixedDate, WorkItemId);
+CREATE INDEX IF NOT EXISTS IX_Bugs_Status_Severity ON Bugs(Status, Severity);
+CREATE INDEX IF NOT EXISTS IX_Bugs_WorkItemId_Status ON Bugs(WorkItemId, Status, Severity);
+"""
+
+# Version 3: natural keys the bulk upserts conflict on
+UPSERT_KEYS_DDL = """
+CREATE UNIQUE INDEX IF NOT EXISTS UX_Projects_AzureProjectId ON Projects(AzureProjectId);
+CREATE UNIQUE INDEX IF NOT EXISTS UX_WorkItems_AzureWorkItemId ON WorkItems(AzureWorkItemId);
+CREATE UNIQUE INDEX IF NOT EXISTS UX_Bugs_AzureBugId ON Bugs(AzureBugId);
+"""
+
+# (table, column) of each natural key above
+UPSERT_KEYS = (("Projects", "AzureProjectId"), ("WorkItems", "AzureWorkItemId"), ("Bugs", "AzureBugId"))
+
+# Duplicate values reported per key when the unique indexes cannot be built
+MAX_REPORTED_DUPLICATES = 10
+
+
+class DuplicateKeyError(sqlite3.IntegrityError):
+    """Existing rows share a natural key that a migration makes unique"""
+
+
+def check_upsert_keys(conn: sqlite3.Connection):
+    """
+    Refuse migration 3 with the offending ids if the natural keys are not unique
+    
+    Rows sharing an Azure id are not merged automatically: bugs, work items
+    and commits reference them by their local ids, so which row survives is
+    left to the operator.
+    
+    Raises:
+        DuplicateKeyError: Naming the duplicate values per key
+    """
+    problems = []
+    for table, column in UPSERT_KEYS:
+        rows = conn.execute(
+            f"SELECT {column}, COUNT(*) FROM {table} WHERE {column} IS NOT NULL "
+            f"GROUP BY {column} HAVING COUNT(*) > 1 ORDER BY {column} LIMIT ?",
+            (MAX_REPORTED_DUPLICATES + 1,)
+        ).fetchall()
+        if rows:
+            listed = ", ".join(f"{value!r} ({count} rows)" for value, count in rows[:MAX_REPORTED_DUPLICATES])
+            more = ", ..." if len(rows) > MAX_REPORTED_DUPLICATES else ""
+            problems.append(f"{table}.{column}: {listed}{more}")
+    if problems:
+        raise DuplicateKeyError(
+            "Cannot create the unique natural-key indexes of migration 3; delete or merge the rows "
+            "sharing these ids and start again: " + "; ".join(problems)
+        )
+
+# Version 4: daily bug-fix rollup. A bug counts as fixed on DATE(FixedDate)
+# while its Status is 'Closed'; bugs without a work item are recorded under
+# ProjectId 0.
+ROLLUP_DDL = """
+CREATE TABLE IF NOT EXISTS BugDailyFixes (
+    ProjectId INTEGER NOT NULL,
+    Day TEXT NOT NULL,
+    FixedCount INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (ProjectId, Day)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS IX_BugDailyFixes_Day ON BugDailyFixes(Day, FixedCount);
+
+CREATE TRIGGER IF NOT EXISTS TR_Bugs_DailyFixes_Insert
+AFTER INSERT ON Bugs
+WHEN NEW.Status = 'Closed' AND DATE(NEW.FixedDate) IS NOT NULL
+BEGIN
+    INSERT INTO BugDailyFixes (ProjectId, Day, FixedCount)
+    VALUES (
+        COALESCE((SELECT ProjectId FROM WorkItems WHERE WorkItemId = NEW.WorkItemId), 0),
+        DATE(NEW.FixedDate),
+        1
+    )
+    ON CONFLICT (ProjectId, Day) DO UPDATE SET FixedCount = FixedCount + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_Bugs_DailyFixes_Update
+AFTER UPDATE OF Status, FixedDate, WorkItemId ON Bugs
+BEGIN
+    UPDATE BugDailyFixes SET FixedCount = FixedCount - 1
+    WHERE OLD.Status = 'Closed' AND DATE(OLD.FixedDate) IS NOT NULL
+        AND ProjectId = COALESCE((SELECT ProjectId FROM WorkItems WHERE WorkItemId = OLD.WorkItemId), 0)
+        AND Day = DATE(OLD.FixedDate);
+    DELETE FROM BugDailyFixes
+    WHERE ProjectId = COALESCE((SELECT ProjectId FROM WorkItems WHERE WorkItemId = OLD.WorkItemId), 0)
+        AND Day = DATE(OLD.FixedDate)
+        AND FixedCount <= 0;
+    INSERT INTO BugDailyFixes (ProjectId, Day, FixedCount)
+    SELECT
+        COALESCE((SELECT ProjectId FROM WorkItems WHERE WorkItemId = NEW.WorkItemId), 0),
+        DATE(NEW.FixedDate),
+        1
+    WHERE NEW.Status = 'Closed' AND DATE(NEW.FixedDate) IS NOT NULL
+    ON CONFLICT (ProjectId, Day) DO UPDATE SET FixedCount = FixedCount + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_Bugs_DailyFixes_Delete
+AFTER DELETE ON Bugs
+WHEN OLD.Status = 'Closed' AND DATE(OLD.FixedDate) IS NOT NULL
+BEGIN
+    UPDATE BugDailyFixes SET FixedCount = FixedCount - 1
+    WHERE ProjectId = COALESCE((SELECT ProjectId FROM WorkItems WHERE WorkItemId = OLD.WorkItemId), 0)
+        AND Day = DATE(OLD.FixedDate);
+    DELETE FROM BugDailyFixes
+    WHERE ProjectId = COALESCE((SELECT ProjectId FROM WorkItems WHERE WorkItemId = OLD.WorkItemId), 0)
+        AND Day = DATE(OLD.FixedDate)
+        AND FixedCount <= 0;
+END;
+"""
+
+# Rollup recomputed from scratch out of the raw Bugs rows
+EXPECTED_ROLLUP_SQL = """
+    SELECT
+        COALESCE(w.ProjectId, 0) AS ProjectId,
+        DATE(b.FixedDate) AS Day,
+        COUNT(*) AS FixedCount
+    FROM Bugs b
+    LEFT JOIN WorkItems w ON b.WorkItemId = w.WorkItemId
+    WHERE b.Status = 'Closed' AND DATE(b.FixedDate) IS NOT NULL
+    GROUP BY COALESCE(w.ProjectId, 0), DATE(b.FixedDate)
+"""
+
+ROLLUP_BACKFILL_SQL = f"""
+DELETE FROM BugDailyFixes;
+INSERT INTO BugDailyFixes (ProjectId, Day, FixedCount) {EXPECTED_ROLLUP_SQL};
+"""
+
+# Version 5: full-text index, one row per bug (rowid = BugId). Title and
+# Tags come from the bug's work item, so triggers on both tables keep the
+# index current. The porter stemmer lets "timeouts" match "timeout".
+SEARCH_DDL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS BugSearch USING fts5(
+    Title,
+    Notes,
+    Tags,
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS TR_Bugs_Search_Insert
+AFTER INSERT ON Bugs
+BEGIN
+    INSERT INTO BugSearch (rowid, Title, Notes, Tags)
+    VALUES (
+        NEW.BugId,
+        (SELECT Title FROM WorkItems WHERE WorkItemId = NEW.WorkItemId),
+        NEW.Notes,
+        (SELECT Tags FROM WorkItems WHERE WorkItemId = NEW.WorkItemId)
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_Bugs_Search_Update
+AFTER UPDATE OF Notes, WorkItemId ON Bugs
+BEGIN
+    DELETE FROM BugSearch WHERE rowid = OLD.BugId;
+    INSERT INTO BugSearch (rowid, Title, Notes, Tags)
+    VALUES (
+        NEW.BugId,
+        (SELECT Title FROM WorkItems WHERE WorkItemId = NEW.WorkItemId),
+        NEW.Notes,
+        (SELECT Tags FROM WorkItems WHERE WorkItemId = NEW.WorkItemId)
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_Bugs_Search_Delete
+AFTER DELETE ON Bugs
+BEGIN
+    DELETE FROM BugSearch WHERE rowid = OLD.BugId;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_WorkItems_Search_Insert
+AFTER INSERT ON WorkItems
+BEGIN
+    UPDATE BugSearch SET Title = NEW.Title, Tags = NEW.Tags
+    WHERE rowid IN (SELECT BugId FROM Bugs WHERE WorkItemId = NEW.WorkItemId);
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_WorkItems_Search_Update
+AFTER UPDATE OF Title, Tags ON WorkItems
+BEGIN
+    UPDATE BugSearch SET Title = NEW.Title, Tags = NEW.Tags
+    WHERE rowid IN (SELECT BugId FROM Bugs WHERE WorkItemId = NEW.WorkItemId);
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_WorkItems_Search_Delete
+AFTER DELETE ON WorkItems
+BEGIN
+    UPDATE BugSearch SET Title = NULL, Tags = NULL
+    WHERE rowid IN (SELECT BugId FROM Bugs WHERE WorkItemId = OLD.WorkItemId);
+END;
+"""
+
+SEARCH_BACKFILL_SQL = """
+DELETE FROM BugSearch;
+INSERT INTO BugSearch (rowid, Title, Notes, Tags)
+SELECT b.BugId, w.Title, b.Notes, w.Tags
+FROM Bugs b
+LEFT JOIN WorkItems w ON b.WorkItemId = w.WorkItemId;
+INSERT INTO BugSearch (BugSearch) VALUES ('optimize');
+"""
+
+# Version 6: last ChangedDate applied per project and entity type
+WATERMARK_DDL = """
+CREATE TABLE IF NOT EXISTS SyncWatermarks (
+    AzureProjectId TEXT NOT NULL,
+    EntityType TEXT NOT NULL,
+    Watermark DATETIME NOT NULL,
+    UpdatedAt DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (AzureProjectId, EntityType)
+) WITHOUT ROWID;
+"""
+
+# Version 7: time-to-fix sketches. Durations are counted in fixed
+# log-spaced buckets (each 4% wider than the one before, from one minute up
+# to ten years), so sketches of any set of projects and days merge by
+# adding counts. Samples are keyed by the fix day; 'fix' measures
+# WorkItems.CreatedDate -> FixedDate, 'verify' FixedDate -> VerifiedDate.
+SKETCH_GROWTH = 1.04
+SKETCH_BOUNDS_DDL = f"""
+CREATE TABLE IF NOT EXISTS CycleTimeBounds (
+    Bucket INTEGER PRIMARY KEY,
+    LowerHours REAL NOT NULL,
+    UpperHours REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS IX_CycleTimeBounds_Upper ON CycleTimeBounds(UpperHours, Bucket);
+
+INSERT OR IGNORE INTO CycleTimeBounds (Bucket, LowerHours, UpperHours)
+WITH RECURSIVE bounds(Bucket, LowerHours, UpperHours) AS (
+    SELECT 0, 0.0, 1.0 / 60
+    UNION ALL
+    SELECT Bucket + 1, UpperHours, UpperHours * {SKETCH_GROWTH} FROM bounds WHERE UpperHours < 87660
+)
+SELECT Bucket, LowerHours, UpperHours FROM bounds;
+"""
+
+
+def _sketch_bucket(hours: str) -> str:
+    """SQL expression for the sketch bucket of a duration in hours (negative -> 0, overflow -> last)"""
+    return f"""COALESCE(
+            (SELECT Bucket FROM CycleTimeBounds WHERE UpperHours >= {hours} ORDER BY UpperHours LIMIT 1),
+            (SELECT MAX(Bucket) FROM CycleTimeBounds)
+        )"""
+
+
+def _sketch_samples(bug: str, source: str) -> str:
+    """
+    (ProjectId, Day, Severity, Metric, Bucket) samples of closed bugs
+    
+    ``bug`` is the Bugs row alias (b, NEW or OLD) and ``source`` the FROM
+    and WHERE clause joining it to its work item ``w``.
+    """
+    return f"""
+        SELECT w.ProjectId AS ProjectId, DATE({bug}.FixedDate) AS Day,
+            COALESCE({bug}.Severity, 'Unspecified') AS Severity, 'fix' AS Metric,
+            {_sketch_bucket(f"(julianday({bug}.FixedDate) - julianday(w.CreatedDate)) * 24")} AS Bucket
+        {source}
+            AND {bug}.Status = 'Closed' AND DATE({bug}.FixedDate) IS NOT NULL AND julianday(w.CreatedDate) IS NOT NULL
+        UNION ALL
+        SELECT w.ProjectId, DATE({bug}.FixedDate), COALESCE({bug}.Severity, 'Unspecified'), 'verify',
+            {_sketch_bucket(f"(julianday({bug}.VerifiedDate) - julianday({bug}.FixedDate)) * 24")}
+        {source}
+            AND {bug}.Status = 'Closed' AND DATE({bug}.FixedDate) IS NOT NULL AND julianday({bug}.VerifiedDate) IS NOT NULL"""
+
+
+_NEW_SAMPLES = _sketch_samples("NEW", "FROM WorkItems w WHERE w.WorkItemId = NEW.WorkItemId")
+_OLD_SAMPLES = _sketch_samples("OLD", "FROM WorkItems w WHERE w.WorkItemId = OLD.WorkItemId")
+
+SKETCH_DDL = SKETCH_BOUNDS_DDL + f"""
+CREATE TABLE IF NOT EXISTS BugCycleTimeSketches (
+    ProjectId INTEGER NOT NULL,
+    Metric TEXT NOT NULL,
+    Day TEXT NOT NULL,
+    Severity TEXT NOT NULL,
+    Bucket INTEGER NOT NULL,
+    Count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (ProjectId, Metric, Day, Severity, Bucket)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS IX_BugCycleTimeSketches_Day
+    ON BugCycleTimeSketches(Metric, Day, ProjectId, Severity, Bucket, Count);
+
+CREATE TRIGGER IF NOT EXISTS TR_Bugs_CycleTime_Insert
+AFTER INSERT ON Bugs
+WHEN NEW.Status = 'Closed'
+BEGIN
+    INSERT INTO BugCycleTimeSketches (ProjectId, Day, Severity, Metric, Bucket, Count)
+    SELECT *, 1 FROM ({_NEW_SAMPLES}
+    ) WHERE true
+    ON CONFLICT (ProjectId, Metric, Day, Severity, Bucket) DO UPDATE SET Count = Count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_Bugs_CycleTime_Update
+AFTER UPDATE OF Status, Severity, FixedDate, VerifiedDate, WorkItemId ON Bugs
+WHEN OLD.Status = 'Closed' OR NEW.Status = 'Closed'
+BEGIN
+    UPDATE BugCycleTimeSketches SET Count = Count - 1
+    WHERE (ProjectId, Day, Severity, Metric, Bucket) IN ({_OLD_SAMPLES}
+    );
+    DELETE FROM BugCycleTimeSketches
+    WHERE Count <= 0 AND (ProjectId, Day, Severity, Metric, Bucket) IN ({_OLD_SAMPLES}
+    );
+    INSERT INTO BugCycleTimeSketches (ProjectId, Day, Severity, Metric, Bucket, Count)
+    SELECT *, 1 FROM ({_NEW_SAMPLES}
+    ) WHERE true
+    ON CONFLICT (ProjectId, Metric, Day, Severity, Bucket) DO UPDATE SET Count = Count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_Bugs_CycleTime_Delete
+AFTER DELETE ON Bugs
+WHEN OLD.Status = 'Closed'
+BEGIN
+    UPDATE BugCycleTimeSketches SET Count = Count - 1
+    WHERE (ProjectId, Day, Severity, Metric, Bucket) IN ({_OLD_SAMPLES}
+    );
+    DELETE FROM BugCycleTimeSketches
+    WHERE Count <= 0 AND (ProjectId, Day, Severity, Metric, Bucket) IN ({_OLD_SAMPLES}
+    );
+END;
+"""
+
+# Sketches recomputed from scratch out of the raw Bugs rows
+EXPECTED_SKETCH_SQL = f"""
+    SELECT ProjectId, Metric, Day, Severity, Bucket, COUNT(*) AS Count
+    FROM ({_sketch_samples("b", "FROM Bugs b JOIN WorkItems w ON w.WorkItemId = b.WorkItemId WHERE b.Status = 'Closed'")}
+    )
+    GROUP BY ProjectId, Metric, Day, Severity, Bucket
+"""
+
+SKETCH_BACKFILL_SQL = f"""
+DELETE FROM BugCycleTimeSketches;
+INSERT INTO BugCycleTimeSketches (ProjectId, Metric, Day, Severity, Bucket, Count) {EXPECTED_SKETCH_SQL};
+"""
+
+# Version 8: pipeline run history. Pipelines only holds the latest run, so
+# every run reported through it is appended to PipelineRuns, and
+# PipelineDailyRuns rolls runs up per (project, day, pipeline, status,
+# duration bucket). Durations use the CycleTimeBounds buckets (-1 when the
+# run has no duration), so percentiles over any window merge like the
+# time-to-fix sketches.
+_RUN_BUCKET = {
+    row: f"CASE WHEN {row}.DurationSeconds IS NULL THEN -1 ELSE {_sketch_bucket(f'{row}.DurationSeconds / 3600.0')} END"
+    for row in ("NEW", "OLD", "r")
+}
+
+
+def _record_pipeline_run(row: str) -> str:
+    return f"""
+    INSERT INTO PipelineRuns (PipelineId, RunId, ProjectId, Status, RunDate, DurationSeconds)
+    VALUES ({row}.PipelineId, {row}.LastRunId, {row}.ProjectId, COALESCE({row}.LastRunStatus, 'Unknown'),
+        {row}.LastRunDate, {row}.DurationSeconds)
+    ON CONFLICT (PipelineId, RunId) DO UPDATE SET
+        ProjectId = excluded.ProjectId,
+        Status = excluded.Status,
+        RunDate = excluded.RunDate,
+        DurationSeconds = excluded.DurationSeconds;"""
+
+
+def _add_pipeline_run(row: str) -> str:
+    return f"""
+    INSERT INTO PipelineDailyRuns (ProjectId, Day, PipelineId, Status, Bucket, Runs, TotalSeconds)
+    SELECT {row}.ProjectId, DATE({row}.RunDate), {row}.PipelineId, {row}.Status, {_RUN_BUCKET[row]},
+        1, COALESCE({row}.DurationSeconds, 0)
+    WHERE DATE({row}.RunDate) IS NOT NULL
+    ON CONFLICT (ProjectId, Day, PipelineId, Status, Bucket) DO UPDATE SET
+        Runs = Runs + 1,
+        TotalSeconds = TotalSeconds + excluded.TotalSeconds;"""
+
+
+_REMOVE_PIPELINE_RUN = f"""
+    UPDATE PipelineDailyRuns SET Runs = Runs - 1, TotalSeconds = TotalSeconds - COALESCE(OLD.DurationSeconds, 0)
+    WHERE ProjectId = OLD.ProjectId AND Day = DATE(OLD.RunDate) AND PipelineId = OLD.PipelineId
+        AND Status = OLD.Status AND Bucket = {_RUN_BUCKET["OLD"]};
+    DELETE FROM PipelineDailyRuns
+    WHERE ProjectId = OLD.ProjectId AND Day = DATE(OLD.RunDate) AND PipelineId = OLD.PipelineId
+        AND Status = OLD.Status AND Bucket = {_RUN_BUCKET["OLD"]} AND Runs <= 0;"""
+
+PIPELINE_RUNS_DDL = f"""
+CREATE TABLE IF NOT EXISTS PipelineRuns (
+    PipelineId INTEGER NOT NULL,
+    RunId INTEGER NOT NULL,
+    ProjectId INTEGER NOT NULL,
+    Status TEXT NOT NULL DEFAULT 'Unknown',
+    RunDate DATETIME NOT NULL,
+    DurationSeconds INTEGER,
+    PRIMARY KEY (PipelineId, RunId)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS IX_PipelineRuns_Project_RunDate ON PipelineRuns(ProjectId, RunDate);
+
+CREATE TABLE IF NOT EXISTS PipelineDailyRuns (
+    ProjectId INTEGER NOT NULL,
+    Day TEXT NOT NULL,
+    PipelineId INTEGER NOT NULL,
+    Status TEXT NOT NULL,
+    Bucket INTEGER NOT NULL,
+    Runs INTEGER NOT NULL DEFAULT 0,
+    TotalSeconds INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (ProjectId, Day, PipelineId, Status, Bucket)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS IX_PipelineDailyRuns_Day
+    ON PipelineDailyRuns(Day, ProjectId, PipelineId, Status, Bucket, Runs, TotalSeconds);
+
+CREATE TRIGGER IF NOT EXISTS TR_Pipelines_Runs_Insert
+AFTER INSERT ON Pipelines
+WHEN NEW.LastRunId IS NOT NULL AND NEW.LastRunDate IS NOT NULL
+BEGIN{_record_pipeline_run("NEW")}
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_Pipelines_Runs_Update
+AFTER UPDATE OF ProjectId, LastRunId, LastRunStatus, LastRunDate, DurationSeconds ON Pipelines
+WHEN NEW.LastRunId IS NOT NULL AND NEW.LastRunDate IS NOT NULL
+BEGIN{_record_pipeline_run("NEW")}
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_PipelineRuns_Daily_Insert
+AFTER INSERT ON PipelineRuns
+BEGIN{_add_pipeline_run("NEW")}
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_PipelineRuns_Daily_Update
+AFTER UPDATE OF ProjectId, Status, RunDate, DurationSeconds ON PipelineRuns
+BEGIN{_REMOVE_PIPELINE_RUN}{_add_pipeline_run("NEW")}
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_PipelineRuns_Daily_Delete
+AFTER DELETE ON PipelineRuns
+BEGIN{_REMOVE_PIPELINE_RUN}
+END;
+"""
+
+# Daily pipeline rollup recomputed from scratch out of PipelineRuns
+EXPECTED_PIPELINE_ROLLUP_SQL = f"""
+    SELECT r.ProjectId, DATE(r.RunDate) AS Day, r.PipelineId, r.Status, {_RUN_BUCKET["r"]} AS Bucket,
+        COUNT(*) AS Runs, COALESCE(SUM(r.DurationSeconds), 0) AS TotalSeconds
+    FROM PipelineRuns r
+    WHERE DATE(r.RunDate) IS NOT NULL
+    GROUP BY r.ProjectId, DATE(r.RunDate), r.PipelineId, r.Status, Bucket
+"""
+
+PIPELINE_RUNS_BACKFILL_SQL = f"""
+INSERT OR IGNORE INTO PipelineRuns (PipelineId, RunId, ProjectId, Status, RunDate, DurationSeconds)
+SELECT PipelineId, LastRunId, ProjectId, COALESCE(LastRunStatus, 'Unknown'), LastRunDate, DurationSeconds
+FROM Pipelines
+WHERE LastRunId IS NOT NULL AND LastRunDate IS NOT NULL;
+DELETE FROM PipelineDailyRuns;
+INSERT INTO PipelineDailyRuns (ProjectId, Day, PipelineId, Status, Bucket, Runs, TotalSeconds) {EXPECTED_PIPELINE_ROLLUP_SQL};
+"""
+
+# Version 9: commit analytics. Activity reads date ranges (optionally per
+# project) grouped by author or branch; fix-commit lookups join bugs to
+# commits on the work item.
+COMMIT_INDEXES_DDL = """
+CREATE INDEX IF NOT EXISTS IX_Commits_CommitDate ON Commits(CommitDate, ProjectId, Author, Branch);
+CREATE INDEX IF NOT EXISTS IX_Commits_ProjectId_CommitDate ON Commits(ProjectId, CommitDate, Author, Branch);
+CREATE INDEX IF NOT EXISTS IX_Commits_AssociatedWorkItemId ON Commits(AssociatedWorkItemId, CommitDate);
+"""
+
+
+def split_statements(script: str) -> List[str]:
+    """Split an SQL script into complete statements (trigger bodies stay whole)"""
+    statements = []
+    pending = ""
+    for line in script.splitlines(keepends=True):
+        if not pending and (not line.strip() or line.lstrip().startswith("--")):
+            continue
+        pending += line
+        if sqlite3.complete_statement(pending):
+            statements.append(pending.strip())
+            pending = ""
+    if pending.strip():
+        raise ValueError(f"Incomplete SQL statement: {pending.strip()[:80]}")
+    return statements
+
+
+class Migration:
+    """
+    One schema version step
+    
+    ``online`` steps only build indexes: each statement commits on its own,
+    so the write lock is held for one index build at a time instead of the
+    whole step. Readers are never blocked either way (WAL); an interrupted
+    online step simply rebuilds the remaining indexes on the next run.
+    ``check`` runs before the step and raises if the data cannot take it.
+    """
+    
+    def __init__(
+        self,
+        version: int,
+        description: str,
+        script,
+        online: bool = False,
+        check: Optional[Callable[[sqlite3.Connection], None]] = None
+    ):
+        self.version = version
+        self.description = description
+        self.script = script  # SQL text, or a Path read when the step runs
+        self.online = online
+        self.check = check
+    
+    def statements(self) -> List[str]:
+        script = self.script.read_text(encoding="utf-8") if isinstance(self.script, Path) else self.script
+        return split_statements(script)
+
+
+# Ordered; never edit a released step, append a new one instead
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Baseline tables and indexes", SCHEMA_PATH),
+    Migration(2, "Covering indexes for bug analytics", COVERING_INDEXES_DDL, online=True),
+    Migration(3, "Natural keys for bulk upsert ingestion", UPSERT_KEYS_DDL, online=True, check=check_upsert_keys),
+    Migration(4, "BugDailyFixes rollup", ROLLUP_DDL + ROLLUP_BACKFILL_SQL),
+    Migration(5, "BugSearch full-text index", SEARCH_DDL + SEARCH_BACKFILL_SQL),
+    Migration(6, "SyncWatermarks for incremental sync", WATERMARK_DDL),
+    Migration(7, "BugCycleTimeSketches time-to-fix sketches", SKETCH_DDL + SKETCH_BACKFILL_SQL),
+    Migration(8, "PipelineRuns history and PipelineDailyRuns rollup", PIPELINE_RUNS_DDL + PIPELINE_RUNS_BACKFILL_SQL),
+    Migration(9, "Commit indexes for activity and fix-commit analytics", COMMIT_INDEXES_DDL, online=True),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def get_version(conn: sqlite3.Connection) -> int:
+    """Schema version recorded in the database header"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _has_tables(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' LIMIT 1"
+    ).fetchone() is not None
+
+
+def _run(conn: sqlite3.Connection, statements: List[str], version: Optional[int] = None) -> bool:
+    """
+    Run statements in one write transaction, optionally recording ``version``
+    
+    Returns:
+        False when another process already moved the schema to ``version``
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if version is not None and get_version(conn) >= version:
+            conn.rollback()
+            return False
+        for statement in statements:
+            conn.execute(statement)
+        if version is not None:
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return True
+
+
+def apply_migration(conn: sqlite3.Connection, migration: Migration) -> bool:
+    """
+    Apply one step and record its version
+    
+    Returns:
+        True if this call applied the step
+    """
+    if migration.check is not None and get_version(conn) < migration.version:
+        migration.check(conn)
+    statements = migration.statements()
+    if migration.online:
+        # Commit each index build separately; the last one records the version
+        for statement in statements[:-1]:
+            if get_version(conn) >= migration.version:
+                return False
+            _run(conn, [statement])
+        statements = statements[-1:]
+    return _run(conn, statements, migration.version)
+
+
+def migrate(conn: sqlite3.Connection, seed: bool = False, target: Optional[int] = None) -> List[int]:
+    """
+    Bring a database up to ``target`` (default: the latest version)
+    
+    Args:
+        conn: Connection to migrate (must not be inside a transaction)
+        seed: Load seed_sqlite.sql if the database had no tables before
+        target: Stop after this version
+    
+    Returns:
+        Versions applied by this call
+    """
+    target = LATEST_VERSION if target is None else target
+    current = get_version(conn)
+    if current > LATEST_VERSION:
+        logger.warning(
+            "Database schema version %s is newer than this release (%s); skipping migrations",
+            current, LATEST_VERSION
+        )
+        return []
+    
+    fresh = current == 0 and not _has_tables(conn)
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.version <= current or migration.version > target:
+            continue
+        started = time.perf_counter()
+        if apply_migration(conn, migration):
+            applied.append(migration.version)
+            logger.info(
+                "Applied migration %s (%s) in %.3fs",
+                migration.version, migration.description, time.perf_counter() - started
+            )
+    
+    if fresh and seed:
+        # Triggers created above fill the rollup and search index as rows land
+        _run(conn, split_statements(SEED_PATH.read_text(encoding="utf-8")))
+        logger.info("Loaded sample data from %s", SEED_PATH.name)
+    if applied:
+        conn.execute("PRAGMA optimize")
+    return applied
+
+
+def migration_status(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """Current and latest schema versions with the pending steps"""
+    current = get_version(conn)
+    return {
+        "current_version": current,
+        "latest_version": LATEST_VERSION,
+        "pending": [
+            {"version": migration.version, "description": migration.description}
+            for migration in MIGRATIONS
+            if migration.version > current
+        ]
+    }
@@ -0,0 +1,281 @@
+"""
+Read-only snapshot replicas of the database for analytics reads
+
+With READ_REPLICA_ENABLED the primary database is copied with the SQLite
+online backup API into a new snapshot file every READ_REPLICA_INTERVAL_SECONDS,
+and the analytics services read from the latest snapshot through an
+immutable, memory-mapped connection pool. Writers (ingestion, sync) keep
+the primary file to themselves: snapshot readers take no locks on it, so
+they never see ``database is locked`` and never hold up a checkpoint.
+"""
+import asyncio
+import contextvars
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+from app.config import get_settings
+from app.database import DatabaseManager, ConnectionPool, db_manager
+from app.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+# Snapshot files kept on disk: the current one and its predecessor, which
+# long-running readers (e.g. NDJSON streams) may still have open
+RETAINED_SNAPSHOTS = 2
+
+
+class Snapshot:
+    """One published snapshot file and the read-only pool serving it"""
+    
+    def __init__(self, generation: int, path: Path, version: int, pool: ConnectionPool):
+        self.generation = generation
+        self.path = path
+        self.version = version
+        self.pool = pool
+        self.published_at = time.time()
+
+
+class SnapshotReplica(DatabaseManager):
+    """
+    Read-only database manager backed by periodically published snapshots
+    
+    Offers the query API of DatabaseManager (execute_query, iter_query,
+    read_snapshot, run_async, data_version), so read services use it in
+    place of the primary manager. Until the first snapshot is published
+    every call falls through to the primary database. Writes through this
+    manager fail: snapshot files are opened immutable.
+    """
+    
+    def __init__(self, primary: DatabaseManager, directory: str):
+        # The primary owns migrations, the worker threads and the writable pool
+        self.primary = primary
+        self.settings = primary.settings
+        self.db_path = primary.db_path
+        self.directory = Path(directory)
+        self._executor = primary._executor
+        self._snapshot_conn: contextvars.ContextVar[Optional[sqlite3.Connection]] = contextvars.ContextVar(
+            "replica_snapshot_conn", default=None
+        )
+        self._current: Optional[Snapshot] = None
+        self._lock = threading.Lock()
+        # One publish at a time (scheduled and manual ones may overlap)
+        self._publish_lock = threading.Lock()
+        # Continue numbering after snapshots left by an earlier process, so
+        # new files never sort before stale ones
+        self._generation = max(self._snapshot_files(), default=0)
+        self._publishes = 0
+        self._skipped = 0
+        self._last_publish_seconds = 0.0
+    
+    def migrate(self) -> List[int]:
+        """Snapshots are copies of the already migrated primary"""
+        return []
+    
+    def publish(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Copy the primary database into a new snapshot and route reads to it
+        
+        The backup runs on a pooled primary connection in a single step, i.e.
+        inside one read transaction, so the snapshot is consistent. In WAL
+        mode that read does not block writers. The copy is switched to
+        rollback journaling before it is opened immutable, then swapped in;
+        the previous snapshot's pool is closed as its connections come back.
+        
+        Args:
+            force: Publish even if the primary has not changed since the last snapshot
+        
+        Returns:
+            Dictionary describing the current snapshot and whether this call published it
+        """
+        with self._publish_lock:
+            # Read before copying: a write landing during the backup bumps the
+            # version again, so the next publish picks it up
+            version = self.primary.data_version()
+            current = self._current
+            if current is not None and current.version == version and not force:
+                self._skipped += 1
+                return {**self.status(), "published": False}
+            
+            started = time.perf_counter()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            generation = self._generation + 1
+            path = self.directory / f"snapshot-{generation:06d}.db"
+            partial = path.with_suffix(".partial")
+            partial.unlink(missing_ok=True)
+            
+            target = sqlite3.connect(partial)
+            try:
+                with self.primary.get_connection() as source:
+                    source.backup(target)
+                target.execute("PRAGMA journal_mode=DELETE")
+            finally:
+                target.close()
+            partial.replace(path)
+            
+            pool = ConnectionPool(
+                str(path),
+                size=self.settings.db_pool_size,
+                timeout=self.settings.db_pool_timeout,
+                cache_size_kib=self.settings.db_cache_size_kib,
+                mmap_size=self.settings.db_mmap_size,
+                read_only=True
+            )
+            with self._lock:
+                previous, self._current = self._current, Snapshot(generation, path, version, pool)
+                self._generation = generation
+                self._publishes += 1
+                self._last_publish_seconds = time.perf_counter() - started
+            if previous is not None:
+                previous.pool.close()
+            self._remove_old_snapshots()
+            
+            logger.info(
+                "Published read snapshot %s (%.1f MiB) in %.3fs",
+                generation, path.stat().st_size / 1048576, self._last_publish_seconds
+            )
+            return {**self.status(), "published": True}
+    
+    def _snapshot_files(self) -> Dict[int, Path]:
+        """Snapshot files in the directory by generation"""
+        files = {}
+        for path in self.directory.glob("snapshot-*.db"):
+            number = path.stem[len("snapshot-"):]
+            if number.isdigit():
+                files[int(number)] = path
+        return files
+    
+    def _remove_old_snapshots(self):
+        """
+        Delete snapshot files older than the last RETAINED_SNAPSHOTS generations
+        
+        Goes by the current generation, so leftovers of an earlier process
+        are removed too. Open files stay readable on POSIX.
+        """
+        oldest_kept = self._generation - RETAINED_SNAPSHOTS + 1
+        for generation, stale in sorted(self._snapshot_files().items()):
+            if generation >= oldest_kept:
+                continue
+            try:
+                stale.unlink()
+            except OSError as e:
+                logger.warning("Could not remove old snapshot %s: %s", stale, e)
+    
+    @contextmanager
+    def get_connection(self):
+        """
+        Borrow a connection to the latest snapshot (the primary before the first publish)
+        
+        The connection goes back to the pool it came from, even if a newer
+        snapshot was published meanwhile.
+        """
+        snapshot_conn = self._snapshot_conn.get()
+        if snapshot_conn is not None:
+            yield snapshot_conn
+            return
+        
+        while True:
+            current = self._current
+            if current is None:
+                with self.primary.get_connection() as conn:
+                    yield conn
+                return
+            try:
+                conn = current.pool.acquire()
+                break
+            except sqlite3.ProgrammingError:
+                # Retired by a publish between reading _current and acquiring
+                if current is self._current:
+                    raise
+        
+        discard = False
+        try:
+            yield conn
+        except sqlite3.Error as e:
+            discard = isinstance(e, (sqlite3.InterfaceError, sqlite3.ProgrammingError))
+            logger.error("Snapshot connection error: %s", e)
+            raise
+        finally:
+            current.pool.release(conn, discard=discard)
+    
+    def data_version(self) -> int:
+        """
+        Primary data version the latest snapshot was copied at
+        
+        Responses computed from a snapshot are thereby cached and tagged
+        exactly like responses computed from the primary at that version.
+        """
+        current = self._current
+        if current is None:
+            return self.primary.data_version()
+        return current.version
+    
+    def status(self) -> Dict[str, Any]:
+        """Current snapshot generation, age and publish statistics"""
+        current = self._current
+        return {
+            "enabled": True,
+            "generation": current.generation if current else None,
+            "path": str(current.path) if current else None,
+            "age_seconds": round(time.time() - current.published_at, 3) if current else None,
+            "publishes": self._publishes,
+            "skipped": self._skipped,
+            "last_publish_seconds": round(self._last_publish_seconds, 3)
+        }
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """Pool statistics of the current snapshot (the primary's before the first publish)"""
+        current = self._current
+        return current.pool.stats() if current else self.primary.pool_stats()
+    
+    def close(self):
+        """Close the snapshot pool; the shared worker threads belong to the primary"""
+        with self._lock:
+            current, self._current = self._current, None
+        if current is not None:
+            current.pool.close()
+
+
+async def publish_periodically(replica: SnapshotReplica, interval_seconds: float):
+    """Publish a snapshot every ``interval_seconds`` until cancelled"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await replica.run_async(replica.publish)
+        except Exception as e:
+            logger.error("Snapshot publish failed: %s", e, exc_info=True)
+
+
+def create_read_db() -> DatabaseManager:
+    """The database manager analytics reads go through: a snapshot replica if enabled"""
+    settings = get_settings()
+    if not settings.read_replica_enabled:
+        return db_manager
+    directory = settings.read_replica_dir or f"{settings.database_path}-snapshots"
+    return SnapshotReplica(db_manager, directory)
+
+
+# Singleton instance
+read_db = create_read_db()
+
+
+def _replica_metrics():
+    """Expose snapshot age and publish counts as Prometheus metrics"""
+    if not isinstance(read_db, SnapshotReplica):
+        return []
+    status = read_db.status()
+    return [
+        ("devops_mcp_read_snapshot_generation", "gauge", "Generation of the snapshot serving reads",
+         [({}, status["generation"] or 0)]),
+        ("devops_mcp_read_snapshot_age_seconds", "gauge", "Seconds since the serving snapshot was published",
+         [({}, status["age_seconds"] or 0)]),
+        ("devops_mcp_read_snapshot_publishes_total", "counter", "Snapshots published",
+         [({}, status["publishes"])]),
+    ]
+
+
+metrics.register_collector(_replica_metrics)
@@ -2,14 +2,22 @@
 Bug-related API endpoints
 """
 import logging
-from fastapi import APIRouter, HTTPException, status
+from datetime import date, datetime, timezone
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
 from app.schemas.bug_schemas import (
     GetBugFixTrendsRequest, GetBugFixTrendsResponse,
+    GetBugTrendsRequest, GetBugTrendsResponse,
     GetActiveBugsRequest, GetActiveBugsResponse,
     GetBugsByStatusRequest, GetBugsByStatusResponse,
-    GetBugStatisticsRequest, GetBugStatisticsResponse
+    GetBugStatisticsRequest, GetBugStatisticsResponse,
+    GetTimeToFixRequest, GetTimeToFixResponse,
+    SearchBugsRequest, SearchBugsResponse,
+    BatchRequest, BatchResponse
 )
 from app.services.bug_service import bug_service
+from app.routers.responses import ModelJSONResponse, conditional_response
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +26,21 @@ router = APIRouter(
     tags=["bugs"]
 )
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# OpenAPI description of the opt-in streaming representation
+NDJSON_RESPONSE = {
+    200: {
+        "content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string", "description": "One BugItem JSON object per line"}}},
+        "description": "Send `Accept: application/x-ndjson` to stream every matching bug, one per line"
+    }
+}
+
+
+def wants_ndjson(accept: Optional[str]) -> bool:
+    """Check whether the client asked for a streamed NDJSON response"""
+    return bool(accept) and NDJSON_MEDIA_TYPE in accept
+
 
 @router.post(
     "/get_bug_fix_trends",
@@ -26,12 +49,17 @@ router = APIRouter(
     summary="Get Bug Fix Trends",
     description="Retrieve statistics and trends for bug fixes over a specified time period"
 )
-async def get_bug_fix_trends(request: GetBugFixTrendsRequest) -> GetBugFixTrendsResponse:
+async def get_bug_fix_trends(
+    request: GetBugFixTrendsRequest,
+    if_none_match: Optional[str] = Header(default=None)
+) -> GetBugFixTrendsResponse:
     """
     Analyze bug fix trends over the last N days.
     
     - **days_back**: Number of days to look back (default: 10, max: 365)
     - **project_id**: Optional project ID to filter results
+    - **format**: `columnar` returns arrays per key instead of row objects
+    - **compact**: Drop the SQL text and the chart copy of the daily data
     
     Returns:
     - Total fixed bugs count
@@ -39,39 +67,106 @@ async def get_bug_fix_trends(request: GetBugFixTrendsRequest) -> GetBugFixTrends
     - Trend graph data for visualization
     - SQL query used
     - Period start and end dates
+    
+    Responses carry an ETag; send it back in `If-None-Match` to get
+    304 Not Modified while the data is unchanged.
     """
     try:
-        logger.info(f"Getting bug fix trends: days_back={request.days_back}, project_id={request.project_id}")
-        result = bug_service.get_bug_fix_trends(request)
+        logger.debug("Getting bug fix trends: days_back=%s, project_id=%s", request.days_back, request.project_id)
+        # Trends are relative to today, so the date is part of the cache key
+        result = await conditional_response(
+            "get_bug_fix_trends", request, bug_service.get_bug_fix_trends_async,
+            if_none_match, date.today()
+        )
         return result
     except Exception as e:
-        logger.error(f"Error getting bug fix trends: {str(e)}", exc_info=True)
+        logger.error("Error getting bug fix trends: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve bug fix trends: {str(e)}"
         )
 
 
+@router.post(
+    "/get_bug_trends",
+    response_model=GetBugTrendsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Bug Trends",
+    description="Bug fixes per day, week or month over periods of up to ten years, with rolling averages"
+)
+async def get_bug_trends(
+    request: GetBugTrendsRequest,
+    if_none_match: Optional[str] = Header(default=None)
+) -> GetBugTrendsResponse:
+    """
+    Bucket fixed bugs by calendar day, ISO week or month.
+    
+    - **granularity**: `day`, `week` (default) or `month`
+    - **start_date** / **end_date**: Period (default: the last `days_back` days up to today);
+      the start moves back to the beginning of its bucket
+    - **days_back**: Period length when no start_date is given (default: 90)
+    - **rolling_window**: Buckets averaged into `rolling_average` (default: 1)
+    - **compare_previous**: Add `previous_count` per bucket and totals of the
+      same number of buckets just before the period
+    - **project_id** / **project_name**: Optional project filter
+    - **format**: `columnar` returns one array per bucket field
+    
+    Every bucket is returned, empty ones with a count of 0.
+    """
+    try:
+        logger.debug("Getting bug trends: granularity=%s, project_id=%s", request.granularity, request.project_id)
+        # Periods default to ending today, so the date is part of the cache key
+        result = await conditional_response(
+            "get_bug_trends", request, bug_service.get_bug_trends_async,
+            if_none_match, date.today()
+        )
+        return result
+    except Exception as e:
+        logger.error("Error getting bug trends: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve bug trends: {str(e)}"
+        )
+
+
 @router.post(
     "/get_active_bugs",
     response_model=GetActiveBugsResponse,
     status_code=status.HTTP_200_OK,
     summary="Get Active Bugs",
-    description="Retrieve all currently active bugs with optional filters"
+    description="Retrieve currently active bugs with optional filters, one page at a time",
+    responses=NDJSON_RESPONSE
 )
-async def get_active_bugs(request: GetActiveBugsRequest) -> GetActiveBugsResponse:
+async def get_active_bugs(
+    request: GetActiveBugsRequest,
+    accept: Optional[str] = Header(default=None),
+    if_none_match: Optional[str] = Header(default=None)
+) -> GetActiveBugsResponse:
     """
-    Get all active bugs, optionally filtered by project and severity.
+    Get active bugs, optionally filtered by project and severity.
     
     - **project_id**: Filter by specific project
     - **severity**: Filter by severity level (Low, Medium, High, Critical)
+    - **limit**: Page size (default: 100, max: 500)
+    - **cursor**: `next_cursor` from the previous page to continue listing
+    - **format**: `columnar` returns one array per bug field, with status and
+      severity dictionary-encoded as `{dictionary, codes}`
+    - **compact**: Drop the echoed `filters_applied`
+    
+    With `Accept: application/x-ndjson` every matching bug after the cursor
+    is streamed, one JSON object per line, and `limit` is ignored.
     """
     try:
-        logger.info(f"Getting active bugs: project_id={request.project_id}, severity={request.severity}")
-        result = bug_service.get_active_bugs(request)
+        logger.debug("Getting active bugs: project_id=%s, severity=%s", request.project_id, request.severity)
+        if wants_ndjson(accept):
+            chunks = await bug_service.stream_active_bugs_async(request)
+            return StreamingResponse(chunks, media_type=NDJSON_MEDIA_TYPE)
+        result = await conditional_response(
+            "get_active_bugs", request, bug_service.get_active_bugs_async, if_none_match
+        )
         return result
     except Exception as e:
-        logger.error(f"Error getting active bugs: {str(e)}", exc_info=True)
+        logger.error("Error getting active bugs: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve active bugs: {str(e)}"
@@ -83,22 +178,38 @@ async def get_active_bugs(request: GetActiveBugsRequest) -> GetActiveBugsRespons
     response_model=GetBugsByStatusResponse,
     status_code=status.HTTP_200_OK,
     summary="Get Bugs by Status",
-    description="Retrieve bugs filtered by status (Active, Closed, New)"
+    description="Retrieve bugs filtered by status (Active, Closed, New)",
+    responses=NDJSON_RESPONSE
 )
-async def get_bugs_by_status(request: GetBugsByStatusRequest) -> GetBugsByStatusResponse:
+async def get_bugs_by_status(
+    request: GetBugsByStatusRequest,
+    accept: Optional[str] = Header(default=None),
+    if_none_match: Optional[str] = Header(default=None)
+) -> GetBugsByStatusResponse:
     """
     Get bugs filtered by their status.
     
     - **status**: Bug status (Active, Closed, New)
     - **project_id**: Optional project filter
-    - **limit**: Maximum number of results (default: 50)
+    - **limit**: Page size (default: 50, max: 500)
+    - **cursor**: `next_cursor` from the previous page to continue listing
+    - **format**: `columnar` returns one array per bug field, with status and
+      severity dictionary-encoded as `{dictionary, codes}`
+    
+    With `Accept: application/x-ndjson` every matching bug after the cursor
+    is streamed, one JSON object per line, and `limit` is ignored.
     """
     try:
-        logger.info(f"Getting bugs by status: status={request.status}, project_id={request.project_id}")
-        result = bug_service.get_bugs_by_status(request)
+        logger.debug("Getting bugs by status: status=%s, project_id=%s", request.status, request.project_id)
+        if wants_ndjson(accept):
+            chunks = await bug_service.stream_bugs_by_status_async(request)
+            return StreamingResponse(chunks, media_type=NDJSON_MEDIA_TYPE)
+        result = await conditional_response(
+            "get_bugs_by_status", request, bug_service.get_bugs_by_status_async, if_none_match
+        )
         return result
     except Exception as e:
-        logger.error(f"Error getting bugs by status: {str(e)}", exc_info=True)
+        logger.error("Error getting bugs by status: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve bugs by status: {str(e)}"
@@ -112,7 +223,10 @@ async def get_bugs_by_status(request: GetBugsByStatusRequest) -> GetBugsByStatus
     summary="Get Bug Statistics",
     description="Get comprehensive statistics about bugs across all projects"
 )
-async def get_bug_statistics(request: GetBugStatisticsRequest) -> GetBugStatisticsResponse:
+async def get_bug_statistics(
+    request: GetBugStatisticsRequest,
+    if_none_match: Optional[str] = Header(default=None)
+) -> GetBugStatisticsResponse:
     """
     Get comprehensive bug statistics including:
     - Total bugs by status
@@ -120,19 +234,133 @@ async def get_bug_statistics(request: GetBugStatisticsRequest) -> GetBugStatisti
     - Bugs by project
     
     - **project_id**: Optional project filter
+    - **format**: `columnar` returns the per-project breakdown as arrays per key
+    - **compact**: Drop the `by_project` totals (also in the breakdown)
+    
+    Responses carry an ETag; send it back in `If-None-Match` to get
+    304 Not Modified while the data is unchanged.
     """
     try:
-        logger.info(f"Getting bug statistics: project_id={request.project_id}")
-        result = bug_service.get_bug_statistics(request)
+        logger.debug("Getting bug statistics: project_id=%s", request.project_id)
+        result = await conditional_response(
+            "get_bug_statistics", request, bug_service.get_bug_statistics_async, if_none_match
+        )
         return result
     except Exception as e:
-        logger.error(f"Error getting bug statistics: {str(e)}", exc_info=True)
+        logger.error("Error getting bug statistics: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve bug statistics: {str(e)}"
         )
 
 
+@router.post(
+    "/get_time_to_fix",
+    response_model=GetTimeToFixResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Time to Fix",
+    description="Percentiles and histogram of how long bugs took to fix or verify, by severity and project"
+)
+async def get_time_to_fix(
+    request: GetTimeToFixRequest,
+    if_none_match: Optional[str] = Header(default=None)
+) -> GetTimeToFixResponse:
+    """
+    Distribution of bug cycle times for bugs fixed in the last N days.
+    
+    - **metric**: `fix` (work item created -> fixed, i.e. MTTR) or `verify` (fixed -> verified)
+    - **days_back**: Period by fix date (default: 90)
+    - **severity**: Optional severity filter
+    - **project_id** / **project_name**: Optional project filter
+    - **format**: `columnar` returns the breakdowns and histogram as arrays per field
+    
+    Percentiles come from mergeable sketches and are accurate to within
+    `relative_accuracy` of the exact value.
+    """
+    try:
+        logger.debug("Getting time to fix: metric=%s, project_id=%s", request.metric, request.project_id)
+        # The period ends today, so the date is part of the cache key
+        result = await conditional_response(
+            "get_time_to_fix", request, bug_service.get_time_to_fix_async,
+            if_none_match, date.today()
+        )
+        return result
+    except Exception as e:
+        logger.error("Error getting time to fix: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve time to fix: {str(e)}"
+        )
+
+
+@router.post(
+    "/search",
+    response_model=SearchBugsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Search Bugs",
+    description="Full-text search over bug titles, notes and tags, ranked by relevance"
+)
+async def search_bugs(
+    request: SearchBugsRequest,
+    if_none_match: Optional[str] = Header(default=None)
+) -> SearchBugsResponse:
+    """
+    Find bugs by the words in their title, notes or tags.
+    
+    - **query**: Free text, e.g. "checkout timeout" (word forms are matched,
+      the last word also as a prefix)
+    - **match**: `all` (default) requires every word, `any` ranks bugs matching any word
+    - **status**: Optional status filter
+    - **project_id** / **project_name**: Optional project filter
+    - **limit**: Page size (default: 20, max: 100)
+    - **cursor**: `next_cursor` from the previous page to continue
+    - **format**: `columnar` returns one array per hit field
+    - **compact**: Drop the echoed `filters_applied`
+    """
+    try:
+        logger.debug("Searching bugs: query=%s, project_id=%s", request.query, request.project_id)
+        result = await conditional_response(
+            "search_bugs", request, bug_service.search_bugs_async, if_none_match
+        )
+        return result
+    except Exception as e:
+        logger.error("Error searching bugs: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to search bugs: {str(e)}"
+        )
+
+
+@router.post(
+    "/batch",
+    response_model=BatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Run Bug Actions in Batch",
+    description="Run several bug actions in one call against a single consistent database snapshot"
+)
+async def run_batch(request: BatchRequest) -> BatchResponse:
+    """
+    Run up to 20 bug actions in one round trip.
+    
+    - **actions**: List of `{"action": <name>, "params": {...}}` where `params`
+      is the body the action's own endpoint accepts
+    
+    All actions read the same database snapshot over one connection. Each
+    entry reports its own `status_code`; a failing action does not fail the
+    batch.
+    """
+    try:
+        logger.debug("Running batch of %s actions", len(request.actions))
+        results = await bug_service.run_batch_async(request.actions)
+        return ModelJSONResponse(BatchResponse(results=results, generated_at=datetime.now().isoformat()))
+    except Exception as e:
+        logger.error("Error running batch: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to run batch: {str(e)}"
+        )
+
+
 @router.get(
     "/health",
     status_code=status.HTTP_200_OK,
@@ -144,5 +372,5 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "bugs",
-        "timestamp": "2025-11-25T00:00:00Z"
+        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     }
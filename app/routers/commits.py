@@ -0,0 +1,93 @@
+"""
+Commit activity and bug-to-commit analytics endpoints
+"""
+import logging
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException, status
+from app.schemas.commit_schemas import (
+    GetCommitActivityRequest, GetCommitActivityResponse,
+    GetFixCommitsRequest, GetFixCommitsResponse
+)
+from app.services.commit_service import commit_service
+from app.routers.responses import conditional_response
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/commits",
+    tags=["commits"]
+)
+
+
+@router.post(
+    "/get_commit_activity",
+    response_model=GetCommitActivityResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Commit Activity",
+    description="Commit counts per author or branch in day, week or month buckets"
+)
+async def get_commit_activity(
+    request: GetCommitActivityRequest,
+    if_none_match: Optional[str] = Header(default=None)
+) -> GetCommitActivityResponse:
+    """
+    Commit activity over the last N days.
+    
+    - **group_by**: `author` (default) or `branch`
+    - **granularity**: `day`, `week` (default, ISO weeks) or `month`
+    - **days_back**: Period by commit date (default: 90)
+    - **project_id** / **project_name**: Optional project filter
+    - **top**: Number of most active authors or branches (default: 10); the
+      rest is summed into `other_commits`
+    - **format**: `columnar` returns the series as arrays per field
+    """
+    try:
+        logger.debug("Getting commit activity: group_by=%s, project_id=%s", request.group_by, request.project_id)
+        # The period ends today, so the date is part of the cache key
+        result = await conditional_response(
+            "get_commit_activity", request, commit_service.get_commit_activity_async,
+            if_none_match, date.today()
+        )
+        return result
+    except Exception as e:
+        logger.error("Error getting commit activity: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve commit activity: {str(e)}"
+        )
+
+
+@router.post(
+    "/get_fix_commits",
+    response_model=GetFixCommitsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Fix Commits",
+    description="Commits linked to the work items of a set of bugs, answered in one call"
+)
+async def get_fix_commits(
+    request: GetFixCommitsRequest,
+    if_none_match: Optional[str] = Header(default=None)
+) -> GetFixCommitsResponse:
+    """
+    What changes fixed these bugs.
+    
+    - **bug_ids**: BugIds to look up (up to 1000)
+    - **format**: `columnar` returns the bug list as arrays per field
+    
+    Commits are matched through the bug's work item
+    (`Commits.AssociatedWorkItemId`), oldest first. Unknown BugIds are
+    listed in `missing_bug_ids`.
+    """
+    try:
+        logger.debug("Getting fix commits for %s bugs", len(request.bug_ids))
+        result = await conditional_response(
+            "get_fix_commits", request, commit_service.get_fix_commits_async, if_none_match
+        )
+        return result
+    except Exception as e:
+        logger.error("Error getting fix commits: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve fix commits: {str(e)}"
+        )
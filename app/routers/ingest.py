@@ -0,0 +1,51 @@
+"""
+Bulk ingestion endpoints for Azure DevOps sync jobs
+"""
+import logging
+import sqlite3
+from fastapi import APIRouter, HTTPException, status
+from app.schemas.ingest_schemas import IngestRequest, IngestResponse
+from app.services.ingest_service import ingest_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/ingest",
+    tags=["ingest"]
+)
+
+
+@router.post(
+    "/upsert",
+    response_model=IngestResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Bulk Upsert Sync Data",
+    description="Insert or update batches of projects, work items and bugs keyed on their Azure DevOps ids"
+)
+async def bulk_upsert(request: IngestRequest) -> IngestResponse:
+    """
+    Upsert a batch of synchronized Azure DevOps data in one transaction.
+    
+    - **projects**: Keyed on `azure_project_id`
+    - **work_items**: Keyed on `azure_work_item_id`; `azure_project_id` must name a known project
+    - **bugs**: Keyed on `azure_bug_id`; linked to `azure_work_item_id` when given
+    
+    The batch is all-or-nothing. Throughput is recorded in SyncLog.
+    """
+    try:
+        logger.debug(
+            "Bulk upsert: %s projects, %s work items, %s bugs",
+            len(request.projects), len(request.work_items), len(request.bugs)
+        )
+        return await ingest_service.upsert_async(request)
+    except sqlite3.IntegrityError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Batch rejected by database constraints: {str(e)}"
+        )
+    except Exception as e:
+        logger.error("Error in bulk upsert: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to ingest batch: {str(e)}"
+        )
@@ -0,0 +1,55 @@
+"""
+Pipeline run analytics endpoints
+"""
+import logging
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException, status
+from app.schemas.pipeline_schemas import GetPipelineHealthRequest, GetPipelineHealthResponse
+from app.services.pipeline_service import pipeline_service
+from app.routers.responses import conditional_response
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/pipelines",
+    tags=["pipelines"]
+)
+
+
+@router.post(
+    "/get_pipeline_health",
+    response_model=GetPipelineHealthResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Pipeline Health",
+    description="Failure rates, duration percentiles and slowest pipelines per project over a time window"
+)
+async def get_pipeline_health(
+    request: GetPipelineHealthRequest,
+    if_none_match: Optional[str] = Header(default=None)
+) -> GetPipelineHealthResponse:
+    """
+    Build health over the pipeline runs of the last N days.
+    
+    - **days_back**: Period by run date (default: 30)
+    - **project_id** / **project_name**: Optional project filter
+    - **top**: Number of slowest pipelines (by p90 duration) to return (default: 10)
+    - **format**: `columnar` returns the per-project and per-pipeline lists as arrays per field
+    
+    Duration percentiles come from mergeable sketches and are accurate to
+    within `relative_accuracy` of the exact value.
+    """
+    try:
+        logger.debug("Getting pipeline health: days_back=%s, project_id=%s", request.days_back, request.project_id)
+        # The period ends today, so the date is part of the cache key
+        result = await conditional_response(
+            "get_pipeline_health", request, pipeline_service.get_pipeline_health_async,
+            if_none_match, date.today()
+        )
+        return result
+    except Exception as e:
+        logger.error("Error getting pipeline health: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve pipeline health: {str(e)}"
+        )
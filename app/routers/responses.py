@@ -0,0 +1,51 @@
+"""
+Response helpers shared by the analytics routers
+"""
+from typing import Optional, Any, Callable, Awaitable
+from pydantic import BaseModel
+from fastapi import Response, status
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+from app.replica import read_db
+from app.services.response_shape import shape_response
+from app.services.response_cache import response_cache, make_etag, etag_matches
+
+
+class ModelJSONResponse(JSONResponse):
+    """
+    JSON response serialized straight from a Pydantic model by pydantic-core
+    
+    Service results are already valid response models, so returning one of
+    these skips FastAPI's response_model re-validation and jsonable_encoder
+    pass. The route's response_model still documents the body in OpenAPI.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+async def conditional_response(
+    action: str,
+    request: BaseModel,
+    compute: Callable[[BaseModel], Awaitable[Any]],
+    if_none_match: Optional[str],
+    *scope: Any
+) -> Any:
+    """
+    Answer an action with ETag / If-None-Match support
+    
+    The ETag is derived from the database data version and the normalized
+    request, so an unchanged answer is confirmed with 304 Not Modified
+    without running the service at all. Otherwise the (cached) result is
+    returned with the ETag attached, in the format/compact shape the
+    request asked for.
+    """
+    # PRAGMA data_version under the watch lock: keep it off the event loop
+    version = await read_db.run_async(read_db.data_version)
+    etag = make_etag(action, request, version, *scope)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    result = await response_cache.get_or_compute(action, request, compute, *scope, version=version)
+    return ModelJSONResponse(shape_response(result, request), headers=headers)
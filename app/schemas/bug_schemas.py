@@ -1,12 +1,74 @@
 """
 Request and response schemas for bug-related endpoints
 """
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel, Field
+import base64
+import binascii
+from typing import Optional, List, Dict, Any, Literal
+from datetime import datetime, date as Date
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
-class GetBugFixTrendsRequest(BaseModel):
+CURSOR_PREFIX = "bug:"
+SEARCH_CURSOR_PREFIX = "search:"
+
+# Longest period a calendar-bucketed trend request may span (about ten years)
+MAX_TREND_DAYS = 3660
+
+
+def encode_cursor(value: int, prefix: str = CURSOR_PREFIX) -> str:
+    """Encode the position after a page (last BugId, or offset for search) as an opaque cursor"""
+    return base64.urlsafe_b64encode(f"{prefix}{value}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, prefix: str = CURSOR_PREFIX) -> int:
+    """
+    Decode a pagination cursor back to the position to continue after
+    
+    Raises:
+        ValueError: If the cursor was not produced by encode_cursor with ``prefix``
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValueError("Invalid pagination cursor")
+    if not raw.startswith(prefix) or not raw[len(prefix):].isdigit():
+        raise ValueError("Invalid pagination cursor")
+    return int(raw[len(prefix):])
+
+
+class ResponseShapeOptions(BaseModel):
+    """Per-request response shape options shared by the bug analytics requests"""
+    format: Literal["rows", "columnar"] = Field(
+        default="rows",
+        description="'columnar' returns every list as one array per field (keys once), "
+                    "with status and severity dictionary-encoded as {dictionary, codes}"
+    )
+    compact: bool = Field(
+        default=False,
+        description="Drop sections that repeat other data: the SQL text, the chart copy of the "
+                    "daily series, the echoed filters and the per-project totals list"
+    )
+
+
+class PaginatedRequest(BaseModel):
+    """Keyset pagination parameters shared by the bug listing requests"""
+    cursor: Optional[str] = Field(default=None, description="Opaque cursor from a previous page's next_cursor")
+    
+    @field_validator("cursor")
+    @classmethod
+    def validate_cursor(cls, value: Optional[str]) -> Optional[str]:
+        if value is not None:
+            decode_cursor(value)
+        return value
+    
+    @property
+    def after_bug_id(self) -> int:
+        """BugId the requested page starts after (0 for the first page)"""
+        return decode_cursor(self.cursor) if self.cursor else 0
+
+
+class GetBugFixTrendsRequest(ResponseShapeOptions):
     """Request schema for getting bug fix trends"""
     days_back: int = Field(default=10, ge=1, le=365, description="Number of days to look back")
     project_id: Optional[str] = Field(default=None, description="Optional project ID filter (numeric)")
@@ -80,11 +142,85 @@ class GetBugFixTrendsResponse(BaseModel):
         }
 
 
-class GetActiveBugsRequest(BaseModel):
+class GetBugTrendsRequest(ResponseShapeOptions):
+    """Request schema for calendar-bucketed bug fix trends"""
+    granularity: Literal["day", "week", "month"] = Field(
+        default="week", description="Bucket size: calendar days, ISO weeks (Monday first) or calendar months"
+    )
+    start_date: Optional[Date] = Field(
+        default=None, description="First day of the period (default: days_back before end_date); "
+                                  "moved back to the start of its bucket"
+    )
+    end_date: Optional[Date] = Field(default=None, description="Last day of the period (default: today)")
+    days_back: int = Field(default=90, ge=1, le=MAX_TREND_DAYS, description="Period length when start_date is not given")
+    rolling_window: int = Field(
+        default=1, ge=1, le=52, description="Buckets averaged into rolling_average (1 = no smoothing)"
+    )
+    compare_previous: bool = Field(
+        default=False, description="Also report the same number of buckets immediately before the period"
+    )
+    project_id: Optional[str] = Field(default=None, description="Optional project ID filter (numeric)")
+    project_name: Optional[str] = Field(default=None, description="Optional project name filter (e.g., 'HotRetailSys')")
+    
+    @model_validator(mode="after")
+    def validate_period(self) -> "GetBugTrendsRequest":
+        if self.start_date is not None:
+            end_date = self.end_date or Date.today()
+            if self.start_date > end_date:
+                raise ValueError("start_date must not be after end_date")
+            if (end_date - self.start_date).days > MAX_TREND_DAYS:
+                raise ValueError(f"The period may span at most {MAX_TREND_DAYS} days")
+        return self
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "granularity": "week",
+                "start_date": "2023-01-01",
+                "rolling_window": 4,
+                "compare_previous": True,
+                "project_name": "HotRetailSys"
+            }
+        }
+
+
+class TrendBucket(BaseModel):
+    """Fixed bugs in one calendar bucket"""
+    bucket_start: str = Field(description="First day of the bucket")
+    fixed_count: int
+    rolling_average: float = Field(description="Mean fixed_count over this and the preceding rolling_window - 1 buckets")
+    previous_count: Optional[int] = Field(
+        default=None, description="Fixed bugs in the matching bucket of the previous period"
+    )
+
+
+class PeriodComparison(BaseModel):
+    """Totals of the period immediately before the requested one"""
+    period_start: str
+    period_end: str
+    total_fixed_bugs: int
+    change: int = Field(description="Current total minus previous total")
+    change_pct: Optional[float] = Field(default=None, description="Relative change in percent; null when the previous total is 0")
+
+
+class GetBugTrendsResponse(BaseModel):
+    """Response schema for calendar-bucketed bug fix trends"""
+    granularity: str
+    period_start: str = Field(description="First day of the first bucket")
+    period_end: str = Field(description="Last day of the period")
+    total_fixed_bugs: int
+    buckets: List[TrendBucket] = Field(description="Every bucket of the period, empty ones as 0")
+    previous_period: Optional[PeriodComparison] = Field(default=None, description="Present when compare_previous is set")
+    project_id: Optional[str] = Field(default=None, description="Project ID filter applied")
+    project_name: Optional[str] = Field(default=None, description="Project name filter applied")
+
+
+class GetActiveBugsRequest(PaginatedRequest, ResponseShapeOptions):
     """Request schema for getting active bugs"""
     project_id: Optional[str] = Field(default=None, description="Optional project ID filter (numeric)")
     project_name: Optional[str] = Field(default=None, description="Optional project name filter (e.g., 'HotRetailSys')")
     severity: Optional[str] = Field(default=None, description="Filter by severity (Low, Medium, High, Critical)")
+    limit: int = Field(default=100, ge=1, le=500, description="Maximum number of results per page")
     
     class Config:
         json_schema_extra = {
@@ -108,36 +244,49 @@ class BugItem(BaseModel):
 
 class GetActiveBugsResponse(BaseModel):
     """Response schema for active bugs"""
-    total_active_bugs: int
+    total_active_bugs: int = Field(description="Number of active bugs in this page")
     bugs: List[BugItem]
     filters_applied: Dict[str, Any]
     project_id: Optional[str] = Field(default=None, description="Project ID if filtered")
     project_name: Optional[str] = Field(default=None, description="Project name if filtered")
-    
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page; null on the last page")
+
 
-class GetBugsByStatusRequest(BaseModel):
+class GetBugsByStatusRequest(PaginatedRequest, ResponseShapeOptions):
     """Request schema for getting bugs by status"""
     status: str = Field(description="Bug status (Active, Closed, New)")
     project_id: Optional[str] = Field(default=None, description="Optional project ID filter (numeric)")
     project_name: Optional[str] = Field(default=None, description="Optional project name filter (e.g., 'HotRetailSys')")
-    limit: int = Field(default=50, ge=1, le=500, description="Maximum number of results")
+    limit: int = Field(default=50, ge=1, le=500, description="Maximum number of results per page")
 
 
 class GetBugsByStatusResponse(BaseModel):
     """Response schema for bugs by status"""
     status: str
-    total_count: int
+    total_count: int = Field(description="Number of bugs in this page")
     bugs: List[BugItem]
     project_id: Optional[str] = Field(default=None, description="Project ID if filtered")
     project_name: Optional[str] = Field(default=None, description="Project name if filtered")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page; null on the last page")
 
 
-class GetBugStatisticsRequest(BaseModel):
+class GetBugStatisticsRequest(ResponseShapeOptions):
     """Request schema for bug statistics"""
     project_id: Optional[str] = Field(default=None, description="Optional project ID filter (numeric)")
     project_name: Optional[str] = Field(default=None, description="Optional project name filter (e.g., 'HotRetailSys')")
 
 
+class ProjectBugBreakdown(BaseModel):
+    """Per-project bug counts broken down by status and severity"""
+    project_id: int
+    project: str
+    total: int
+    by_status: Dict[str, int]
+    by_status_severity: Dict[str, Dict[str, int]] = Field(
+        description="Status -> severity -> count (missing severity reported as 'Unspecified')"
+    )
+
+
 class BugStatistics(BaseModel):
     """Bug statistics summary"""
     total_bugs: int
@@ -146,6 +295,10 @@ class BugStatistics(BaseModel):
     new_bugs: int
     by_severity: Dict[str, int]
     by_project: List[Dict[str, Any]]
+    by_project_breakdown: List[ProjectBugBreakdown] = Field(
+        default_factory=list,
+        description="Status x severity matrix for each project"
+    )
 
 
 class GetBugStatisticsResponse(BaseModel):
@@ -154,3 +307,156 @@ class GetBugStatisticsResponse(BaseModel):
     generated_at: str
     project_id: Optional[str] = Field(default=None, description="Project ID if filtered")
     project_name: Optional[str] = Field(default=None, description="Project name if filtered")
+
+
+class GetTimeToFixRequest(ResponseShapeOptions):
+    """Request schema for time-to-fix distribution analytics"""
+    metric: Literal["fix", "verify"] = Field(
+        default="fix", description="'fix': work item created -> bug fixed; 'verify': fixed -> verified"
+    )
+    days_back: int = Field(default=90, ge=1, le=MAX_TREND_DAYS, description="Bugs fixed in the last N days")
+    severity: Optional[str] = Field(default=None, description="Optional severity filter (Low, Medium, High, Critical)")
+    project_id: Optional[str] = Field(default=None, description="Optional project ID filter (numeric)")
+    project_name: Optional[str] = Field(default=None, description="Optional project name filter (e.g., 'HotRetailSys')")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "metric": "fix",
+                "days_back": 180,
+                "project_name": "HotRetailSys"
+            }
+        }
+
+
+class DurationSummary(BaseModel):
+    """Distribution of durations in hours (percentiles within the sketch accuracy)"""
+    count: int
+    mean_hours: Optional[float] = None
+    p50_hours: Optional[float] = None
+    p90_hours: Optional[float] = None
+    p99_hours: Optional[float] = None
+
+
+class SeverityDuration(DurationSummary):
+    """Duration distribution of one severity"""
+    severity: str
+
+
+class ProjectDuration(DurationSummary):
+    """Duration distribution of one project"""
+    project_id: int
+    project: Optional[str] = None
+
+
+class DurationHistogramBin(BaseModel):
+    """Number of bugs whose duration falls into one range"""
+    label: str
+    min_hours: float
+    max_hours: Optional[float] = Field(default=None, description="Exclusive upper bound; null for the last bin")
+    count: int
+
+
+class GetTimeToFixResponse(BaseModel):
+    """Response schema for time-to-fix distribution analytics"""
+    metric: str
+    period_start: str
+    period_end: str
+    overall: DurationSummary
+    histogram: List[DurationHistogramBin]
+    by_severity: List[SeverityDuration]
+    by_project: List[ProjectDuration]
+    relative_accuracy: float = Field(description="Maximum relative error of the reported percentiles")
+    project_id: Optional[str] = Field(default=None, description="Project ID filter applied")
+    project_name: Optional[str] = Field(default=None, description="Project name filter applied")
+
+
+class SearchBugsRequest(ResponseShapeOptions):
+    """Request schema for full-text bug search"""
+    query: str = Field(min_length=1, max_length=200, description="Words to look for in bug titles, notes and tags")
+    match: Literal["all", "any"] = Field(default="all", description="Require all words or any word")
+    status: Optional[str] = Field(default=None, description="Optional bug status filter (Active, Closed, New)")
+    project_id: Optional[str] = Field(default=None, description="Optional project ID filter (numeric)")
+    project_name: Optional[str] = Field(default=None, description="Optional project name filter (e.g., 'HotRetailSys')")
+    limit: int = Field(default=20, ge=1, le=100, description="Maximum number of results per page")
+    cursor: Optional[str] = Field(default=None, description="Opaque cursor from a previous page's next_cursor")
+    
+    @field_validator("cursor")
+    @classmethod
+    def validate_cursor(cls, value: Optional[str]) -> Optional[str]:
+        if value is not None:
+            decode_cursor(value, SEARCH_CURSOR_PREFIX)
+        return value
+    
+    @property
+    def offset(self) -> int:
+        """Number of ranked results before the requested page"""
+        return decode_cursor(self.cursor, SEARCH_CURSOR_PREFIX) if self.cursor else 0
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "query": "checkout timeout",
+                "status": "Active",
+                "project_name": "HotRetailSys"
+            }
+        }
+
+
+class BugSearchHit(BugItem):
+    """Bug matching a search, with its relevance"""
+    rank: float = Field(description="BM25 score; lower is more relevant")
+    snippet: Optional[str] = Field(default=None, description="Matching text with hits in [brackets]")
+
+
+class SearchBugsResponse(BaseModel):
+    """Response schema for full-text bug search"""
+    query: str
+    total_matches: int = Field(description="Number of bugs matching the query and filters")
+    bugs: List[BugSearchHit] = Field(description="Most relevant first")
+    filters_applied: Dict[str, Any]
+    project_id: Optional[str] = Field(default=None, description="Project ID if filtered")
+    project_name: Optional[str] = Field(default=None, description="Project name if filtered")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page; null on the last page")
+
+
+BatchActionName = Literal[
+    "get_bug_fix_trends", "get_bug_trends", "get_active_bugs", "get_bugs_by_status", "get_bug_statistics",
+    "get_time_to_fix", "search_bugs"
+]
+
+
+class BatchAction(BaseModel):
+    """A single action invocation inside a batch"""
+    action: BatchActionName = Field(description="Name of the bug action to run")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Request body the action would normally receive")
+
+
+class BatchRequest(BaseModel):
+    """Request schema for running several bug actions in one call"""
+    actions: List[BatchAction] = Field(min_length=1, max_length=20, description="Actions to run, in order")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "actions": [
+                    {"action": "get_bug_statistics", "params": {"project_name": "HotRetailSys"}},
+                    {"action": "get_active_bugs", "params": {"project_name": "HotRetailSys", "limit": 20}},
+                    {"action": "get_bug_fix_trends", "params": {"project_name": "HotRetailSys", "days_back": 30}}
+                ]
+            }
+        }
+
+
+class BatchActionResult(BaseModel):
+    """Outcome of one action inside a batch"""
+    action: str
+    status_code: int = Field(description="HTTP status the action would have returned on its own")
+    result: Optional[Dict[str, Any]] = Field(default=None, description="Action response when successful")
+    error: Optional[Any] = Field(default=None, description="Error details when the action failed")
+
+
+class BatchResponse(BaseModel):
+    """Response schema for a batch of bug actions"""
+    results: List[BatchActionResult]
+    generated_at: str
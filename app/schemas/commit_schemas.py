@@ -0,0 +1,92 @@
+"""
+Request and response schemas for commit analytics endpoints
+"""
+from typing import Optional, List, Literal
+from pydantic import BaseModel, Field
+from app.schemas.bug_schemas import ResponseShapeOptions, MAX_TREND_DAYS
+
+# Most bugs a single fix-commit lookup may ask for
+MAX_FIX_COMMIT_BUGS = 1000
+
+
+class GetCommitActivityRequest(ResponseShapeOptions):
+    """Request schema for commit activity per author or branch over time"""
+    group_by: Literal["author", "branch"] = Field(default="author", description="Series per commit author or per branch")
+    granularity: Literal["day", "week", "month"] = Field(
+        default="week", description="Bucket size: calendar days, ISO weeks (Monday first) or calendar months"
+    )
+    days_back: int = Field(default=90, ge=1, le=MAX_TREND_DAYS, description="Commits made in the last N days")
+    project_id: Optional[str] = Field(default=None, description="Optional project ID filter (numeric)")
+    project_name: Optional[str] = Field(default=None, description="Optional project name filter (e.g., 'HotRetailSys')")
+    top: int = Field(default=10, ge=1, le=100, description="Number of most active authors or branches to return")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "group_by": "author",
+                "granularity": "week",
+                "days_back": 90,
+                "project_name": "HotRetailSys"
+            }
+        }
+
+
+class CommitActivitySeries(BaseModel):
+    """Commit counts of one author or branch, one per bucket"""
+    name: Optional[str] = Field(description="Author or branch (null when not recorded)")
+    total_commits: int
+    counts: List[int] = Field(description="Commits per bucket, aligned with bucket_starts")
+
+
+class GetCommitActivityResponse(BaseModel):
+    """Response schema for commit activity per author or branch over time"""
+    group_by: str
+    granularity: str
+    period_start: str = Field(description="First day of the first bucket")
+    period_end: str = Field(description="Last day of the period")
+    bucket_starts: List[str] = Field(description="First day of every bucket of the period")
+    total_commits: int
+    series: List[CommitActivitySeries] = Field(description="Most active authors or branches first")
+    other_commits: int = Field(description="Commits of the authors or branches beyond top")
+    project_id: Optional[str] = Field(default=None, description="Project ID filter applied")
+    project_name: Optional[str] = Field(default=None, description="Project name filter applied")
+
+
+class GetFixCommitsRequest(ResponseShapeOptions):
+    """Request schema for the commits linked to a set of bugs"""
+    bug_ids: List[int] = Field(
+        min_length=1, max_length=MAX_FIX_COMMIT_BUGS, description="BugIds to look up (duplicates are ignored)"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "bug_ids": [1, 2, 3]
+            }
+        }
+
+
+class CommitItem(BaseModel):
+    """Commit linked to a bug's work item"""
+    commit_id: int
+    azure_commit_id: str
+    author: Optional[str] = None
+    commit_date: Optional[str] = None
+    branch: Optional[str] = None
+    comment: Optional[str] = None
+
+
+class BugFixCommits(BaseModel):
+    """A bug and the commits associated with its work item, oldest first"""
+    bug_id: int
+    azure_bug_id: str
+    work_item_id: Optional[int] = None
+    status: Optional[str] = None
+    commits: List[CommitItem]
+
+
+class GetFixCommitsResponse(BaseModel):
+    """Response schema for the commits linked to a set of bugs"""
+    bugs: List[BugFixCommits] = Field(description="Found bugs in BugId order")
+    missing_bug_ids: List[int] = Field(description="Requested BugIds that do not exist")
+    total_commits: int
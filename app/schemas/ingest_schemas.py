@@ -0,0 +1,105 @@
+"""
+Request and response schemas for bulk ingestion of Azure DevOps sync data
+"""
+from typing import Optional, List
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+
+class ProjectRecord(BaseModel):
+    """Project as synchronized from Azure DevOps, keyed on azure_project_id"""
+    azure_project_id: str = Field(min_length=1, description="Azure DevOps project GUID")
+    project_name: str = Field(min_length=1)
+    description: Optional[str] = None
+    is_active: bool = True
+
+
+class WorkItemRecord(BaseModel):
+    """Work item as synchronized from Azure DevOps, keyed on azure_work_item_id"""
+    azure_work_item_id: int = Field(description="Azure DevOps work item id")
+    azure_project_id: str = Field(description="Owning project; must already exist or be in the same batch")
+    title: str = Field(min_length=1)
+    work_item_type: Optional[str] = None
+    state: Optional[str] = None
+    assigned_to: Optional[str] = None
+    created_date: Optional[datetime] = None
+    changed_date: Optional[datetime] = None
+    closed_date: Optional[datetime] = None
+    priority: Optional[int] = None
+    iteration_path: Optional[str] = None
+    area_path: Optional[str] = None
+    tags: Optional[str] = Field(default=None, description="Semicolon-separated tags")
+
+
+class BugRecord(BaseModel):
+    """Bug as synchronized from Azure DevOps, keyed on azure_bug_id"""
+    azure_bug_id: str = Field(min_length=1, description="Azure DevOps bug id")
+    azure_work_item_id: Optional[int] = Field(default=None, description="Linked work item, if synchronized")
+    severity: Optional[str] = None
+    resolution: Optional[str] = None
+    fixed_by: Optional[str] = None
+    fixed_date: Optional[datetime] = None
+    verified_by: Optional[str] = None
+    verified_date: Optional[datetime] = None
+    status: Optional[str] = None
+    notes: Optional[str] = None
+
+
+class IngestRequest(BaseModel):
+    """Request schema for a bulk upsert batch"""
+    source: str = Field(default="Azure DevOps API", description="Recorded as SyncLog.Source")
+    projects: List[ProjectRecord] = Field(default_factory=list)
+    work_items: List[WorkItemRecord] = Field(default_factory=list)
+    bugs: List[BugRecord] = Field(default_factory=list)
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "source": "nightly-sync",
+                "work_items": [
+                    {
+                        "azure_work_item_id": 13001,
+                        "azure_project_id": "62981f7a-c8dd-48b0-913f-e56319498f28",
+                        "title": "API: Fix timeout in OrdersController",
+                        "work_item_type": "Bug",
+                        "state": "Active",
+                        "changed_date": "2025-11-20T10:00:00"
+                    }
+                ],
+                "bugs": [
+                    {
+                        "azure_bug_id": "13001",
+                        "azure_work_item_id": 13001,
+                        "severity": "High",
+                        "status": "Active"
+                    }
+                ]
+            }
+        }
+
+
+class EntityIngestResult(BaseModel):
+    """Outcome of upserting one entity type"""
+    entity_type: str
+    records_received: int
+    records_upserted: int
+    records_skipped: int = Field(description="Rows whose parent project could not be resolved")
+
+
+class IngestResponse(BaseModel):
+    """Response schema for a bulk upsert batch"""
+    results: List[EntityIngestResult]
+    duration_ms: float
+    rows_per_second: float
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "results": [
+                    {"entity_type": "WorkItem", "records_received": 1, "records_upserted": 1, "records_skipped": 0},
+                    {"entity_type": "Bug", "records_received": 1, "records_upserted": 1, "records_skipped": 0}
+                ],
+                "duration_ms": 4.2,
+                "rows_per_second": 476.2
+            }
+        }
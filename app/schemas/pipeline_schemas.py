@@ -0,0 +1,62 @@
+"""
+Request and response schemas for pipeline run analytics endpoints
+"""
+from typing import Optional, List
+from pydantic import BaseModel, Field
+from app.schemas.bug_schemas import ResponseShapeOptions, MAX_TREND_DAYS
+
+
+class GetPipelineHealthRequest(ResponseShapeOptions):
+    """Request schema for pipeline run health analytics"""
+    days_back: int = Field(default=30, ge=1, le=MAX_TREND_DAYS, description="Runs started in the last N days")
+    project_id: Optional[str] = Field(default=None, description="Optional project ID filter (numeric)")
+    project_name: Optional[str] = Field(default=None, description="Optional project name filter (e.g., 'HotRetailSys')")
+    top: int = Field(default=10, ge=1, le=100, description="Number of slowest pipelines to return")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "days_back": 30,
+                "project_name": "HotRetailSys",
+                "top": 5
+            }
+        }
+
+
+class RunSummary(BaseModel):
+    """Run outcomes and duration distribution in seconds (percentiles within the sketch accuracy)"""
+    runs: int
+    succeeded: int
+    failed: int
+    canceled: int
+    failure_rate: Optional[float] = Field(default=None, description="Failed runs / all runs")
+    mean_seconds: Optional[float] = None
+    p50_seconds: Optional[float] = None
+    p90_seconds: Optional[float] = None
+    p99_seconds: Optional[float] = None
+
+
+class ProjectPipelineHealth(RunSummary):
+    """Run summary of all pipelines of one project"""
+    project_id: int
+    project: Optional[str] = None
+
+
+class PipelineHealth(RunSummary):
+    """Run summary of one pipeline"""
+    pipeline_id: int
+    pipeline_name: Optional[str] = None
+    project_id: int
+    project: Optional[str] = None
+
+
+class GetPipelineHealthResponse(BaseModel):
+    """Response schema for pipeline run health analytics"""
+    period_start: str
+    period_end: str
+    overall: RunSummary
+    by_project: List[ProjectPipelineHealth]
+    slowest_pipelines: List[PipelineHealth] = Field(description="Pipelines with the highest p90 duration")
+    relative_accuracy: float = Field(description="Maximum relative error of the reported percentiles")
+    project_id: Optional[str] = Field(default=None, description="Project ID filter applied")
+    project_name: Optional[str] = Field(default=None, description="Project name filter applied")
@@ -0,0 +1,75 @@
+"""
+FTS5 full-text index over bug titles, notes and tags maintained by triggers
+"""
+import logging
+import re
+from typing import Optional, List
+from app.database import db_manager
+from app.migrations import SEARCH_BACKFILL_SQL, split_statements
+
+logger = logging.getLogger(__name__)
+
+
+# Column weights for bm25(): a title hit outranks a tag hit outranks a notes hit
+RANK_WEIGHTS = (10.0, 2.0, 5.0)
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def build_match_query(text: str, match_all: bool = True) -> Optional[str]:
+    """
+    Turn free text into a safe FTS5 MATCH expression
+    
+    Every word is quoted, so FTS5 operators and punctuation typed by the
+    caller are treated as plain text. The last word also matches as a
+    prefix, which helps with partially typed queries.
+    
+    Args:
+        text: Free-text search query
+        match_all: Require every word (AND) instead of any word (OR)
+    
+    Returns:
+        MATCH expression, or None when the text contains no words
+    """
+    words = _TOKEN.findall(text)
+    if not words:
+        return None
+    terms: List[str] = [f'"{word}"' for word in words]
+    terms[-1] += "*"
+    return (" AND " if match_all else " OR ").join(terms)
+
+
+class BugSearchIndex:
+    """
+    Manages the BugSearch FTS5 index
+    
+    The index and the triggers on Bugs and WorkItems that keep it current
+    are created by schema migration 5; ``rebuild()`` repopulates it from
+    scratch.
+    """
+    
+    def __init__(self, db=None):
+        self.db = db or db_manager
+    
+    def rebuild(self) -> int:
+        """
+        Repopulate the index from Bugs and WorkItems in a single transaction
+        
+        Returns:
+            Number of bugs indexed
+        """
+        with self.db.get_connection() as conn:
+            try:
+                for statement in split_statements(SEARCH_BACKFILL_SQL):
+                    conn.execute(statement)
+                indexed = conn.execute("SELECT COUNT(*) FROM BugSearch").fetchone()[0]
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        logger.info("BugSearch index rebuilt with %s bugs", indexed)
+        return indexed
+
+
+# Singleton instance
+bug_search_index = BugSearchIndex()
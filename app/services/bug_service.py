@@ -2,14 +2,19 @@
 Business logic for bug-related operations
 """
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-from app.database import db_manager
+from datetime import date, datetime, timedelta
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+from pydantic_core import to_json
+from app.config import get_settings
+from app.replica import read_db
+from app.services.project_catalog import project_catalog
+from app.services.fix_rollup import bug_fix_rollup
+from app.services.cycle_time import cycle_time_sketches
+from app.services.trend_engine import trend_engine, bucket_start, bucket_count, shift_buckets
+from app.services.bug_search import bug_search_index, build_match_query, RANK_WEIGHTS
 from app.schemas.bug_schemas import (
     GetBugFixTrendsRequest,
-    GetBugFixTrendsResponse,
-    DailyTrend,
-    TrendGraphData
+    GetBugFixTrendsResponse
 )
 
 logger = logging.getLogger(__name__)
@@ -19,7 +24,13 @@ class BugService:
     """Service class for bug-related business logic"""
     
     def __init__(self):
-        self.db = db_manager
+        self.settings = get_settings()
+        self.db = read_db
+        self.projects = project_catalog
+        self.rollup = bug_fix_rollup
+        self.trends = trend_engine
+        self.cycle_times = cycle_time_sketches
+        self.search = bug_search_index
     
     def get_bug_fix_trends(self, request: GetBugFixTrendsRequest) -> GetBugFixTrendsResponse:
         """
@@ -27,7 +38,7 @@ class BugService:
         
         Args:
             request: GetBugFixTrendsRequest containing days_back and optional project_id/project_name
-            
+        
         Returns:
             GetBugFixTrendsResponse with trend analysis data
         """
@@ -35,216 +46,245 @@ class BugService:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=request.days_back)
         
-        # Format dates for SQLite
-        start_date_str = start_date.strftime('%Y-%m-%d')
-        end_date_str = end_date.strftime('%Y-%m-%d')
-        
-        # Build SQL query based on project filter
-        if request.project_id or request.project_name:
-            # Join with WorkItems and Projects to support both project_id and project_name
-            sql_query = """
-                SELECT 
-                    DATE(b.FixedDate) as FixDate,
-                    COUNT(*) as FixedCount
-                FROM Bugs b
-                LEFT JOIN WorkItems w ON b.WorkItemId = w.WorkItemId
-                LEFT JOIN Projects p ON w.ProjectId = p.ProjectId
-                WHERE 
-                    b.FixedDate IS NOT NULL
-                    AND DATE(b.FixedDate) >= ?
-                    AND DATE(b.FixedDate) <= ?
-                    AND b.Status = 'Closed'
-            """
-            
-            if request.project_id:
-                sql_query += " AND p.ProjectId = ?"
-                params = (start_date_str, end_date_str, request.project_id)
-            else:  # project_name
-                sql_query += " AND p.ProjectName = ?"
-                params = (start_date_str, end_date_str, request.project_name)
-            
-            sql_query += """
-                GROUP BY DATE(b.FixedDate)
-                ORDER BY FixDate
-            """
-        else:
-            # No project filter - all projects
-            sql_query = """
-                SELECT 
-                    DATE(FixedDate) as FixDate,
-                    COUNT(*) as FixedCount
-                FROM Bugs
-                WHERE 
-                    FixedDate IS NOT NULL
-                    AND DATE(FixedDate) >= ?
-                    AND DATE(FixedDate) <= ?
-                    AND Status = 'Closed'
-                GROUP BY DATE(FixedDate)
-                ORDER BY FixDate
-            """
-            params = (start_date_str, end_date_str)
-        
-        logger.info(f"Executing bug fix trends query for {request.days_back} days back")
-        
-        # Get project details if filtered by project
-        project_id_result = None
-        project_name_result = None
-        
-        if request.project_id or request.project_name:
-            if request.project_id:
-                project_query = "SELECT ProjectId, ProjectName FROM Projects WHERE ProjectId = ?"
-                project_params = (request.project_id,)
-            else:
-                project_query = "SELECT ProjectId, ProjectName FROM Projects WHERE ProjectName = ?"
-                project_params = (request.project_name,)
-            
-            project_info = self.db.execute_query(project_query, project_params)
-            if project_info:
-                project_id_result = str(project_info[0]['ProjectId'])
-                project_name_result = project_info[0]['ProjectName']
-        
-        # Execute query
-        results = self.db.execute_query(sql_query, params)
-        
-        # Process results
-        daily_aggregation = []
-        total_fixed = 0
-        
-        for row in results:
-            fix_date = row['FixDate']
-            fixed_count = row['FixedCount']
-            
-            # Convert date to string format
-            date_str = fix_date.strftime('%Y-%m-%d') if isinstance(fix_date, datetime) else str(fix_date)
-            
-            daily_aggregation.append(DailyTrend(
-                date=date_str,
-                fixed_count=fixed_count
-            ))
-            total_fixed += fixed_count
-        
-        # Fill in missing dates with zero counts
-        daily_aggregation = self._fill_missing_dates(
-            daily_aggregation, 
-            start_date, 
-            end_date
-        )
+        project_id, project_name, matched = self.projects.resolve_request(request)
+        project_ids = self._project_ids(project_id, matched)
         
-        # Prepare trend graph data
-        trend_graph_data = TrendGraphData(
-            labels=[trend.date for trend in daily_aggregation],
-            values=[trend.fixed_count for trend in daily_aggregation]
-        )
+        # Dense daily series from the BugDailyFixes rollup, gaps filled in SQL
+        logger.debug("Executing bug fix trends query for %s days back", request.days_back)
+        series = self.trends.series(start_date.date(), end_date.date(), "day", project_ids)
+        labels = [row[0] for row in series]
+        values = [row[1] for row in series]
+        total_fixed = sum(values)
         
-        logger.info(f"Bug fix trends analysis complete: {total_fixed} bugs fixed")
+        logger.debug("Bug fix trends analysis complete: %s bugs fixed", total_fixed)
         
         return GetBugFixTrendsResponse(
             total_fixed_bugs=total_fixed,
-            daily_aggregation=daily_aggregation,
-            trend_graph_data=trend_graph_data,
-            sql_query=sql_query,
+            daily_aggregation=[{"date": label, "fixed_count": value} for label, value in zip(labels, values)],
+            trend_graph_data={"labels": labels, "values": values},
+            sql_query=self.trends.build_query("day", None if project_ids is None else len(project_ids)),
             period_start=start_date.strftime('%Y-%m-%d'),
             period_end=end_date.strftime('%Y-%m-%d'),
-            project_id=project_id_result,
-            project_name=project_name_result
+            project_id=str(project_id) if project_id is not None else request.project_id,
+            project_name=project_name if matched else request.project_name
         )
     
-    def _fill_missing_dates(
-        self, 
-        trends: List[DailyTrend], 
-        start_date: datetime, 
-        end_date: datetime
-    ) -> List[DailyTrend]:
+    def _project_ids(self, project_id: Optional[int], matched: bool) -> Optional[Tuple[int, ...]]:
+        """Project filter for the trend engine: None for all projects, empty for an unknown project"""
+        if not matched:
+            return ()
+        return None if project_id is None else (project_id,)
+    
+    def get_bug_trends(self, request) -> Dict[str, Any]:
         """
-        Fill in missing dates in the trend data with zero counts
+        Calendar-bucketed bug fix trends with rolling averages
+        
+        The whole series, including the buckets needed to warm up the
+        rolling average and the previous period for comparison, comes from
+        one trend engine query.
         
         Args:
-            trends: List of existing daily trends
-            start_date: Start of the period
-            end_date: End of the period
-            
+            request: GetBugTrendsRequest with period, granularity and options
+        
         Returns:
-            Complete list of daily trends with no gaps
+            GetBugTrendsResponse with one entry per bucket
         """
-        # Create a dictionary for quick lookup
-        trend_dict = {trend.date: trend.fixed_count for trend in trends}
+        from app.schemas.bug_schemas import GetBugTrendsResponse
         
-        # Generate all dates in range
-        complete_trends = []
-        current_date = start_date
+        granularity = request.granularity
+        end = request.end_date or date.today()
+        start = bucket_start(request.start_date or end - timedelta(days=request.days_back), granularity)
         
-        while current_date <= end_date:
-            date_str = current_date.strftime('%Y-%m-%d')
-            fixed_count = trend_dict.get(date_str, 0)
-            
-            complete_trends.append(DailyTrend(
-                date=date_str,
-                fixed_count=fixed_count
-            ))
-            
-            current_date += timedelta(days=1)
+        project_id, project_name, matched = self.projects.resolve_request(request)
+        project_ids = self._project_ids(project_id, matched)
         
-        return complete_trends
+        count = bucket_count(start, end, granularity)
+        lead = max(count if request.compare_previous else 0, request.rolling_window - 1)
+        series = self.trends.series(
+            shift_buckets(start, granularity, -lead), end, granularity, project_ids, request.rolling_window
+        )
+        current = series[lead:]
+        previous = series[lead - count:lead] if request.compare_previous else None
+        
+        buckets = []
+        for index, (bucket, fixed_count, rolling_average) in enumerate(current):
+            buckets.append({
+                "bucket_start": bucket,
+                "fixed_count": fixed_count,
+                "rolling_average": round(rolling_average, 2),
+                "previous_count": previous[index][1] if previous else None
+            })
+        total_fixed = sum(row[1] for row in current)
+        
+        previous_period = None
+        if previous:
+            previous_total = sum(row[1] for row in previous)
+            previous_period = {
+                "period_start": previous[0][0],
+                "period_end": (start - timedelta(days=1)).isoformat(),
+                "total_fixed_bugs": previous_total,
+                "change": total_fixed - previous_total,
+                "change_pct": round((total_fixed - previous_total) * 100 / previous_total, 2) if previous_total else None
+            }
+        
+        logger.debug("Bug trends by %s complete: %s buckets, %s bugs fixed", granularity, len(buckets), total_fixed)
+        
+        return GetBugTrendsResponse(
+            granularity=granularity,
+            period_start=start.isoformat(),
+            period_end=end.isoformat(),
+            total_fixed_bugs=total_fixed,
+            buckets=buckets,
+            previous_period=previous_period,
+            project_id=str(project_id) if project_id is not None else request.project_id,
+            project_name=project_name if matched else request.project_name
+        )
     
-    def get_active_bugs(self, request) -> Dict[str, Any]:
-        """Get all active bugs with optional filters"""
-        from app.schemas.bug_schemas import GetActiveBugsResponse, BugItem
-        
-        # Get project details if filtered
-        project_id_result = None
-        project_name_result = None
-        
-        if request.project_id or request.project_name:
-            if request.project_id:
-                project_query = "SELECT ProjectId, ProjectName FROM Projects WHERE ProjectId = ?"
-                project_params = (request.project_id,)
-            else:
-                project_query = "SELECT ProjectId, ProjectName FROM Projects WHERE ProjectName = ?"
-                project_params = (request.project_name,)
-            
-            project_info = self.db.execute_query(project_query, project_params)
-            if project_info:
-                project_id_result = str(project_info[0]['ProjectId'])
-                project_name_result = project_info[0]['ProjectName']
-        
-        # Build query with filters
-        sql_parts = ["""
-            SELECT 
-                b.BugId, b.AzureBugId, w.Title, b.Severity, b.Status,
+    def _build_bug_list_query(
+        self,
+        status: str,
+        after_bug_id: int,
+        project_id: Optional[int] = None,
+        severity: Optional[str] = None
+    ) -> Tuple[str, List[Any]]:
+        """
+        Build the bug listing query, ordered by BugId and starting after a cursor
+        
+        Rows are read in BugId order straight from the Status (or
+        Status + Severity) index, so no sort step is needed.
+        
+        Returns:
+            Tuple of (SQL query, parameter list)
+        """
+        sql_query = """
+            SELECT
+                b.BugId, b.AzureBugId, COALESCE(w.Title, 'N/A') AS Title, b.Severity, b.Status,
                 w.CreatedDate, b.Notes
             FROM Bugs b
             LEFT JOIN WorkItems w ON b.WorkItemId = w.WorkItemId
-            LEFT JOIN Projects p ON w.ProjectId = p.ProjectId
-            WHERE b.Status = 'Active'
-        """]
+            WHERE b.Status = ? AND b.BugId > ?
+        """
+        params: List[Any] = [status, after_bug_id]
         
-        params = []
+        if project_id is not None:
+            sql_query += " AND w.ProjectId = ?"
+            params.append(project_id)
         
-        if request.project_id:
-            sql_parts.append("AND p.ProjectId = ?")
-            params.append(request.project_id)
-        elif request.project_name:
-            sql_parts.append("AND p.ProjectName = ?")
-            params.append(request.project_name)
+        if severity:
+            sql_query += " AND b.Severity = ?"
+            params.append(severity)
         
-        if request.severity:
-            sql_parts.append("AND b.Severity = ?")
-            params.append(request.severity)
+        sql_query += " ORDER BY b.BugId"
+        return sql_query, params
+    
+    @staticmethod
+    def _bug_item_fields(row: Tuple) -> Dict[str, Any]:
+        """
+        Map a bug listing row to BugItem fields
+        
+        Rows are plain tuples in the listing query's column order (BugId,
+        AzureBugId, Title, Severity, Status, CreatedDate, Notes).
+        """
+        bug_id, azure_bug_id, title, severity, status, created_date, notes = row[:7]
+        return {
+            "bug_id": bug_id,
+            "azure_bug_id": azure_bug_id,
+            "title": title,
+            "severity": severity,
+            "status": status,
+            "created_date": str(created_date) if created_date else None,
+            "notes": notes
+        }
+    
+    def _fetch_bug_page(
+        self,
+        status: str,
+        after_bug_id: int,
+        limit: int,
+        project_id: Optional[int] = None,
+        severity: Optional[str] = None
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        Fetch one page of bugs using keyset pagination on BugId
         
-        sql_query = " ".join(sql_parts)
-        results = self.db.execute_query(sql_query, tuple(params) if params else None)
+        Every page costs the same regardless of how deep it is.
         
-        bugs = []
-        for row in results:
-            bugs.append(BugItem(
-                bug_id=row['BugId'],
-                azure_bug_id=row['AzureBugId'],
-                title=row.get('Title', 'N/A'),
-                severity=row.get('Severity'),
-                status=row['Status'],
-                created_date=str(row.get('CreatedDate')) if row.get('CreatedDate') else None,
-                notes=row.get('Notes')
-            ))
+        Args:
+            status: Bug status to list
+            after_bug_id: Last BugId of the previous page (0 for the first page)
+            limit: Page size
+            project_id: Optional resolved project ID filter
+            severity: Optional severity filter
+        
+        Returns:
+            Tuple of (list of BugItem field dictionaries, next page cursor or None)
+        """
+        from app.schemas.bug_schemas import encode_cursor
+        
+        sql_query, params = self._build_bug_list_query(status, after_bug_id, project_id, severity)
+        
+        # One extra row tells us whether another page exists
+        sql_query += " LIMIT ?"
+        params.append(limit + 1)
+        
+        results = self.db.execute_query(sql_query, tuple(params), as_tuples=True)
+        has_more = len(results) > limit
+        # Plain dictionaries: the response model validates the whole page in
+        # one pydantic-core pass instead of one BugItem call per row
+        bugs = [self._bug_item_fields(row) for row in results[:limit]]
+        
+        next_cursor = encode_cursor(bugs[-1]["bug_id"]) if has_more else None
+        return bugs, next_cursor
+    
+    def _stream_bugs_ndjson(
+        self,
+        status: str,
+        after_bug_id: int,
+        project_id: Optional[int] = None,
+        severity: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """
+        Stream every matching bug as NDJSON (one BugItem object per line)
+        
+        Rows are fetched with ``fetchmany`` and each batch is flushed as one
+        chunk, so memory use is bounded by the batch size.
+        """
+        sql_query, params = self._build_bug_list_query(status, after_bug_id, project_id, severity)
+        batch_size = self.settings.stream_batch_size
+        
+        for rows in self.db.iter_query(sql_query, tuple(params), batch_size=batch_size, as_tuples=True):
+            yield b"".join(to_json(self._bug_item_fields(row)) + b"\n" for row in rows)
+    
+    def stream_active_bugs(self, request) -> Iterator[bytes]:
+        """Stream all active bugs after the request cursor as NDJSON, ignoring limit"""
+        project_id, _, matched = self.projects.resolve_request(request)
+        if not matched:
+            return iter(())
+        return self._stream_bugs_ndjson('Active', request.after_bug_id, project_id, request.severity)
+    
+    def stream_bugs_by_status(self, request) -> Iterator[bytes]:
+        """Stream all bugs with the requested status after the cursor as NDJSON, ignoring limit"""
+        project_id, _, matched = self.projects.resolve_request(request)
+        if not matched:
+            return iter(())
+        return self._stream_bugs_ndjson(request.status, request.after_bug_id, project_id)
+    
+    def get_active_bugs(self, request) -> Dict[str, Any]:
+        """Get one page of active bugs with optional filters"""
+        from app.schemas.bug_schemas import GetActiveBugsResponse
+        
+        project_id, project_name, matched = self.projects.resolve_request(request)
+        
+        if matched:
+            bugs, next_cursor = self._fetch_bug_page(
+                'Active',
+                request.after_bug_id,
+                request.limit,
+                project_id=project_id,
+                severity=request.severity
+            )
+        else:
+            bugs, next_cursor = [], None
         
         return GetActiveBugsResponse(
             total_active_bugs=len(bugs),
@@ -254,206 +294,382 @@ class BugService:
                 "project_name": request.project_name,
                 "severity": request.severity
             },
-            project_id=project_id_result,
-            project_name=project_name_result
+            project_id=str(project_id) if project_id is not None else request.project_id,
+            project_name=project_name if matched else request.project_name,
+            next_cursor=next_cursor
         )
     
     def get_bugs_by_status(self, request) -> Dict[str, Any]:
-        """Get bugs filtered by status"""
-        from app.schemas.bug_schemas import GetBugsByStatusResponse, BugItem
-        
-        # Get project details if filtered
-        project_id_result = None
-        project_name_result = None
-        
-        if request.project_id or request.project_name:
-            if request.project_id:
-                project_query = "SELECT ProjectId, ProjectName FROM Projects WHERE ProjectId = ?"
-                project_params = (request.project_id,)
-            else:
-                project_query = "SELECT ProjectId, ProjectName FROM Projects WHERE ProjectName = ?"
-                project_params = (request.project_name,)
-            
-            project_info = self.db.execute_query(project_query, project_params)
-            if project_info:
-                project_id_result = str(project_info[0]['ProjectId'])
-                project_name_result = project_info[0]['ProjectName']
-        
-        sql_query = """
-            SELECT 
-                b.BugId, b.AzureBugId, w.Title, b.Severity, b.Status,
-                w.CreatedDate, b.Notes
-            FROM Bugs b
-            LEFT JOIN WorkItems w ON b.WorkItemId = w.WorkItemId
-            LEFT JOIN Projects p ON w.ProjectId = p.ProjectId
-            WHERE b.Status = ?
-        """
-        
-        params = [request.status]
-        
-        if request.project_id:
-            sql_query += " AND p.ProjectId = ?"
-            params.append(request.project_id)
-        elif request.project_name:
-            sql_query += " AND p.ProjectName = ?"
-            params.append(request.project_name)
-        
-        sql_query += f" LIMIT {request.limit}"
-        
-        results = self.db.execute_query(sql_query, tuple(params))
-        
-        bugs = []
-        for row in results:
-            bugs.append(BugItem(
-                bug_id=row['BugId'],
-                azure_bug_id=row['AzureBugId'],
-                title=row.get('Title', 'N/A'),
-                severity=row.get('Severity'),
-                status=row['Status'],
-                created_date=str(row.get('CreatedDate')) if row.get('CreatedDate') else None,
-                notes=row.get('Notes')
-            ))
+        """Get one page of bugs filtered by status"""
+        from app.schemas.bug_schemas import GetBugsByStatusResponse
+        
+        project_id, project_name, matched = self.projects.resolve_request(request)
+        
+        if matched:
+            bugs, next_cursor = self._fetch_bug_page(
+                request.status,
+                request.after_bug_id,
+                request.limit,
+                project_id=project_id
+            )
+        else:
+            bugs, next_cursor = [], None
         
         return GetBugsByStatusResponse(
             status=request.status,
             total_count=len(bugs),
             bugs=bugs,
-            project_id=project_id_result,
-            project_name=project_name_result
+            project_id=str(project_id) if project_id is not None else request.project_id,
+            project_name=project_name if matched else request.project_name,
+            next_cursor=next_cursor
         )
     
     def get_bug_statistics(self, request) -> Dict[str, Any]:
-        """Get comprehensive bug statistics"""
-        from app.schemas.bug_schemas import GetBugStatisticsResponse, BugStatistics
-        
-        # Get project details if filtered
-        project_id_result = None
-        project_name_result = None
-        
-        if request.project_id or request.project_name:
-            if request.project_id:
-                project_query = "SELECT ProjectId, ProjectName FROM Projects WHERE ProjectId = ?"
-                project_params = (request.project_id,)
-            else:
-                project_query = "SELECT ProjectId, ProjectName FROM Projects WHERE ProjectName = ?"
-                project_params = (request.project_name,)
-            
-            project_info = self.db.execute_query(project_query, project_params)
-            if project_info:
-                project_id_result = str(project_info[0]['ProjectId'])
-                project_name_result = project_info[0]['ProjectName']
-        
-        # Total bugs by status
-        status_query = """
-            SELECT Status, COUNT(*) as Count
-            FROM Bugs
-            GROUP BY Status
         """
+        Get comprehensive bug statistics
         
-        if request.project_id:
-            status_query = """
-                SELECT b.Status, COUNT(*) as Count
-                FROM Bugs b
-                LEFT JOIN WorkItems w ON b.WorkItemId = w.WorkItemId
-                LEFT JOIN Projects p ON w.ProjectId = p.ProjectId
-                WHERE p.ProjectId = ?
-                GROUP BY b.Status
-            """
-        elif request.project_name:
-            status_query = """
-                SELECT b.Status, COUNT(*) as Count
-                FROM Bugs b
-                LEFT JOIN WorkItems w ON b.WorkItemId = w.WorkItemId
-                LEFT JOIN Projects p ON w.ProjectId = p.ProjectId
-                WHERE p.ProjectName = ?
-                GROUP BY b.Status
-            """
+        All counts come from a single grouped scan of Bugs (joined once to
+        WorkItems), so they are read from one snapshot and always agree with
+        each other. Totals, severity and per-project figures are rolled up
+        from the (project, status, severity) groups in memory.
+        """
+        from app.schemas.bug_schemas import GetBugStatisticsResponse, BugStatistics, ProjectBugBreakdown
         
-        if request.project_id:
-            status_results = self.db.execute_query(status_query, (request.project_id,))
-        elif request.project_name:
-            status_results = self.db.execute_query(status_query, (request.project_name,))
-        else:
-            status_results = self.db.execute_query(status_query)
+        project_id, project_name, matched = self.projects.resolve_request(request)
+        
+        sql_query = """
+            SELECT w.ProjectId, b.Status, b.Severity, COUNT(*) as Count
+            FROM Bugs b
+            LEFT JOIN WorkItems w ON b.WorkItemId = w.WorkItemId
+        """
+        params = None
+        if project_id is not None:
+            sql_query += " WHERE w.ProjectId = ?"
+            params = (project_id,)
+        sql_query += " GROUP BY w.ProjectId, b.Status, b.Severity"
+        
+        results = self.db.execute_query(sql_query, params) if matched else []
         
         total_bugs = 0
-        active_bugs = 0
-        closed_bugs = 0
-        new_bugs = 0
+        by_status: Dict[str, int] = {}
+        by_severity: Dict[str, int] = {}
+        projects: Dict[int, Dict[str, Any]] = {}
         
-        for row in status_results:
+        for row in results:
             count = row['Count']
+            status_key = row['Status']
+            severity = row['Severity']
             total_bugs += count
-            if row['Status'] == 'Active':
-                active_bugs = count
-            elif row['Status'] == 'Closed':
-                closed_bugs = count
-            elif row['Status'] == 'New':
-                new_bugs = count
-        
-        # By severity
-        severity_query = """
-            SELECT Severity, COUNT(*) as Count
-            FROM Bugs
-            WHERE Severity IS NOT NULL
-            GROUP BY Severity
-        """
-        
-        if request.project_id:
-            severity_query = """
-                SELECT b.Severity, COUNT(*) as Count
-                FROM Bugs b
-                LEFT JOIN WorkItems w ON b.WorkItemId = w.WorkItemId
-                LEFT JOIN Projects p ON w.ProjectId = p.ProjectId
-                WHERE p.ProjectId = ? AND b.Severity IS NOT NULL
-                GROUP BY b.Severity
-            """
-        elif request.project_name:
-            severity_query = """
-                SELECT b.Severity, COUNT(*) as Count
-                FROM Bugs b
-                LEFT JOIN WorkItems w ON b.WorkItemId = w.WorkItemId
-                LEFT JOIN Projects p ON w.ProjectId = p.ProjectId
-                WHERE p.ProjectName = ? AND b.Severity IS NOT NULL
-                GROUP BY b.Severity
-            """
-        
-        if request.project_id:
-            severity_results = self.db.execute_query(severity_query, (request.project_id,))
-        elif request.project_name:
-            severity_results = self.db.execute_query(severity_query, (request.project_name,))
+            by_status[status_key] = by_status.get(status_key, 0) + count
+            if severity is not None:
+                by_severity[severity] = by_severity.get(severity, 0) + count
+            
+            if row['ProjectId'] is None:
+                continue  # Bug without a work item belongs to no project
+            project = projects.setdefault(row['ProjectId'], {"total": 0, "by_status": {}, "matrix": {}})
+            project["total"] += count
+            project["by_status"][status_key] = project["by_status"].get(status_key, 0) + count
+            cell = project["matrix"].setdefault(status_key, {})
+            severity_key = severity if severity is not None else "Unspecified"
+            cell[severity_key] = cell.get(severity_key, 0) + count
+        
+        # Every project in scope is listed, including those without bugs
+        if project_id is not None:
+            scope = {project_id: project_name}
+        elif matched:
+            scope = self.projects.all()
         else:
-            severity_results = self.db.execute_query(severity_query)
-        by_severity = {row['Severity']: row['Count'] for row in severity_results}
-        
-        # By project
-        project_query = """
-            SELECT p.ProjectName, COUNT(b.BugId) as BugCount
-            FROM Projects p
-            LEFT JOIN WorkItems w ON p.ProjectId = w.ProjectId
-            LEFT JOIN Bugs b ON w.WorkItemId = b.WorkItemId
-            GROUP BY p.ProjectName
-            ORDER BY BugCount DESC
-        """
-        
-        project_results = self.db.execute_query(project_query)
-        by_project = [{"project": row['ProjectName'], "count": row['BugCount']} for row in project_results]
+            scope = {}
+        
+        breakdown = [
+            ProjectBugBreakdown(
+                project_id=pid,
+                project=name,
+                total=projects.get(pid, {}).get("total", 0),
+                by_status=projects.get(pid, {}).get("by_status", {}),
+                by_status_severity=projects.get(pid, {}).get("matrix", {})
+            )
+            for pid, name in scope.items()
+        ]
+        breakdown.sort(key=lambda item: (-item.total, item.project))
+        by_project = [{"project": item.project, "count": item.total} for item in breakdown]
         
         statistics = BugStatistics(
             total_bugs=total_bugs,
-            active_bugs=active_bugs,
-            closed_bugs=closed_bugs,
-            new_bugs=new_bugs,
+            active_bugs=by_status.get('Active', 0),
+            closed_bugs=by_status.get('Closed', 0),
+            new_bugs=by_status.get('New', 0),
             by_severity=by_severity,
-            by_project=by_project
+            by_project=by_project,
+            by_project_breakdown=breakdown
         )
         
         return GetBugStatisticsResponse(
             statistics=statistics,
             generated_at=datetime.now().isoformat(),
-            project_id=project_id_result,
-            project_name=project_name_result
+            project_id=str(project_id) if project_id is not None else request.project_id,
+            project_name=project_name if matched else request.project_name
+        )
+    
+    def get_time_to_fix(self, request) -> Dict[str, Any]:
+        """
+        Time-to-fix (or time-to-verify) percentiles, histogram and breakdowns
+        
+        Reads the pre-built per (project, day, severity) sketches of the
+        period summed per bucket, then merges them in memory into the
+        overall, per-severity and per-project distributions; no individual
+        durations are sorted.
+        
+        Args:
+            request: GetTimeToFixRequest with metric, period and filters
+        
+        Returns:
+            GetTimeToFixResponse with the merged distributions
+        """
+        from app.schemas.bug_schemas import GetTimeToFixResponse
+        from app.services.cycle_time import RELATIVE_ACCURACY
+        
+        end_date = date.today()
+        start_date = end_date - timedelta(days=request.days_back)
+        project_id, project_name, matched = self.projects.resolve_request(request)
+        
+        sql_query = """
+            SELECT ProjectId, Severity, Bucket, SUM(Count) AS Count
+            FROM BugCycleTimeSketches
+            WHERE Metric = ? AND Day >= ? AND Day <= ?
+        """
+        params: List[Any] = [request.metric, start_date.isoformat(), end_date.isoformat()]
+        if project_id is not None:
+            sql_query += " AND ProjectId = ?"
+            params.append(project_id)
+        if request.severity:
+            sql_query += " AND Severity = ?"
+            params.append(request.severity)
+        sql_query += " GROUP BY ProjectId, Severity, Bucket"
+        
+        results = self.db.execute_query(sql_query, tuple(params), as_tuples=True) if matched else []
+        
+        overall = self.cycle_times.sketch()
+        by_severity: Dict[str, Any] = {}
+        by_project: Dict[int, Any] = {}
+        for row_project, severity, bucket, count in results:
+            overall.add(bucket, count)
+            for groups, key in ((by_severity, severity), (by_project, row_project)):
+                sketch = groups.get(key)
+                if sketch is None:
+                    sketch = groups[key] = self.cycle_times.sketch()
+                sketch.add(bucket, count)
+        
+        logger.debug("Time to %s: %s bugs from %s sketch rows", request.metric, overall.total, len(results))
+        
+        return GetTimeToFixResponse(
+            metric=request.metric,
+            period_start=start_date.isoformat(),
+            period_end=end_date.isoformat(),
+            overall=overall.summary(),
+            histogram=overall.histogram(),
+            by_severity=[
+                {"severity": severity, **sketch.summary()} for severity, sketch in sorted(by_severity.items())
+            ],
+            by_project=[
+                {"project_id": pid, "project": self.projects.get_name(pid), **sketch.summary()}
+                for pid, sketch in sorted(by_project.items())
+            ],
+            relative_accuracy=round(RELATIVE_ACCURACY, 4),
+            project_id=str(project_id) if project_id is not None else request.project_id,
+            project_name=project_name if matched else request.project_name
         )
+    
+    def search_bugs(self, request) -> Dict[str, Any]:
+        """
+        Full-text search over bug titles, notes and tags, most relevant first
+        
+        Matches come from the BugSearch FTS5 index ranked by BM25, so only
+        the requested page of matching bugs is read.
+        
+        Args:
+            request: SearchBugsRequest with the query, filters and page
+        
+        Returns:
+            SearchBugsResponse with the ranked page and total match count
+        """
+        from app.schemas.bug_schemas import SearchBugsResponse, encode_cursor, SEARCH_CURSOR_PREFIX
+        
+        project_id, project_name, matched = self.projects.resolve_request(request)
+        match_query = build_match_query(request.query, match_all=request.match == "all")
+        
+        bugs: List[Dict[str, Any]] = []
+        total_matches = 0
+        next_cursor = None
+        if matched and match_query:
+            # Setting the rank function lets FTS5 hand rows back already in
+            # BM25 order, so no sort step is needed for ORDER BY rank
+            weights = ", ".join(str(weight) for weight in RANK_WEIGHTS)
+            conditions = ["BugSearch MATCH ?", "BugSearch.rank MATCH ?"]
+            params: List[Any] = [match_query, f"bm25({weights})"]
+            if request.status:
+                conditions.append("b.Status = ?")
+                params.append(request.status)
+            if project_id is not None:
+                conditions.append("w.ProjectId = ?")
+                params.append(project_id)
+            where = " AND ".join(conditions)
+            
+            from_clause = f"""
+                FROM BugSearch
+                JOIN Bugs b ON b.BugId = BugSearch.rowid
+                LEFT JOIN WorkItems w ON b.WorkItemId = w.WorkItemId
+                WHERE {where}
+            """
+            sql_query = f"""
+                SELECT
+                    b.BugId,
+                    b.AzureBugId,
+                    COALESCE(w.Title, 'N/A') AS Title,
+                    b.Severity,
+                    b.Status,
+                    w.CreatedDate,
+                    b.Notes,
+                    BugSearch.rank AS Rank,
+                    snippet(BugSearch, -1, '[', ']', '...', 12) AS Snippet
+                {from_clause}
+                ORDER BY BugSearch.rank
+                LIMIT ? OFFSET ?
+            """
+            
+            rows = self.db.execute_query(sql_query, tuple(params + [request.limit, request.offset]), as_tuples=True)
+            total_matches = self.db.execute_query(f"SELECT COUNT(*) AS Matches {from_clause}", tuple(params))[0]['Matches']
+            bugs = [
+                {**self._bug_item_fields(row), "rank": round(row[7], 4), "snippet": row[8]}
+                for row in rows
+            ]
+            end = request.offset + len(bugs)
+            if end < total_matches:
+                next_cursor = encode_cursor(end, SEARCH_CURSOR_PREFIX)
+        
+        return SearchBugsResponse(
+            query=request.query,
+            total_matches=total_matches,
+            bugs=bugs,
+            filters_applied={
+                "status": request.status,
+                "project_id": request.project_id,
+                "project_name": request.project_name,
+                "match": request.match
+            },
+            project_id=str(project_id) if project_id is not None else request.project_id,
+            project_name=project_name if matched else request.project_name,
+            next_cursor=next_cursor
+        )
+    
+    def run_batch(self, actions: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Run several actions against one connection and one read snapshot
+        
+        The actions execute one after another inside a single read
+        transaction, so they all see the same data, and share one pooled
+        connection and project resolution cache. Invalid parameters or a
+        failing action only fail that entry.
+        
+        Args:
+            actions: List of BatchAction (action name + params)
+        
+        Returns:
+            List of BatchActionResult fields, in request order
+        """
+        from pydantic import BaseModel, ValidationError
+        from app.services.response_shape import shape_response
+        from app.schemas.bug_schemas import (
+            GetBugTrendsRequest, GetActiveBugsRequest, GetBugsByStatusRequest, GetBugStatisticsRequest,
+            GetTimeToFixRequest, SearchBugsRequest
+        )
+        
+        handlers = {
+            "get_bug_fix_trends": (GetBugFixTrendsRequest, self.get_bug_fix_trends),
+            "get_bug_trends": (GetBugTrendsRequest, self.get_bug_trends),
+            "get_active_bugs": (GetActiveBugsRequest, self.get_active_bugs),
+            "get_bugs_by_status": (GetBugsByStatusRequest, self.get_bugs_by_status),
+            "get_bug_statistics": (GetBugStatisticsRequest, self.get_bug_statistics),
+            "get_time_to_fix": (GetTimeToFixRequest, self.get_time_to_fix),
+            "search_bugs": (SearchBugsRequest, self.search_bugs),
+        }
+        
+        results = []
+        with self.db.read_snapshot():
+            for invocation in actions:
+                request_model, handler = handlers[invocation.action]
+                try:
+                    request = request_model.model_validate(invocation.params)
+                except ValidationError as e:
+                    results.append({
+                        "action": invocation.action,
+                        "status_code": 422,
+                        "error": e.errors(include_url=False, include_context=False)
+                    })
+                    continue
+                
+                try:
+                    response = shape_response(handler(request), request)
+                    if isinstance(response, BaseModel):
+                        response = response.model_dump(mode="json")
+                    results.append({
+                        "action": invocation.action,
+                        "status_code": 200,
+                        "result": response
+                    })
+                except Exception as e:
+                    logger.error("Batch action %s failed: %s", invocation.action, e, exc_info=True)
+                    results.append({
+                        "action": invocation.action,
+                        "status_code": 500,
+                        "error": str(e)
+                    })
+        
+        logger.debug("Batch of %s actions complete", len(actions))
+        return results
+    
+    # Async variants: run the blocking implementations on the database
+    # worker pool so the event loop keeps serving other requests.
+    
+    async def get_bug_fix_trends_async(self, request: GetBugFixTrendsRequest) -> GetBugFixTrendsResponse:
+        """Async variant of get_bug_fix_trends"""
+        return await self.db.run_async(self.get_bug_fix_trends, request)
+    
+    async def get_bug_trends_async(self, request) -> Dict[str, Any]:
+        """Async variant of get_bug_trends"""
+        return await self.db.run_async(self.get_bug_trends, request)
+    
+    async def get_active_bugs_async(self, request) -> Dict[str, Any]:
+        """Async variant of get_active_bugs"""
+        return await self.db.run_async(self.get_active_bugs, request)
+    
+    async def get_bugs_by_status_async(self, request) -> Dict[str, Any]:
+        """Async variant of get_bugs_by_status"""
+        return await self.db.run_async(self.get_bugs_by_status, request)
+    
+    async def stream_active_bugs_async(self, request) -> Iterator[bytes]:
+        """Async variant of stream_active_bugs (resolves filters off the event loop)"""
+        return await self.db.run_async(self.stream_active_bugs, request)
+    
+    async def stream_bugs_by_status_async(self, request) -> Iterator[bytes]:
+        """Async variant of stream_bugs_by_status (resolves filters off the event loop)"""
+        return await self.db.run_async(self.stream_bugs_by_status, request)
+    
+    async def get_bug_statistics_async(self, request) -> Dict[str, Any]:
+        """Async variant of get_bug_statistics"""
+        return await self.db.run_async(self.get_bug_statistics, request)
+    
+    async def get_time_to_fix_async(self, request) -> Dict[str, Any]:
+        """Async variant of get_time_to_fix"""
+        return await self.db.run_async(self.get_time_to_fix, request)
+    
+    async def search_bugs_async(self, request) -> Dict[str, Any]:
+        """Async variant of search_bugs"""
+        return await self.db.run_async(self.search_bugs, request)
+    
+    async def run_batch_async(self, actions: List[Any]) -> List[Dict[str, Any]]:
+        """Async variant of run_batch (the whole batch runs in one worker call)"""
+        return await self.db.run_async(self.run_batch, actions)
 
 
 # Singleton instance
@@ -0,0 +1,190 @@
+"""
+Business logic for commit activity and bug-to-commit analytics
+"""
+import logging
+from datetime import date, timedelta
+from typing import Optional, List, Dict, Any
+from app.replica import read_db
+from app.services.project_catalog import project_catalog
+from app.services.trend_engine import bucket_start, bucket_count, shift_buckets
+
+logger = logging.getLogger(__name__)
+
+
+# Bound parameters per IN-list query (below SQLite's historic 999 limit)
+IN_LIST_BATCH = 500
+
+# granularity -> bucket start of a commit, the calendar buckets of
+# trend_engine.BUCKETS applied in a single DATE() call per row
+COMMIT_BUCKETS = {
+    "day": "DATE(CommitDate)",
+    "week": "DATE(CommitDate, 'weekday 0', '-6 days')",
+    "month": "DATE(CommitDate, 'start of month')",
+}
+
+# group_by -> Commits column the series are keyed on
+ACTIVITY_COLUMNS = {"author": "Author", "branch": "Branch"}
+
+FIX_COMMITS_SQL = """
+    SELECT b.BugId, b.AzureBugId, b.WorkItemId, b.Status,
+        c.CommitId, c.AzureCommitId, c.Author, c.CommitDate, c.Branch, c.Comment
+    FROM Bugs b
+    LEFT JOIN Commits c ON c.AssociatedWorkItemId = b.WorkItemId
+    WHERE b.BugId IN ({placeholders})
+    ORDER BY b.BugId, c.CommitDate, c.CommitId
+"""
+
+
+def batches(values: List[Any], size: int = IN_LIST_BATCH):
+    """Split ``values`` into consecutive lists of at most ``size`` items"""
+    for offset in range(0, len(values), size):
+        yield values[offset:offset + size]
+
+
+class CommitService:
+    """Service class for commit analytics"""
+    
+    def __init__(self):
+        self.db = read_db
+        self.projects = project_catalog
+    
+    def get_commit_activity(self, request) -> Dict[str, Any]:
+        """
+        Commit counts per author or branch in calendar buckets
+        
+        One grouped query over the CommitDate range (served by the commit
+        date indexes) returns the count per (bucket, author or branch); the
+        most active ones are then laid out as dense series over every
+        bucket of the period.
+        
+        Args:
+            request: GetCommitActivityRequest with grouping, period and filter
+        
+        Returns:
+            GetCommitActivityResponse with one series per author or branch
+        """
+        from app.schemas.commit_schemas import GetCommitActivityResponse
+        
+        end_date = date.today()
+        start_date = bucket_start(end_date - timedelta(days=request.days_back), request.granularity)
+        bucket_starts = [
+            shift_buckets(start_date, request.granularity, index).isoformat()
+            for index in range(bucket_count(start_date, end_date, request.granularity))
+        ]
+        project_id, project_name, matched = self.projects.resolve_request(request)
+        
+        sql_query = f"""
+            SELECT {COMMIT_BUCKETS[request.granularity]} AS BucketStart, {ACTIVITY_COLUMNS[request.group_by]} AS Name,
+                COUNT(*) AS Commits
+            FROM Commits
+            WHERE CommitDate >= ? AND CommitDate < ?
+        """
+        params: List[Any] = [start_date.isoformat(), (end_date + timedelta(days=1)).isoformat()]
+        if project_id is not None:
+            sql_query += " AND ProjectId = ?"
+            params.append(project_id)
+        sql_query += " GROUP BY BucketStart, Name"
+        
+        results = self.db.execute_query(sql_query, tuple(params), as_tuples=True) if matched else []
+        
+        positions = {start: index for index, start in enumerate(bucket_starts)}
+        counts: Dict[Optional[str], List[int]] = {}
+        outside = 0
+        for row_bucket, name, commits in results:
+            # The range filter compares the raw CommitDate text; DATE() may
+            # still move a value with a UTC offset past the period, or return
+            # NULL for one it cannot parse
+            position = positions.get(row_bucket)
+            if position is None:
+                outside += commits
+                continue
+            series = counts.get(name)
+            if series is None:
+                series = counts[name] = [0] * len(bucket_starts)
+            series[position] += commits
+        if outside:
+            logger.warning("Commit activity: skipped %s commits with dates outside the buckets", outside)
+        
+        totals = sorted(((sum(series), name) for name, series in counts.items()), key=lambda item: -item[0])
+        total_commits = sum(total for total, _ in totals)
+        top = totals[:request.top]
+        
+        logger.debug("Commit activity by %s: %s commits, %s series", request.group_by, total_commits, len(counts))
+        
+        return GetCommitActivityResponse(
+            group_by=request.group_by,
+            granularity=request.granularity,
+            period_start=start_date.isoformat(),
+            period_end=end_date.isoformat(),
+            bucket_starts=bucket_starts,
+            total_commits=total_commits,
+            series=[{"name": name, "total_commits": total, "counts": counts[name]} for total, name in top],
+            other_commits=total_commits - sum(total for total, _ in top),
+            project_id=str(project_id) if project_id is not None else request.project_id,
+            project_name=project_name if matched else request.project_name
+        )
+    
+    def get_fix_commits(self, request) -> Dict[str, Any]:
+        """
+        Commits associated with the work items of a set of bugs
+        
+        Bugs and their commits are joined in SQL, IN_LIST_BATCH BugIds per
+        query, all within one read snapshot; the number of queries grows
+        with the batches, not with the number of bugs.
+        
+        Args:
+            request: GetFixCommitsRequest with the BugIds
+        
+        Returns:
+            GetFixCommitsResponse with every found bug and its commits
+        """
+        from app.schemas.commit_schemas import GetFixCommitsResponse
+        
+        bug_ids = sorted(set(request.bug_ids))
+        bugs: List[Dict[str, Any]] = []
+        total_commits = 0
+        with self.db.read_snapshot():
+            for batch in batches(bug_ids):
+                query = FIX_COMMITS_SQL.format(placeholders=", ".join("?" for _ in batch))
+                for row in self.db.execute_query(query, tuple(batch), as_tuples=True):
+                    bug_id, azure_bug_id, work_item_id, status, commit_id = row[:5]
+                    if not bugs or bugs[-1]["bug_id"] != bug_id:
+                        bugs.append({
+                            "bug_id": bug_id,
+                            "azure_bug_id": azure_bug_id,
+                            "work_item_id": work_item_id,
+                            "status": status,
+                            "commits": []
+                        })
+                    if commit_id is not None:
+                        azure_commit_id, author, commit_date, branch, comment = row[5:]
+                        bugs[-1]["commits"].append({
+                            "commit_id": commit_id,
+                            "azure_commit_id": azure_commit_id,
+                            "author": author,
+                            "commit_date": commit_date,
+                            "branch": branch,
+                            "comment": comment
+                        })
+                        total_commits += 1
+        
+        found = {bug["bug_id"] for bug in bugs}
+        logger.debug("Fix commits: %s of %s bugs found, %s commits", len(found), len(bug_ids), total_commits)
+        
+        return GetFixCommitsResponse(
+            bugs=bugs,
+            missing_bug_ids=[bug_id for bug_id in bug_ids if bug_id not in found],
+            total_commits=total_commits
+        )
+    
+    async def get_commit_activity_async(self, request) -> Dict[str, Any]:
+        """Async variant of get_commit_activity"""
+        return await self.db.run_async(self.get_commit_activity, request)
+    
+    async def get_fix_commits_async(self, request) -> Dict[str, Any]:
+        """Async variant of get_fix_commits"""
+        return await self.db.run_async(self.get_fix_commits, request)
+
+
+# Singleton instance
+commit_service = CommitService()
@@ -0,0 +1,209 @@
+"""
+Mergeable time-to-fix sketches kept per project, day and severity by triggers on Bugs
+"""
+import logging
+import threading
+from typing import Optional, List, Dict, Any, Tuple
+from app.database import db_manager
+from app.migrations import EXPECTED_SKETCH_SQL, SKETCH_GROWTH
+
+logger = logging.getLogger(__name__)
+
+
+# (exclusive upper bound in hours, label); the last bin is open-ended
+HISTOGRAM_BINS = (
+    (1, "< 1h"),
+    (4, "1-4h"),
+    (24, "4-24h"),
+    (72, "1-3d"),
+    (168, "3-7d"),
+    (336, "1-2w"),
+    (720, "2-4w"),
+    (2160, "1-3mo"),
+    (None, "> 3mo"),
+)
+
+# Worst-case relative error of a bucket's representative value
+RELATIVE_ACCURACY = (SKETCH_GROWTH - 1) / (SKETCH_GROWTH + 1)
+
+
+class DurationSketch:
+    """
+    Log-bucketed histogram of durations
+    
+    Buckets are the fixed CycleTimeBounds ranges, so two sketches merge by
+    adding their counts and quantiles stay within RELATIVE_ACCURACY of the
+    exact value however many sketches were combined.
+    """
+    
+    def __init__(self, bounds: Dict[int, Tuple[float, float]]):
+        self.bounds = bounds
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+    
+    def add(self, bucket: int, count: int = 1):
+        self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.total += count
+    
+    def merge(self, other: "DurationSketch"):
+        for bucket, count in other.counts.items():
+            self.add(bucket, count)
+    
+    def value(self, bucket: int) -> float:
+        """Representative duration of a bucket (harmonic mean of its bounds)"""
+        lower, upper = self.bounds[bucket]
+        return 2 * lower * upper / (lower + upper)
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Duration in hours below which a fraction ``q`` of the samples fall"""
+        if not self.total:
+            return None
+        rank = q * (self.total - 1)
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen > rank:
+                return self.value(bucket)
+        return self.value(max(self.counts))
+    
+    def mean(self) -> Optional[float]:
+        if not self.total:
+            return None
+        return sum(self.value(bucket) * count for bucket, count in self.counts.items()) / self.total
+    
+    def summary(self) -> Dict[str, Any]:
+        """Count, mean and p50/p90/p99 in hours, rounded for display"""
+        def hours(value: Optional[float]) -> Optional[float]:
+            return round(value, 2) if value is not None else None
+        
+        return {
+            "count": self.total,
+            "mean_hours": hours(self.mean()),
+            "p50_hours": hours(self.quantile(0.5)),
+            "p90_hours": hours(self.quantile(0.9)),
+            "p99_hours": hours(self.quantile(0.99))
+        }
+    
+    def histogram(self) -> List[Dict[str, Any]]:
+        """Counts per HISTOGRAM_BINS range (each bucket goes to the bin of its representative value)"""
+        counts = [0] * len(HISTOGRAM_BINS)
+        for bucket, count in self.counts.items():
+            value = self.value(bucket)
+            index = next(i for i, (upper, _) in enumerate(HISTOGRAM_BINS) if upper is None or value < upper)
+            counts[index] += count
+        bins = []
+        lower = 0
+        for (upper, label), count in zip(HISTOGRAM_BINS, counts):
+            bins.append({"label": label, "min_hours": lower, "max_hours": upper, "count": count})
+            lower = upper
+        return bins
+
+
+class CycleTimeSketches:
+    """
+    Manages the BugCycleTimeSketches table
+    
+    Every closed bug adds one sample per metric to the sketch of its
+    (project, fix day, severity); triggers on Bugs keep the counts current,
+    so any range of days or projects is answered by summing a few small
+    rows per bucket. Changes to a work item's CreatedDate or project are not
+    tracked; ``check(repair=True)`` rebuilds the table. The table and
+    triggers are created by schema migration 7.
+    """
+    
+    def __init__(self, db=None):
+        self.db = db or db_manager
+        self._bounds: Optional[Dict[int, Tuple[float, float]]] = None
+        self._lock = threading.Lock()
+    
+    def bounds(self) -> Dict[int, Tuple[float, float]]:
+        """Bucket -> (lower, upper) hours; fixed by the migration, so read once"""
+        if self._bounds is None:
+            with self._lock:
+                if self._bounds is None:
+                    rows = self.db.execute_query(
+                        "SELECT Bucket, LowerHours, UpperHours FROM CycleTimeBounds", as_tuples=True
+                    )
+                    self._bounds = {bucket: (lower, upper) for bucket, lower, upper in rows}
+        return self._bounds
+    
+    def sketch(self) -> DurationSketch:
+        """New empty sketch over the stored bucket bounds"""
+        return DurationSketch(self.bounds())
+    
+    def rebuild(self) -> int:
+        """
+        Recompute every sketch from Bugs in a single transaction
+        
+        Returns:
+            Number of sketch rows written
+        """
+        with self.db.get_connection() as conn:
+            try:
+                conn.execute("DELETE FROM BugCycleTimeSketches")
+                cursor = conn.execute(
+                    "INSERT INTO BugCycleTimeSketches (ProjectId, Metric, Day, Severity, Bucket, Count) "
+                    f"{EXPECTED_SKETCH_SQL}"
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        logger.info("BugCycleTimeSketches rebuilt with %s rows", cursor.rowcount)
+        return cursor.rowcount
+    
+    def diff(self) -> List[Dict[str, Any]]:
+        """
+        Compare the stored sketches with a fresh computation from Bugs
+        
+        Returns:
+            One entry per sketch row whose stored count differs from the
+            expected count; missing rows are reported with a count of 0
+        """
+        query = f"""
+            WITH expected AS ({EXPECTED_SKETCH_SQL})
+            SELECT e.ProjectId, e.Metric, e.Day, e.Severity, e.Bucket,
+                e.Count AS Expected, COALESCE(s.Count, 0) AS Actual
+            FROM expected e
+            LEFT JOIN BugCycleTimeSketches s
+                ON s.ProjectId = e.ProjectId AND s.Metric = e.Metric AND s.Day = e.Day
+                AND s.Severity = e.Severity AND s.Bucket = e.Bucket
+            WHERE COALESCE(s.Count, 0) != e.Count
+            UNION ALL
+            SELECT s.ProjectId, s.Metric, s.Day, s.Severity, s.Bucket, 0 AS Expected, s.Count AS Actual
+            FROM BugCycleTimeSketches s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM expected e
+                WHERE e.ProjectId = s.ProjectId AND e.Metric = s.Metric AND e.Day = s.Day
+                    AND e.Severity = s.Severity AND e.Bucket = s.Bucket
+            )
+            ORDER BY Day, ProjectId
+        """
+        return self.db.execute_query(query)
+    
+    def check(self, repair: bool = False) -> Dict[str, Any]:
+        """
+        Consistency check of the sketches against the raw Bugs table
+        
+        Args:
+            repair: Rebuild the sketches when drift is found
+        
+        Returns:
+            Dictionary with the mismatching rows and whether a rebuild ran
+        """
+        mismatches = self.diff()
+        repaired = False
+        if mismatches and repair:
+            self.rebuild()
+            repaired = True
+        if mismatches:
+            logger.warning("BugCycleTimeSketches has %s mismatching rows", len(mismatches))
+        return {
+            "consistent": not mismatches,
+            "mismatches": mismatches,
+            "repaired": repaired
+        }
+
+
+# Singleton instance
+cycle_time_sketches = CycleTimeSketches()
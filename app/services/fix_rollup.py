@@ -0,0 +1,95 @@
+"""
+Daily bug-fix rollup maintained incrementally by triggers on Bugs
+"""
+import logging
+from typing import List, Dict, Any
+from app.database import db_manager
+from app.migrations import EXPECTED_ROLLUP_SQL
+
+logger = logging.getLogger(__name__)
+
+
+class BugFixRollup:
+    """
+    Manages the BugDailyFixes rollup table
+    
+    Triggers keep the rollup current on every insert, update and delete of
+    Bugs, so trend queries read at most one small row per project and day.
+    Moving a work item to another project is not tracked by the triggers;
+    ``check(repair=True)`` rebuilds the table and reports any drift. The
+    table and triggers are created by schema migration 4.
+    """
+    
+    def __init__(self, db=None):
+        self.db = db or db_manager
+    
+    def rebuild(self) -> int:
+        """
+        Recompute the rollup from Bugs in a single transaction
+        
+        Returns:
+            Number of rollup rows written
+        """
+        with self.db.get_connection() as conn:
+            try:
+                conn.execute("DELETE FROM BugDailyFixes")
+                cursor = conn.execute(
+                    f"INSERT INTO BugDailyFixes (ProjectId, Day, FixedCount) {EXPECTED_ROLLUP_SQL}"
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        logger.info("BugDailyFixes rollup rebuilt with %s rows", cursor.rowcount)
+        return cursor.rowcount
+    
+    def diff(self) -> List[Dict[str, Any]]:
+        """
+        Compare the rollup with a fresh aggregation of Bugs
+        
+        Returns:
+            One entry per (ProjectId, Day) whose stored count differs from the
+            expected count; missing rows are reported with a count of 0
+        """
+        query = f"""
+            WITH expected AS ({EXPECTED_ROLLUP_SQL})
+            SELECT e.ProjectId, e.Day, e.FixedCount AS Expected, COALESCE(r.FixedCount, 0) AS Actual
+            FROM expected e
+            LEFT JOIN BugDailyFixes r ON r.ProjectId = e.ProjectId AND r.Day = e.Day
+            WHERE COALESCE(r.FixedCount, 0) != e.FixedCount
+            UNION ALL
+            SELECT r.ProjectId, r.Day, 0 AS Expected, r.FixedCount AS Actual
+            FROM BugDailyFixes r
+            WHERE NOT EXISTS (
+                SELECT 1 FROM expected e WHERE e.ProjectId = r.ProjectId AND e.Day = r.Day
+            )
+            ORDER BY Day, ProjectId
+        """
+        return self.db.execute_query(query)
+    
+    def check(self, repair: bool = False) -> Dict[str, Any]:
+        """
+        Consistency check of the rollup against the raw Bugs table
+        
+        Args:
+            repair: Rebuild the rollup when drift is found
+        
+        Returns:
+            Dictionary with the mismatching rows and whether a rebuild ran
+        """
+        mismatches = self.diff()
+        repaired = False
+        if mismatches and repair:
+            self.rebuild()
+            repaired = True
+        if mismatches:
+            logger.warning("BugDailyFixes rollup has %s mismatching rows", len(mismatches))
+        return {
+            "consistent": not mismatches,
+            "mismatches": mismatches,
+            "repaired": repaired
+        }
+
+
+# Singleton instance
+bug_fix_rollup = BugFixRollup()
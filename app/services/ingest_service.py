@@ -0,0 +1,210 @@
+"""
+Bulk upsert ingestion of Azure DevOps sync data
+"""
+import logging
+import sqlite3
+import time
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Tuple
+from app.database import db_manager
+from app.services.project_catalog import project_catalog
+from app.schemas.ingest_schemas import IngestRequest, IngestResponse, EntityIngestResult
+
+logger = logging.getLogger(__name__)
+
+
+# Upserts conflict on the natural keys added by schema migration 3
+UPSERT_PROJECT_SQL = """
+    INSERT INTO Projects (AzureProjectId, ProjectName, Description, IsActive, LastSync)
+    VALUES (:azure_project_id, :project_name, :description, :is_active, CURRENT_TIMESTAMP)
+    ON CONFLICT (AzureProjectId) DO UPDATE SET
+        ProjectName = excluded.ProjectName,
+        Description = excluded.Description,
+        IsActive = excluded.IsActive,
+        LastSync = excluded.LastSync
+"""
+
+# Rows whose project is unknown select nothing and are counted as skipped
+UPSERT_WORK_ITEM_SQL = """
+    INSERT INTO WorkItems (
+        AzureWorkItemId, ProjectId, Title, WorkItemType, State, AssignedTo,
+        CreatedDate, ChangedDate, ClosedDate, Priority, IterationPath, AreaPath, Tags, LastSync
+    )
+    SELECT
+        :azure_work_item_id, p.ProjectId, :title, :work_item_type, :state, :assigned_to,
+        :created_date, :changed_date, :closed_date, :priority, :iteration_path, :area_path, :tags,
+        CURRENT_TIMESTAMP
+    FROM Projects p
+    WHERE p.AzureProjectId = :azure_project_id
+    ON CONFLICT (AzureWorkItemId) DO UPDATE SET
+        ProjectId = excluded.ProjectId,
+        Title = excluded.Title,
+        WorkItemType = excluded.WorkItemType,
+        State = excluded.State,
+        AssignedTo = excluded.AssignedTo,
+        CreatedDate = excluded.CreatedDate,
+        ChangedDate = excluded.ChangedDate,
+        ClosedDate = excluded.ClosedDate,
+        Priority = excluded.Priority,
+        IterationPath = excluded.IterationPath,
+        AreaPath = excluded.AreaPath,
+        Tags = excluded.Tags,
+        LastSync = excluded.LastSync
+"""
+
+UPSERT_BUG_SQL = """
+    INSERT INTO Bugs (
+        WorkItemId, AzureBugId, Severity, Resolution, FixedBy, FixedDate,
+        VerifiedBy, VerifiedDate, Status, Notes, LastSync
+    )
+    VALUES (
+        (SELECT WorkItemId FROM WorkItems WHERE AzureWorkItemId = :azure_work_item_id),
+        :azure_bug_id, :severity, :resolution, :fixed_by, :fixed_date,
+        :verified_by, :verified_date, :status, :notes, CURRENT_TIMESTAMP
+    )
+    ON CONFLICT (AzureBugId) DO UPDATE SET
+        WorkItemId = excluded.WorkItemId,
+        Severity = excluded.Severity,
+        Resolution = excluded.Resolution,
+        FixedBy = excluded.FixedBy,
+        FixedDate = excluded.FixedDate,
+        VerifiedBy = excluded.VerifiedBy,
+        VerifiedDate = excluded.VerifiedDate,
+        Status = excluded.Status,
+        Notes = excluded.Notes,
+        LastSync = excluded.LastSync
+"""
+
+SYNC_LOG_SQL = """
+    INSERT INTO SyncLog (Source, EntityType, RecordsFetched, RecordsUpdated, DurationSeconds, IsSuccess, ErrorMessage)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _db_value(value: Any) -> Any:
+    """Convert a record value to the representation stored by the seed data"""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+def _rows(records: List[Any]) -> List[Dict[str, Any]]:
+    return [{key: _db_value(value) for key, value in record.model_dump().items()} for record in records]
+
+
+class IngestService:
+    """
+    Upserts batches of projects, work items and bugs keyed on their Azure ids
+    
+    A whole batch is written with ``executemany`` inside one transaction, so
+    it either lands completely or not at all. Every batch leaves one SyncLog
+    row per entity type with its size and duration.
+    """
+    
+    def __init__(self, db=None):
+        self.db = db or db_manager
+        self.projects = project_catalog
+    
+    def apply(self, conn: sqlite3.Connection, request: IngestRequest) -> Tuple[List[EntityIngestResult], List[float]]:
+        """
+        Write a batch on the caller's connection without committing
+        
+        Projects are written first, then work items, then bugs, so a batch
+        may reference parents it introduces itself.
+        
+        Args:
+            conn: Connection whose open transaction receives the rows
+            request: IngestRequest with the records to write
+        
+        Returns:
+            Tuple of (per-entity results, per-entity seconds spent)
+        """
+        steps: List[Tuple[str, str, List[Any]]] = [
+            ("Project", UPSERT_PROJECT_SQL, request.projects),
+            ("WorkItem", UPSERT_WORK_ITEM_SQL, request.work_items),
+            ("Bug", UPSERT_BUG_SQL, request.bugs),
+        ]
+        
+        results: List[EntityIngestResult] = []
+        timings: List[float] = []
+        for entity_type, sql, records in steps:
+            if not records:
+                continue
+            step_started = time.perf_counter()
+            cursor = conn.executemany(sql, _rows(records))
+            upserted = max(cursor.rowcount, 0)
+            timings.append(time.perf_counter() - step_started)
+            results.append(EntityIngestResult(
+                entity_type=entity_type,
+                records_received=len(records),
+                records_upserted=upserted,
+                records_skipped=len(records) - upserted
+            ))
+        return results, timings
+    
+    def upsert(self, request: IngestRequest) -> IngestResponse:
+        """
+        Upsert one batch of sync data in a single transaction
+        
+        Args:
+            request: IngestRequest with the records to write
+        
+        Returns:
+            IngestResponse with per-entity counts and throughput
+        """
+        started = time.perf_counter()
+        with self.db.get_connection() as conn:
+            try:
+                results, timings = self.apply(conn, request)
+                conn.executemany(SYNC_LOG_SQL, [
+                    (request.source, result.entity_type, result.records_received,
+                     result.records_upserted, round(elapsed, 3), 1, None)
+                    for result, elapsed in zip(results, timings)
+                ])
+                conn.commit()
+            except sqlite3.Error as e:
+                conn.rollback()
+                logger.error("Bulk upsert failed: %s", e)
+                self._log_failure(conn, request, str(e))
+                raise
+        
+        duration = time.perf_counter() - started
+        if request.projects:
+            self.projects.invalidate()
+        
+        total = sum(result.records_upserted for result in results)
+        logger.info("Bulk upsert of %s rows complete in %.3fs", total, duration)
+        return IngestResponse(
+            results=results,
+            duration_ms=round(duration * 1000, 3),
+            rows_per_second=round(total / duration, 1) if duration > 0 else 0.0
+        )
+    
+    def _log_failure(self, conn: sqlite3.Connection, request: IngestRequest, error: str):
+        """Record a failed batch in SyncLog (best effort)"""
+        received = [
+            ("Project", len(request.projects)),
+            ("WorkItem", len(request.work_items)),
+            ("Bug", len(request.bugs)),
+        ]
+        try:
+            conn.executemany(SYNC_LOG_SQL, [
+                (request.source, entity_type, count, 0, 0, 0, error)
+                for entity_type, count in received if count
+            ])
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.warning("Could not record failed sync in SyncLog: %s", e)
+    
+    async def upsert_async(self, request: IngestRequest) -> IngestResponse:
+        """Async variant of upsert"""
+        return await self.db.run_async(self.upsert, request)
+
+
+# Singleton instance
+ingest_service = IngestService()
@@ -0,0 +1,177 @@
+"""
+Business logic for pipeline run analytics
+"""
+import logging
+from datetime import date, timedelta
+from typing import Optional, List, Dict, Any, Tuple
+from app.replica import read_db
+from app.services.project_catalog import project_catalog
+from app.services.cycle_time import cycle_time_sketches, DurationSketch, RELATIVE_ACCURACY
+
+logger = logging.getLogger(__name__)
+
+
+class RunStats:
+    """
+    Run outcomes and a duration sketch of a group of pipeline runs
+    
+    Durations land in the same CycleTimeBounds buckets as the time-to-fix
+    sketches (in hours), so groups merge by adding counts. Runs without a
+    duration (bucket -1) count towards the outcomes only.
+    """
+    
+    def __init__(self, sketch: DurationSketch):
+        self.sketch = sketch
+        self.statuses: Dict[str, int] = {}
+        self.runs = 0
+        self.total_seconds = 0
+    
+    def add(self, status: str, bucket: int, runs: int, total_seconds: int):
+        self.statuses[status] = self.statuses.get(status, 0) + runs
+        self.runs += runs
+        if bucket >= 0:
+            self.sketch.add(bucket, runs)
+            self.total_seconds += total_seconds
+    
+    def merge(self, other: "RunStats"):
+        for status, runs in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + runs
+        self.runs += other.runs
+        self.sketch.merge(other.sketch)
+        self.total_seconds += other.total_seconds
+    
+    def percentile(self, q: float) -> Optional[float]:
+        """Duration in seconds below which a fraction ``q`` of the timed runs fall"""
+        hours = self.sketch.quantile(q)
+        return round(hours * 3600, 1) if hours is not None else None
+    
+    def summary(self) -> Dict[str, Any]:
+        """Outcome counts, failure rate and duration percentiles for display"""
+        failed = self.statuses.get("Failed", 0)
+        timed = self.sketch.total
+        return {
+            "runs": self.runs,
+            "succeeded": self.statuses.get("Succeeded", 0),
+            "failed": failed,
+            "canceled": self.statuses.get("Canceled", 0),
+            "failure_rate": round(failed / self.runs, 4) if self.runs else None,
+            # Totals are kept exactly, so the mean needs no sketch approximation
+            "mean_seconds": round(self.total_seconds / timed, 1) if timed else None,
+            "p50_seconds": self.percentile(0.5),
+            "p90_seconds": self.percentile(0.9),
+            "p99_seconds": self.percentile(0.99)
+        }
+
+
+class PipelineService:
+    """Service class for pipeline run analytics"""
+    
+    def __init__(self):
+        self.db = read_db
+        self.projects = project_catalog
+        self.cycle_times = cycle_time_sketches
+    
+    def _pipeline_names(self, pipeline_ids: List[int]) -> Dict[int, str]:
+        """Names of the given pipelines, looked up in one IN-list query"""
+        if not pipeline_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in pipeline_ids)
+        rows = self.db.execute_query(
+            f"SELECT PipelineId, PipelineName FROM Pipelines WHERE PipelineId IN ({placeholders})",
+            tuple(pipeline_ids), as_tuples=True
+        )
+        return dict(rows)
+    
+    def get_pipeline_health(self, request) -> Dict[str, Any]:
+        """
+        Failure rates, duration percentiles and slowest pipelines over a period
+        
+        Reads the PipelineDailyRuns rollup of the period summed per
+        (project, pipeline, status, duration bucket) in one query, then
+        merges the rows in memory into the overall, per-project and
+        per-pipeline summaries; individual runs are never read.
+        
+        Args:
+            request: GetPipelineHealthRequest with period, filter and top N
+        
+        Returns:
+            GetPipelineHealthResponse with the merged summaries
+        """
+        from app.schemas.pipeline_schemas import GetPipelineHealthResponse
+        
+        end_date = date.today()
+        start_date = end_date - timedelta(days=request.days_back)
+        project_id, project_name, matched = self.projects.resolve_request(request)
+        
+        sql_query = """
+            SELECT ProjectId, PipelineId, Status, Bucket, SUM(Runs) AS Runs, SUM(TotalSeconds) AS TotalSeconds
+            FROM PipelineDailyRuns
+            WHERE Day >= ? AND Day <= ?
+        """
+        params: List[Any] = [start_date.isoformat(), end_date.isoformat()]
+        if project_id is not None:
+            sql_query += " AND ProjectId = ?"
+            params.append(project_id)
+        sql_query += " GROUP BY ProjectId, PipelineId, Status, Bucket"
+        
+        results = self.db.execute_query(sql_query, tuple(params), as_tuples=True) if matched else []
+        
+        by_pipeline: Dict[Tuple[int, int], RunStats] = {}
+        for row_project, pipeline_id, status, bucket, runs, total_seconds in results:
+            stats = by_pipeline.get((row_project, pipeline_id))
+            if stats is None:
+                stats = by_pipeline[row_project, pipeline_id] = RunStats(self.cycle_times.sketch())
+            stats.add(status, bucket, runs, total_seconds)
+        
+        # Pipelines merge into projects and projects into the total, which
+        # touches each bucket of a pipeline once instead of every row again
+        overall = RunStats(self.cycle_times.sketch())
+        by_project: Dict[int, RunStats] = {}
+        for (row_project, _), stats in by_pipeline.items():
+            project_stats = by_project.get(row_project)
+            if project_stats is None:
+                project_stats = by_project[row_project] = RunStats(self.cycle_times.sketch())
+            project_stats.merge(stats)
+        for stats in by_project.values():
+            overall.merge(stats)
+        
+        # Slowest by p90; pipelines without timed runs sort last
+        slowest = sorted(
+            by_pipeline.items(),
+            key=lambda item: (item[1].sketch.quantile(0.9) or 0.0, item[1].runs),
+            reverse=True
+        )[:request.top]
+        names = self._pipeline_names([pipeline_id for (_, pipeline_id), _ in slowest])
+        
+        logger.debug("Pipeline health: %s runs from %s rollup rows", overall.runs, len(results))
+        
+        return GetPipelineHealthResponse(
+            period_start=start_date.isoformat(),
+            period_end=end_date.isoformat(),
+            overall=overall.summary(),
+            by_project=[
+                {"project_id": pid, "project": self.projects.get_name(pid), **stats.summary()}
+                for pid, stats in sorted(by_project.items())
+            ],
+            slowest_pipelines=[
+                {
+                    "pipeline_id": pipeline_id,
+                    "pipeline_name": names.get(pipeline_id),
+                    "project_id": pid,
+                    "project": self.projects.get_name(pid),
+                    **stats.summary()
+                }
+                for (pid, pipeline_id), stats in slowest
+            ],
+            relative_accuracy=round(RELATIVE_ACCURACY, 4),
+            project_id=str(project_id) if project_id is not None else request.project_id,
+            project_name=project_name if matched else request.project_name
+        )
+    
+    async def get_pipeline_health_async(self, request) -> Dict[str, Any]:
+        """Async variant of get_pipeline_health"""
+        return await self.db.run_async(self.get_pipeline_health, request)
+
+
+# Singleton instance
+pipeline_service = PipelineService()
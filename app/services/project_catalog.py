@@ -0,0 +1,182 @@
+"""
+In-memory catalog of projects for resolving project filters without a database round trip
+"""
+import logging
+import threading
+import time
+from typing import Optional, Dict, Tuple, Set, Any
+from app.config import get_settings
+from app.database import db_manager
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectCatalog:
+    """
+    Cache of the Projects table (id <-> name)
+    
+    The catalog is loaded once and reloaded only when the Projects table
+    signature (row count, max id, max LastSync) changes. The signature is
+    checked at most once per ``refresh_interval`` seconds. Lookups that miss
+    are remembered as negative entries until the next reload, so repeated
+    requests for unknown projects never reach the database.
+    """
+    
+    SIGNATURE_QUERY = "SELECT COUNT(*) AS Count, MAX(ProjectId) AS MaxId, MAX(LastSync) AS LastSync FROM Projects"
+    LOAD_QUERY = "SELECT ProjectId, ProjectName FROM Projects"
+    MAX_NEGATIVE_ENTRIES = 1024
+    
+    def __init__(self, db=None, refresh_interval: Optional[float] = None):
+        self.db = db or db_manager
+        if refresh_interval is None:
+            refresh_interval = get_settings().project_catalog_refresh_seconds
+        self.refresh_interval = refresh_interval
+        
+        self._lock = threading.Lock()
+        self._by_id: Dict[int, str] = {}
+        self._by_name: Dict[str, int] = {}
+        self._missing_ids: Set[str] = set()
+        self._missing_names: Set[str] = set()
+        self._signature: Optional[Tuple[Any, ...]] = None
+        self._checked_at = 0.0
+        self._loaded = False
+    
+    def _read_signature(self) -> Tuple[Any, ...]:
+        """Read the cheap change-detection signature of the Projects table"""
+        row = self.db.execute_query(self.SIGNATURE_QUERY)[0]
+        return (row['Count'], row['MaxId'], row['LastSync'])
+    
+    def load(self):
+        """Load (or reload) the full catalog from the database"""
+        with self._lock:
+            self._load_locked(self._read_signature())
+    
+    def _load_locked(self, signature: Tuple[Any, ...]):
+        rows = self.db.execute_query(self.LOAD_QUERY)
+        self._by_id = {row['ProjectId']: row['ProjectName'] for row in rows}
+        self._by_name = {row['ProjectName']: row['ProjectId'] for row in rows}
+        self._missing_ids.clear()
+        self._missing_names.clear()
+        self._signature = signature
+        self._checked_at = time.monotonic()
+        self._loaded = True
+        logger.info("Project catalog loaded with %s projects", len(rows))
+    
+    def refresh(self, force: bool = False):
+        """
+        Reload the catalog if the Projects table has changed
+        
+        Args:
+            force: Check the signature now instead of honouring the refresh interval
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._loaded and not force and now - self._checked_at < self.refresh_interval:
+                return
+            signature = self._read_signature()
+            if not self._loaded or signature != self._signature:
+                self._load_locked(signature)
+            else:
+                self._checked_at = now
+    
+    def invalidate(self):
+        """Force a reload on the next lookup (call after writing to Projects)"""
+        with self._lock:
+            self._loaded = False
+    
+    def resolve(
+        self,
+        project_id: Optional[str] = None,
+        project_name: Optional[str] = None
+    ) -> Optional[Tuple[int, str]]:
+        """
+        Resolve a project filter to ``(ProjectId, ProjectName)``
+        
+        ``project_id`` takes precedence over ``project_name``, matching the
+        request schemas.
+        
+        Args:
+            project_id: Numeric project ID (as string or int)
+            project_name: Exact project name
+        
+        Returns:
+            Tuple of project ID and name, or None if no such project exists
+        """
+        self.refresh()
+        
+        if project_id:
+            key = str(project_id).strip()
+            if not key.isdigit() or key in self._missing_ids:
+                return None
+            project = self._lookup_id(key)
+            if project is None:
+                # The catalog may predate a newly synced project
+                self.refresh(force=True)
+                project = self._lookup_id(key)
+                if project is None:
+                    self._remember_missing(self._missing_ids, key)
+            return project
+        
+        if project_name:
+            if project_name in self._missing_names:
+                return None
+            project = self._lookup_name(project_name)
+            if project is None:
+                self.refresh(force=True)
+                project = self._lookup_name(project_name)
+                if project is None:
+                    self._remember_missing(self._missing_names, project_name)
+            return project
+        
+        return None
+    
+    def resolve_request(self, request) -> Tuple[Optional[int], Optional[str], bool]:
+        """
+        Resolve a request's project filter
+        
+        Args:
+            request: Any request carrying optional project_id/project_name
+        
+        Returns:
+            Tuple of (project_id, project_name, matched). ``matched`` is False
+            when a filter was given but names no known project, in which case
+            the caller can answer without querying the database. Both values
+            are then None, whichever filter was used; callers echo the
+            request's own project_id/project_name back.
+        """
+        if not (request.project_id or request.project_name):
+            return None, None, True
+        
+        project = self.resolve(request.project_id, request.project_name)
+        if project is None:
+            return None, None, False
+        return project[0], project[1], True
+    
+    def _remember_missing(self, missing: Set[str], key: str):
+        """Record a negative entry, bounding memory against arbitrary client input"""
+        if len(missing) >= self.MAX_NEGATIVE_ENTRIES:
+            missing.clear()
+        missing.add(key)
+    
+    def _lookup_id(self, key: str) -> Optional[Tuple[int, str]]:
+        pid = int(key)
+        name = self._by_id.get(pid)
+        return (pid, name) if name is not None else None
+    
+    def _lookup_name(self, name: str) -> Optional[Tuple[int, str]]:
+        pid = self._by_name.get(name)
+        return (pid, name) if pid is not None else None
+    
+    def all(self) -> Dict[int, str]:
+        """Get a copy of the full ProjectId -> ProjectName mapping"""
+        self.refresh()
+        return dict(self._by_id)
+    
+    def get_name(self, project_id: int) -> Optional[str]:
+        """Get a project's name by ID from the catalog"""
+        self.refresh()
+        return self._by_id.get(project_id)
+
+
+# Singleton instance
+project_catalog = ProjectCatalog()
@@ -0,0 +1,225 @@
+"""
+In-process response cache for the analytics endpoints
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Callable, Awaitable, TypeVar
+from pydantic import BaseModel
+from app.config import get_settings
+from app.replica import read_db
+from app.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# data_version counters restart with the process, so ETags also carry a
+# per-process token to stay unique across restarts
+_PROCESS_TOKEN = uuid.uuid4().hex
+
+# Request fields that only shape the serialized response (ResponseShapeOptions).
+# Cached results are shaped after lookup, so these are left out of cache keys
+# and added to ETags only.
+SHAPE_FIELDS = frozenset({"format", "compact"})
+
+
+def make_etag(action: str, request: BaseModel, version: int, *scope: Any) -> str:
+    """
+    Build a strong ETag for a response from the data version and the normalized request
+    
+    Args:
+        action: Action (endpoint) name
+        request: Validated request model
+        version: Database data version the response is computed from
+        *scope: Extra values the answer depends on (e.g. today's date)
+    """
+    key = ResponseCache.make_key(action, request, *scope)
+    shape = json.dumps(request.model_dump(mode="json", include=SHAPE_FIELDS), sort_keys=True)
+    digest = hashlib.sha256(f"{_PROCESS_TOKEN}:{version}:{key}:{shape}".encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, RFC 9110)"""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+class ResponseCache:
+    """
+    LRU + TTL cache of service responses keyed on the normalized request
+    
+    Every entry is tagged with the database data version it was computed
+    from. As soon as the data version moves (any commit, from this process
+    or another one) the whole cache is dropped on the next lookup, so a hit
+    always reflects the current database content.
+    """
+    
+    def __init__(
+        self,
+        db=None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        enabled: Optional[bool] = None
+    ):
+        settings = get_settings()
+        self.db = db or read_db
+        self.ttl_seconds = settings.response_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.max_entries = settings.response_cache_max_entries if max_entries is None else max_entries
+        self.enabled = settings.response_cache_enabled if enabled is None else enabled
+        
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._version: Optional[int] = None
+        
+        # Counters
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+    
+    @staticmethod
+    def make_key(action: str, request: BaseModel, *scope: Any) -> str:
+        """
+        Build a cache key from the action name and the normalized request
+        
+        Args:
+            action: Action (endpoint) name
+            request: Validated request model; defaults are filled in, so
+                ``{}`` and an explicit default produce the same key. The
+                SHAPE_FIELDS are ignored: every shape shares one entry.
+            *scope: Extra values the answer depends on (e.g. today's date)
+        """
+        payload = {
+            "action": action,
+            "request": request.model_dump(mode="json", exclude=SHAPE_FIELDS),
+            "scope": [str(part) for part in scope]
+        }
+        return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    
+    def _sync_version_locked(self, version: int):
+        """Drop every entry if the database changed since they were cached"""
+        if version != self._version:
+            if self._entries:
+                self._invalidations += 1
+                self._entries.clear()
+            self._version = version
+    
+    def get(self, key: str, version: int) -> Optional[Any]:
+        """Look up a fresh entry computed at the given data version"""
+        with self._lock:
+            self._sync_version_locked(version)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+    
+    def put(self, key: str, value: Any, version: int):
+        """Store an entry computed at ``version``, evicting the least recently used"""
+        with self._lock:
+            if version != self._version:
+                return  # The database changed while the response was computed
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+    
+    async def get_or_compute(
+        self,
+        action: str,
+        request: BaseModel,
+        compute: Callable[[BaseModel], Awaitable[T]],
+        *scope: Any,
+        version: Optional[int] = None
+    ) -> T:
+        """
+        Return the cached response for a request, computing it on a miss
+        
+        The data version is read before computing, so a write that lands
+        while the response is being built invalidates it on the next lookup.
+        
+        Args:
+            action: Action (endpoint) name
+            request: Validated request model
+            compute: Coroutine function producing the response on a miss
+            *scope: Extra values the answer depends on
+            version: Data version already read by the caller (e.g. for an ETag)
+        """
+        if not self.enabled:
+            return await compute(request)
+        
+        key = self.make_key(action, request, *scope)
+        if version is None:
+            # A PRAGMA under the watch lock: keep it off the event loop
+            version = await self.db.run_async(self.db.data_version)
+        cached = self.get(key, version)
+        if cached is not None:
+            return cached
+        
+        result = await compute(request)
+        self.put(key, result, version)
+        return result
+    
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters for monitoring"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations
+            }
+
+
+# Singleton instance
+response_cache = ResponseCache()
+
+
+def _cache_metrics():
+    """Expose response cache statistics as Prometheus metrics"""
+    stats = response_cache.stats()
+    return [
+        ("devops_mcp_response_cache_entries", "gauge", "Responses currently cached",
+         [({}, stats["entries"])]),
+        ("devops_mcp_response_cache_lookups_total", "counter", "Response cache lookups by result",
+         [({"result": "hit"}, stats["hits"]), ({"result": "miss"}, stats["misses"])]),
+        ("devops_mcp_response_cache_evictions_total", "counter", "Entries evicted by the LRU limit",
+         [({}, stats["evictions"])]),
+        ("devops_mcp_response_cache_invalidations_total", "counter", "Cache flushes caused by database changes",
+         [({}, stats["invalidations"])])
+    ]
+
+
+metrics.register_collector(_cache_metrics)
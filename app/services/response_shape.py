@@ -0,0 +1,118 @@
+"""
+Compact response shapes negotiated per request (format=columnar, compact=true)
+
+The services always build the regular response models; shaping happens
+afterwards, so the cached service results are shared with the default row
+format (response cache keys leave the shape fields out; ETags keep them).
+"""
+import typing
+from typing import Optional, List, Dict, Any, Union
+from pydantic import BaseModel
+from app.schemas.bug_schemas import (
+    GetBugFixTrendsResponse, GetActiveBugsResponse, GetBugStatisticsResponse, SearchBugsResponse
+)
+
+# Low-cardinality columns sent as a value dictionary plus integer codes
+DICTIONARY_COLUMNS = ("status", "severity")
+
+# Sections that only repeat data found elsewhere in the same response
+# (dotted paths for nested sections)
+REDUNDANT_SECTIONS = {
+    GetBugFixTrendsResponse: ("sql_query", "trend_graph_data"),
+    GetActiveBugsResponse: ("filters_applied",),
+    SearchBugsResponse: ("filters_applied",),
+    GetBugStatisticsResponse: ("statistics.by_project",),
+}
+
+
+def dictionary_encode(values: List[Any]) -> Dict[str, List[Any]]:
+    """
+    Encode a column as distinct values plus one code per row
+    
+    ``["High", "Low", "High", None]`` becomes
+    ``{"dictionary": ["High", "Low"], "codes": [0, 1, 0, None]}``.
+    """
+    dictionary: Dict[Any, int] = {}
+    codes = []
+    for value in values:
+        if value is None:
+            codes.append(None)
+        else:
+            codes.append(dictionary.setdefault(value, len(dictionary)))
+    return {"dictionary": list(dictionary), "codes": codes}
+
+
+def to_columns(rows: List[Dict[str, Any]], keys: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Turn a list of row objects into one array per key
+    
+    Args:
+        rows: JSON-ready row dictionaries
+        keys: Column order; defaults to the keys in order of first appearance
+    """
+    if keys is None:
+        keys = list(dict.fromkeys(key for row in rows for key in row))
+    columns: Dict[str, Any] = {}
+    for key in keys:
+        values = [row.get(key) for row in rows]
+        columns[key] = dictionary_encode(values) if key in DICTIONARY_COLUMNS else values
+    return columns
+
+
+def _item_model(annotation: Any) -> Optional[type]:
+    """Model class of a ``List[Model]`` (or ``Optional[List[Model]]``) annotation"""
+    if typing.get_origin(annotation) is Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else annotation
+    if typing.get_origin(annotation) is list:
+        (item,) = typing.get_args(annotation)
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return item
+    return None
+
+
+def _columnar(model_cls: type, data: Dict[str, Any]):
+    """Rewrite every list of objects under ``data`` (a dump of ``model_cls``) in place"""
+    for name, field in model_cls.model_fields.items():
+        value = data.get(name)
+        item_cls = _item_model(field.annotation)
+        if item_cls is not None and isinstance(value, list):
+            data[name] = to_columns(value, list(item_cls.model_fields))
+        elif isinstance(value, list) and value and all(isinstance(row, dict) for row in value):
+            data[name] = to_columns(value)
+        elif isinstance(value, dict) and isinstance(field.annotation, type) and issubclass(field.annotation, BaseModel):
+            _columnar(field.annotation, value)
+
+
+def _drop(data: Dict[str, Any], path: str):
+    parent, _, leaf = path.rpartition(".")
+    for part in parent.split(".") if parent else ():
+        data = data.get(part) or {}
+    data.pop(leaf, None)
+
+
+def shape_response(response: BaseModel, options: BaseModel) -> Union[BaseModel, Dict[str, Any]]:
+    """
+    Apply the request's format/compact options to a service response
+    
+    Args:
+        response: Response model built by the service
+        options: The request (a ResponseShapeOptions subclass)
+    
+    Returns:
+        ``response`` itself for the default shape, otherwise a JSON-ready
+        dictionary; columnar bodies carry ``"format": "columnar"``
+    """
+    shape = getattr(options, "format", "rows")
+    compact = getattr(options, "compact", False)
+    if shape == "rows" and not compact:
+        return response
+    
+    data = response.model_dump(mode="json")
+    if compact:
+        for path in REDUNDANT_SECTIONS.get(type(response), ()):
+            _drop(data, path)
+    if shape == "columnar":
+        _columnar(type(response), data)
+        data["format"] = "columnar"
+    return data
@@ -0,0 +1,239 @@
+"""
+Incremental, watermark-based sync of Azure DevOps data
+"""
+import asyncio
+import logging
+import sqlite3
+import time
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple
+from app.config import get_settings
+from app.database import db_manager
+from app.services.project_catalog import project_catalog
+from app.services.ingest_service import ingest_service, SYNC_LOG_SQL
+from app.services.sync_sources import SyncSource, parse_timestamp
+from app.schemas.ingest_schemas import IngestRequest, WorkItemRecord, BugRecord
+
+logger = logging.getLogger(__name__)
+
+
+# SyncWatermarks is created by schema migration 6
+UPSERT_WATERMARK_SQL = """
+    INSERT INTO SyncWatermarks (AzureProjectId, EntityType, Watermark, UpdatedAt)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT (AzureProjectId, EntityType) DO UPDATE SET
+        Watermark = MAX(Watermark, excluded.Watermark),
+        UpdatedAt = excluded.UpdatedAt
+"""
+
+WORK_ITEM_ENTITY = "WorkItem"
+
+
+def _identity(value: Any) -> Optional[str]:
+    """Flatten an Azure DevOps identity reference to its unique name"""
+    if isinstance(value, dict):
+        return value.get("uniqueName") or value.get("displayName")
+    return value
+
+
+def _severity(value: Optional[str]) -> Optional[str]:
+    """Strip the rank prefix from a severity ("2 - High" -> "High")"""
+    if value and " - " in value:
+        return value.split(" - ", 1)[1]
+    return value
+
+
+def work_item_to_records(item: Dict[str, Any], azure_project_id: str) -> Tuple[WorkItemRecord, Optional[BugRecord]]:
+    """
+    Map an Azure DevOps work item to ingestion records
+    
+    Bugs are work items of type "Bug"; they also produce a Bugs row keyed on
+    the same Azure id.
+    """
+    fields = item.get("fields", {})
+    work_item = WorkItemRecord(
+        azure_work_item_id=item["id"],
+        azure_project_id=azure_project_id,
+        title=fields.get("System.Title") or f"Work item {item['id']}",
+        work_item_type=fields.get("System.WorkItemType"),
+        state=fields.get("System.State"),
+        assigned_to=_identity(fields.get("System.AssignedTo")),
+        created_date=parse_timestamp(fields.get("System.CreatedDate")),
+        changed_date=parse_timestamp(fields.get("System.ChangedDate")),
+        closed_date=parse_timestamp(fields.get("Microsoft.VSTS.Common.ClosedDate")),
+        priority=fields.get("Microsoft.VSTS.Common.Priority"),
+        iteration_path=fields.get("System.IterationPath"),
+        area_path=fields.get("System.AreaPath"),
+        tags=fields.get("System.Tags")
+    )
+    if work_item.work_item_type != "Bug":
+        return work_item, None
+    
+    bug = BugRecord(
+        azure_bug_id=str(item["id"]),
+        azure_work_item_id=item["id"],
+        severity=_severity(fields.get("Microsoft.VSTS.Common.Severity")),
+        resolution=fields.get("Microsoft.VSTS.Common.ResolvedReason"),
+        fixed_by=_identity(fields.get("Microsoft.VSTS.Common.ResolvedBy")),
+        fixed_date=parse_timestamp(
+            fields.get("Microsoft.VSTS.Common.ResolvedDate") or fields.get("Microsoft.VSTS.Common.ClosedDate")
+        ),
+        verified_by=_identity(fields.get("Microsoft.VSTS.Common.ClosedBy")),
+        verified_date=parse_timestamp(fields.get("Microsoft.VSTS.Common.ClosedDate")),
+        status=fields.get("System.State"),
+        notes=fields.get("System.History")
+    )
+    return work_item, bug
+
+
+class SyncEngine:
+    """
+    Pulls changed work items and bugs from a source into the database
+    
+    Each project keeps a ChangedDate watermark in SyncWatermarks. A run asks
+    the source only for items changed at or after the watermark (the
+    boundary is re-read, which is harmless because writes are upserts) and
+    applies them in batches; every batch commits its rows together with the
+    advanced watermark, so an interrupted run resumes where it stopped.
+    """
+    
+    def __init__(self, source: SyncSource, db=None, batch_size: Optional[int] = None):
+        settings = get_settings()
+        self.source = source
+        self.db = db or db_manager
+        self.batch_size = batch_size or settings.sync_batch_size
+        self.ingest = ingest_service
+        self.projects = project_catalog
+    
+    def get_watermark(self, azure_project_id: str, entity_type: str = WORK_ITEM_ENTITY) -> Optional[datetime]:
+        """Get the last applied ChangedDate for a project (None before the first sync)"""
+        rows = self.db.execute_query(
+            "SELECT Watermark FROM SyncWatermarks WHERE AzureProjectId = ? AND EntityType = ?",
+            (azure_project_id, entity_type)
+        )
+        return parse_timestamp(rows[0]["Watermark"]) if rows else None
+    
+    def _log(self, conn: sqlite3.Connection, entity_type: str, fetched: int, updated: int,
+             duration: float, error: Optional[str] = None):
+        conn.execute(SYNC_LOG_SQL, (
+            self.source.name, entity_type, fetched, updated, round(duration, 3),
+            0 if error else 1, error
+        ))
+    
+    def run(self) -> Dict[str, Any]:
+        """
+        Run one incremental sync over every project of the source
+        
+        A failing project is logged and skipped; the others still sync.
+        
+        Returns:
+            Summary with per-project counts, watermarks and errors
+        """
+        started = time.perf_counter()
+        
+        projects = self.source.fetch_projects()
+        if projects:
+            with self.db.get_connection() as conn:
+                try:
+                    results, timings = self.ingest.apply(
+                        conn, IngestRequest(source=self.source.name, projects=projects)
+                    )
+                    self._log(conn, "Project", len(projects), results[0].records_upserted, timings[0])
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+            self.projects.invalidate()
+        
+        summaries = [self._sync_project(project.azure_project_id, project.project_name) for project in projects]
+        duration = time.perf_counter() - started
+        logger.info("Sync from %s finished in %.3fs", self.source.name, duration)
+        return {
+            "source": self.source.name,
+            "projects": summaries,
+            "duration_seconds": round(duration, 3)
+        }
+    
+    def _sync_project(self, azure_project_id: str, project_name: str) -> Dict[str, Any]:
+        """Apply one project's changes in batches, advancing its watermark per batch"""
+        started = time.perf_counter()
+        since = self.get_watermark(azure_project_id)
+        totals = {"WorkItem": [0, 0], "Bug": [0, 0]}  # entity -> [fetched, upserted]
+        batches = 0
+        error = None
+        
+        try:
+            batch: List[Dict[str, Any]] = []
+            for item in self.source.fetch_changed_work_items(azure_project_id, since):
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    self._apply_batch(azure_project_id, batch, totals)
+                    batches += 1
+                    batch = []
+            if batch:
+                self._apply_batch(azure_project_id, batch, totals)
+                batches += 1
+        except Exception as e:
+            error = str(e)
+            logger.error("Sync of project %s failed: %s", project_name, e, exc_info=True)
+        
+        duration = time.perf_counter() - started
+        with self.db.get_connection() as conn:
+            for entity_type, (fetched, upserted) in totals.items():
+                if fetched or error:
+                    self._log(conn, entity_type, fetched, upserted, duration, error)
+            conn.commit()
+        
+        watermark = self.get_watermark(azure_project_id)
+        return {
+            "azure_project_id": azure_project_id,
+            "project_name": project_name,
+            "previous_watermark": since.isoformat(sep=" ") if since else None,
+            "watermark": watermark.isoformat(sep=" ") if watermark else None,
+            "batches": batches,
+            "work_items_fetched": totals["WorkItem"][0],
+            "work_items_upserted": totals["WorkItem"][1],
+            "bugs_fetched": totals["Bug"][0],
+            "bugs_upserted": totals["Bug"][1],
+            "duration_seconds": round(duration, 3),
+            "error": error
+        }
+    
+    def _apply_batch(self, azure_project_id: str, items: List[Dict[str, Any]], totals: Dict[str, List[int]]):
+        """Upsert one batch and move the watermark in the same transaction"""
+        work_items: List[WorkItemRecord] = []
+        bugs: List[BugRecord] = []
+        for item in items:
+            work_item, bug = work_item_to_records(item, azure_project_id)
+            work_items.append(work_item)
+            if bug is not None:
+                bugs.append(bug)
+        
+        changed = [record.changed_date for record in work_items if record.changed_date is not None]
+        request = IngestRequest(source=self.source.name, work_items=work_items, bugs=bugs)
+        
+        with self.db.get_connection() as conn:
+            try:
+                results, _ = self.ingest.apply(conn, request)
+                if changed:
+                    conn.execute(UPSERT_WATERMARK_SQL, (
+                        azure_project_id, WORK_ITEM_ENTITY, max(changed).strftime('%Y-%m-%d %H:%M:%S')
+                    ))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        
+        for result in results:
+            totals[result.entity_type][0] += result.records_received
+            totals[result.entity_type][1] += result.records_upserted
+
+
+async def run_periodically(engine: SyncEngine, interval_seconds: float):
+    """Run the engine every ``interval_seconds`` until cancelled"""
+    while True:
+        try:
+            await engine.db.run_async(engine.run)
+        except Exception as e:
+            logger.error("Scheduled sync failed: %s", e, exc_info=True)
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,133 @@
+"""
+Calendar-bucketed bug-fix series computed in SQL from the BugDailyFixes rollup
+"""
+import logging
+from datetime import date, timedelta
+from typing import Optional, List, Sequence, Tuple
+from app.replica import read_db
+
+logger = logging.getLogger(__name__)
+
+
+# granularity -> (SQL expression mapping a rollup Day to its bucket start, date() step to the next bucket)
+BUCKETS = {
+    "day": ("Day", "+1 day"),
+    "week": ("DATE(Day, 'weekday 0', '-6 days')", "+7 days"),  # ISO weeks, starting on Monday
+    "month": ("DATE(Day, 'start of month')", "+1 month"),
+}
+
+
+def bucket_start(day: date, granularity: str) -> date:
+    """First day of the calendar bucket containing ``day``"""
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def shift_buckets(day: date, granularity: str, count: int) -> date:
+    """Move a bucket start by ``count`` buckets (negative moves back)"""
+    if granularity == "week":
+        return day + timedelta(weeks=count)
+    if granularity == "month":
+        months = day.year * 12 + day.month - 1 + count
+        return day.replace(year=months // 12, month=months % 12 + 1)
+    return day + timedelta(days=count)
+
+
+def bucket_count(start: date, end: date, granularity: str) -> int:
+    """Number of buckets from the bucket start ``start`` through the day ``end``"""
+    if granularity == "week":
+        return (end - start).days // 7 + 1
+    if granularity == "month":
+        return (end.year - start.year) * 12 + end.month - start.month + 1
+    return (end - start).days + 1
+
+
+class TrendEngine:
+    """
+    Builds dense fix-count series in a single query
+    
+    A recursive CTE generates every bucket of the range, the rollup is
+    grouped into the same buckets and left-joined onto it, so empty buckets
+    come back as zeros without any per-day work in Python. Rolling averages
+    are window functions over the same result.
+    """
+    
+    def __init__(self, db=None):
+        self.db = db or read_db
+    
+    def build_query(self, granularity: str, project_count: Optional[int] = None) -> str:
+        """
+        SQL for a dense series with named parameters :start, :end, :preceding
+        and :project0.. for the project filter
+        
+        Args:
+            granularity: day, week or month
+            project_count: Number of projects filtered on; None for all projects
+        """
+        bucket, step = BUCKETS[granularity]
+        project_filter = ""
+        if project_count is not None:
+            placeholders = ", ".join(f":project{i}" for i in range(project_count))
+            project_filter = f"AND ProjectId IN ({placeholders})"
+        return f"""
+            WITH RECURSIVE
+                buckets(BucketStart) AS (
+                    SELECT :start
+                    UNION ALL
+                    SELECT DATE(BucketStart, '{step}') FROM buckets
+                    WHERE DATE(BucketStart, '{step}') <= :end
+                ),
+                fixes(BucketStart, FixedCount) AS (
+                    SELECT {bucket}, SUM(FixedCount)
+                    FROM BugDailyFixes
+                    WHERE Day >= :start AND Day <= :end {project_filter}
+                    GROUP BY 1
+                )
+            SELECT
+                b.BucketStart,
+                COALESCE(f.FixedCount, 0) AS FixedCount,
+                AVG(COALESCE(f.FixedCount, 0)) OVER (
+                    ORDER BY b.BucketStart ROWS BETWEEN :preceding PRECEDING AND CURRENT ROW
+                ) AS RollingAverage
+            FROM buckets b
+            LEFT JOIN fixes f ON f.BucketStart = b.BucketStart
+            ORDER BY b.BucketStart
+        """
+    
+    def series(
+        self,
+        start: date,
+        end: date,
+        granularity: str = "day",
+        project_ids: Optional[Sequence[int]] = None,
+        rolling_window: int = 1
+    ) -> List[Tuple[str, int, float]]:
+        """
+        Fix counts for every bucket from ``start`` through ``end``
+        
+        Args:
+            start: First bucket start (already aligned to the granularity)
+            end: Last day included
+            granularity: day, week or month
+            project_ids: Projects to include; None for all, empty for none
+            rolling_window: Number of buckets averaged into RollingAverage
+                (the current one and the ones before it)
+        
+        Returns:
+            (bucket start, fixed count, rolling average) tuples in order
+        """
+        if project_ids is not None and not project_ids:
+            # Unknown project: no rollup row matches, every bucket is zero
+            project_ids = (-1,)
+        query = self.build_query(granularity, None if project_ids is None else len(project_ids))
+        params = {"start": start.isoformat(), "end": end.isoformat(), "preceding": rolling_window - 1}
+        params.update((f"project{i}", project_id) for i, project_id in enumerate(project_ids or ()))
+        logger.debug("Trend series %s..%s by %s", start, end, granularity)
+        return self.db.execute_query(query, params, as_tuples=True)
+
+
+# Singleton instance
+trend_engine = TrendEngine()
@@ -0,0 +1,263 @@
+"""
+Deterministic synthetic dataset generator
+
+Builds a SQLite database with the application schema and realistic volumes
+of Projects, WorkItems, Bugs, Commits, Pipelines and their run history.
+The same (scale, seed,
+anchor) always produces byte-for-byte the same rows.
+
+Usage:
+    python -m benchmarks.generator OUTPUT.db --bugs 100000 [--seed 42]
+"""
+import argparse
+import random
+import sqlite3
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional, Dict, Iterator, Tuple
+from app.migrations import migrate
+
+
+# Distributions observed in the seed data, widened for variety
+BUG_STATUSES = (("Closed", 0.62), ("Active", 0.28), ("New", 0.10))
+SEVERITIES = (("Critical", 0.05), ("High", 0.22), ("Medium", 0.43), ("Low", 0.30))
+WORK_ITEM_TYPES = (("Task", 0.55), ("User Story", 0.35), ("Feature", 0.10))
+PIPELINE_STATUSES = (("Succeeded", 0.78), ("Failed", 0.15), ("Canceled", 0.07))
+TRIGGERS = ("CI", "Scheduled", "Manual", "PullRequest")
+BRANCHES = ("main", "develop", "release/1.0", "release/2.0", "hotfix/payments", "feature/search")
+
+AREAS = ("Backend", "Frontend", "Mobile", "Payments", "Analytics", "Infra", "Checkout", "Auth")
+COMPONENTS = (
+    "StockController", "CheckoutService", "PaymentGateway", "LoginPage", "OrderHistory",
+    "ReportBuilder", "SyncWorker", "CartApi", "InvoiceExporter", "NotificationHub"
+)
+PROBLEMS = (
+    "timeout", "null reference", "memory leak", "deadlock", "crash", "wrong totals",
+    "slow response", "race condition", "missing translation", "broken layout"
+)
+TAGS = ("backend", "frontend", "api", "bug", "performance", "security", "ux", "mobile", "payments", "devops")
+PEOPLE = tuple(f"dev{i}@example.local" for i in range(1, 41))
+
+# Entity volumes relative to the number of bugs
+WORK_ITEMS_PER_BUG = 0.5  # non-bug work items (every bug also gets its own work item)
+COMMITS_PER_BUG = 2
+BUGS_PER_PROJECT = 20000
+PIPELINES_PER_PROJECT = 12
+RUNS_PER_PIPELINE = 60  # including the last run recorded on Pipelines
+HISTORY_DAYS = 730
+
+
+def _weighted(rng: random.Random, choices) -> str:
+    roll = rng.random()
+    cumulative = 0.0
+    for value, weight in choices:
+        cumulative += weight
+        if roll < cumulative:
+            return value
+    return choices[-1][0]
+
+
+def _timestamp(anchor: datetime, rng: random.Random, max_days: int = HISTORY_DAYS) -> datetime:
+    # Skewed towards recent activity
+    days = int(max_days * rng.random() ** 2)
+    return anchor - timedelta(days=days, seconds=rng.randrange(86400))
+
+
+def _fmt(value: Optional[datetime]) -> Optional[str]:
+    return value.strftime('%Y-%m-%d %H:%M:%S') if value else None
+
+
+def dataset_size(bugs: int) -> Dict[str, int]:
+    """Row counts generated for a given number of bugs"""
+    projects = max(5, bugs // BUGS_PER_PROJECT)
+    return {
+        "Projects": projects,
+        "WorkItems": bugs + int(bugs * WORK_ITEMS_PER_BUG),
+        "Bugs": bugs,
+        "Commits": bugs * COMMITS_PER_BUG,
+        "Pipelines": projects * PIPELINES_PER_PROJECT,
+        "PipelineRuns": projects * PIPELINES_PER_PROJECT * RUNS_PER_PIPELINE
+    }
+
+
+def _projects(count: int, anchor: datetime) -> Iterator[Tuple]:
+    for project_id in range(1, count + 1):
+        created = anchor - timedelta(days=HISTORY_DAYS + project_id)
+        yield (
+            project_id, f"{project_id:08x}-0000-4000-8000-{project_id:012x}", f"Project{project_id:04d}",
+            f"Synthetic project {project_id}", 1, _fmt(created), _fmt(anchor)
+        )
+
+
+def _work_items(rng: random.Random, sizes: Dict[str, int], anchor: datetime) -> Iterator[Tuple]:
+    """Bug work items first (ids 1..bugs, one per bug), then other work items"""
+    for work_item_id in range(1, sizes["WorkItems"] + 1):
+        is_bug = work_item_id <= sizes["Bugs"]
+        project_id = rng.randrange(1, sizes["Projects"] + 1)
+        area = rng.choice(AREAS)
+        component = rng.choice(COMPONENTS)
+        if is_bug:
+            title = f"Bug: {rng.choice(PROBLEMS).capitalize()} in {component}"
+            work_item_type = "Bug"
+        else:
+            work_item_type = _weighted(rng, WORK_ITEM_TYPES)
+            title = f"{work_item_type}: Improve {component} {rng.choice(('logging', 'validation', 'caching', 'tests'))}"
+        created = _timestamp(anchor, rng)
+        changed = min(anchor, created + timedelta(days=rng.randrange(30), seconds=rng.randrange(86400)))
+        state = rng.choice(("New", "Active", "Closed", "Closed"))
+        yield (
+            work_item_id, 100000 + work_item_id, project_id, title, work_item_type, state,
+            rng.choice(PEOPLE), _fmt(created), _fmt(changed), _fmt(changed) if state == "Closed" else None,
+            rng.randrange(1, 5), f"Project{project_id:04d}\\Sprint {rng.randrange(1, 60)}",
+            f"Project{project_id:04d}\\{area}", ";".join(rng.sample(TAGS, rng.randrange(1, 4))), _fmt(anchor)
+        )
+
+
+def _bugs(rng: random.Random, sizes: Dict[str, int], anchor: datetime) -> Iterator[Tuple]:
+    for bug_id in range(1, sizes["Bugs"] + 1):
+        status = _weighted(rng, BUG_STATUSES)
+        severity = _weighted(rng, SEVERITIES)
+        fixed = verified = None
+        fixed_by = verified_by = resolution = None
+        if status == "Closed":
+            fixed = _timestamp(anchor, rng)
+            fixed_by = rng.choice(PEOPLE).split("@")[0]
+            resolution = f"Fixed {rng.choice(PROBLEMS)} in {rng.choice(COMPONENTS)}"
+            if rng.random() < 0.6:
+                verified = fixed + timedelta(hours=rng.randrange(1, 72))
+                verified_by = rng.choice(PEOPLE).split("@")[0]
+        notes = f"Reported by {rng.choice(AREAS)} team: {rng.choice(PROBLEMS)} when using {rng.choice(COMPONENTS)}."
+        yield (
+            bug_id, bug_id, str(100000 + bug_id), severity, resolution, fixed_by, _fmt(fixed),
+            verified_by, _fmt(verified), status, notes, _fmt(anchor)
+        )
+
+
+def _commits(rng: random.Random, sizes: Dict[str, int], anchor: datetime) -> Iterator[Tuple]:
+    for commit_id in range(1, sizes["Commits"] + 1):
+        work_item_id = rng.randrange(1, sizes["WorkItems"] + 1) if rng.random() < 0.7 else None
+        yield (
+            commit_id, f"{rng.getrandbits(64):016x}{commit_id:08x}", rng.randrange(1, sizes["Projects"] + 1),
+            rng.choice(PEOPLE), _fmt(_timestamp(anchor, rng)),
+            f"{rng.choice(('Fix', 'Add', 'Refactor', 'Update'))} {rng.choice(COMPONENTS)} {rng.choice(PROBLEMS)}",
+            rng.choice(BRANCHES), work_item_id, _fmt(anchor)
+        )
+
+
+def _pipelines(rng: random.Random, sizes: Dict[str, int], anchor: datetime) -> Iterator[Tuple]:
+    for pipeline_id in range(1, sizes["Pipelines"] + 1):
+        project_id = (pipeline_id - 1) // PIPELINES_PER_PROJECT + 1
+        yield (
+            pipeline_id, 1000 + pipeline_id, project_id,
+            f"Project{project_id:04d}.{rng.choice(AREAS)}.{rng.choice(('CI', 'Release', 'Nightly'))}",
+            rng.choice(TRIGGERS), rng.randrange(1000, 99999), _weighted(rng, PIPELINE_STATUSES),
+            _fmt(_timestamp(anchor, rng, 30)), rng.randrange(60, 3600), _fmt(anchor)
+        )
+
+
+def _pipeline_runs(rng: random.Random, sizes: Dict[str, int], anchor: datetime) -> Iterator[Tuple]:
+    # Earlier runs; their ids stay below the LastRunId range of _pipelines
+    for pipeline_id in range(1, sizes["Pipelines"] + 1):
+        project_id = (pipeline_id - 1) // PIPELINES_PER_PROJECT + 1
+        for run_id in range(1, RUNS_PER_PIPELINE):
+            yield (
+                pipeline_id, run_id, project_id, _weighted(rng, PIPELINE_STATUSES),
+                _fmt(_timestamp(anchor, rng, 180)), rng.randrange(60, 3600)
+            )
+
+
+INSERTS = (
+    ("Projects", "INSERT INTO Projects (ProjectId, AzureProjectId, ProjectName, Description, IsActive, CreatedOn, LastSync) "
+                 "VALUES (?, ?, ?, ?, ?, ?, ?)", lambda rng, sizes, anchor: _projects(sizes["Projects"], anchor)),
+    ("WorkItems", "INSERT INTO WorkItems (WorkItemId, AzureWorkItemId, ProjectId, Title, WorkItemType, State, AssignedTo, "
+                  "CreatedDate, ChangedDate, ClosedDate, Priority, IterationPath, AreaPath, Tags, LastSync) "
+                  "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", _work_items),
+    ("Bugs", "INSERT INTO Bugs (BugId, WorkItemId, AzureBugId, Severity, Resolution, FixedBy, FixedDate, VerifiedBy, "
+             "VerifiedDate, Status, Notes, LastSync) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", _bugs),
+    ("Commits", "INSERT INTO Commits (CommitId, AzureCommitId, ProjectId, Author, CommitDate, Comment, Branch, "
+                "AssociatedWorkItemId, LastSync) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", _commits),
+    ("Pipelines", "INSERT INTO Pipelines (PipelineId, AzurePipelineId, ProjectId, PipelineName, TriggerType, LastRunId, "
+                  "LastRunStatus, LastRunDate, DurationSeconds, LastSync) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", _pipelines),
+)
+
+# Tables created by later migrations, filled afterwards through their triggers
+HISTORY_INSERTS = (
+    ("PipelineRuns", "INSERT INTO PipelineRuns (PipelineId, RunId, ProjectId, Status, RunDate, DurationSeconds) "
+                     "VALUES (?, ?, ?, ?, ?, ?)", _pipeline_runs),
+)
+
+
+def generate(
+    db_path: str,
+    bugs: int,
+    seed: int = 42,
+    anchor: Optional[date] = None
+) -> Dict[str, object]:
+    """
+    Create a fresh database at ``db_path`` filled with synthetic data
+    
+    Args:
+        db_path: Output file; an existing file is replaced
+        bugs: Number of bugs; every other volume is derived from it
+        seed: Random seed
+        anchor: Date the history ends on (defaults to today, so trend
+            queries relative to "now" find data)
+    
+    Returns:
+        Dictionary with the row counts and generation time
+    """
+    anchor_time = datetime.combine(anchor or date.today(), datetime.min.time()) + timedelta(hours=18)
+    sizes = dataset_size(bugs)
+    path = Path(db_path)
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{path}{suffix}").unlink(missing_ok=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    started = time.perf_counter()
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=OFF")
+        # Load into the bare baseline tables; the later migrations then build
+        # indexes, the rollup and the search index in bulk instead of per row
+        migrate(conn, target=1)
+        
+        for table, sql, rows in INSERTS:
+            # Each table gets its own stream so changing one volume leaves the others unchanged
+            rng = random.Random(f"{seed}:{table}")
+            conn.executemany(sql, rows(rng, sizes, anchor_time))
+            conn.commit()
+        migrate(conn)
+        
+        for table, sql, rows in HISTORY_INSERTS:
+            rng = random.Random(f"{seed}:{table}")
+            conn.executemany(sql, rows(rng, sizes, anchor_time))
+            conn.commit()
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+    
+    return {
+        "rows": sizes,
+        "seed": seed,
+        "anchor": anchor_time.date().isoformat(),
+        "generate_seconds": round(time.perf_counter() - started, 3)
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.generator", description="Generate a synthetic DevOpsMCP database")
+    parser.add_argument("output", help="SQLite file to create")
+    parser.add_argument("--bugs", type=int, default=100000, help="Number of bugs (other volumes scale with it)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--anchor", type=date.fromisoformat, default=None, help="Last day of history (YYYY-MM-DD)")
+    args = parser.parse_args(argv)
+    print(generate(args.output, args.bugs, args.seed, args.anchor))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""
+Benchmark suite for BugService and the HTTP endpoints
+
+Every scale runs in its own subprocess against a generated database
+(the application binds DB_PATH at import time). Results are written as
+JSON and compared against the committed benchmarks/baseline.json (or
+--baseline): the run fails when a case's median time regresses by more
+than --threshold. Timings depend on the machine, so the baseline is
+recorded on the runner that enforces it; refresh it with
+``--no-baseline --output benchmarks/baseline.json`` after an intended
+change.
+
+Usage:
+    python -m benchmarks.run [--scales 10000,100000,1000000] [--repeat 20]
+        [--output benchmarks/results/latest.json]
+        [--baseline benchmarks/baseline.json | --no-baseline] [--threshold 0.25]
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Tuple
+
+BENCH_DIR = Path(__file__).parent
+DATA_DIR = BENCH_DIR / ".data"
+DEFAULT_OUTPUT = BENCH_DIR / "results" / "latest.json"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+# Differences below this are treated as noise regardless of the ratio
+MIN_REGRESSION_MS = 1.0
+
+
+def service_cases() -> List[Tuple[str, Callable[[], Any]]]:
+    """(name, callable) for every service method under test"""
+    from app.schemas.bug_schemas import (
+        GetBugFixTrendsRequest, GetBugTrendsRequest, GetActiveBugsRequest, GetBugsByStatusRequest,
+        GetBugStatisticsRequest, GetTimeToFixRequest, SearchBugsRequest, BatchAction
+    )
+    from app.schemas.commit_schemas import GetCommitActivityRequest, GetFixCommitsRequest
+    from app.schemas.pipeline_schemas import GetPipelineHealthRequest
+    from app.services.bug_service import bug_service
+    from app.services.commit_service import commit_service
+    from app.services.pipeline_service import pipeline_service
+    
+    return [
+        ("service.get_bug_fix_trends.30d", lambda: bug_service.get_bug_fix_trends(GetBugFixTrendsRequest(days_back=30))),
+        ("service.get_bug_fix_trends.365d_project",
+         lambda: bug_service.get_bug_fix_trends(GetBugFixTrendsRequest(days_back=365, project_id="1"))),
+        ("service.get_bug_trends.3y_weekly", lambda: bug_service.get_bug_trends(
+            GetBugTrendsRequest(days_back=3 * 365, rolling_window=4, compare_previous=True))),
+        ("service.get_active_bugs", lambda: bug_service.get_active_bugs(GetActiveBugsRequest())),
+        ("service.get_active_bugs.project_severity",
+         lambda: bug_service.get_active_bugs(GetActiveBugsRequest(project_id="2", severity="High"))),
+        ("service.get_bugs_by_status.closed",
+         lambda: bug_service.get_bugs_by_status(GetBugsByStatusRequest(status="Closed"))),
+        ("service.get_bug_statistics", lambda: bug_service.get_bug_statistics(GetBugStatisticsRequest())),
+        ("service.get_bug_statistics.project",
+         lambda: bug_service.get_bug_statistics(GetBugStatisticsRequest(project_id="3"))),
+        ("service.get_time_to_fix.365d", lambda: bug_service.get_time_to_fix(GetTimeToFixRequest(days_back=365))),
+        ("service.get_pipeline_health.90d",
+         lambda: pipeline_service.get_pipeline_health(GetPipelineHealthRequest(days_back=90))),
+        ("service.get_commit_activity.90d_weekly",
+         lambda: commit_service.get_commit_activity(GetCommitActivityRequest(days_back=90))),
+        ("service.get_fix_commits.1000",
+         lambda: commit_service.get_fix_commits(GetFixCommitsRequest(bug_ids=list(range(1, 2001, 2))))),
+        ("service.search_bugs", lambda: bug_service.search_bugs(SearchBugsRequest(query="checkout timeout"))),
+        ("service.search_bugs.any_filtered", lambda: bug_service.search_bugs(
+            SearchBugsRequest(query="deadlock crash", match="any", status="Active", project_id="1"))),
+        ("service.run_batch", lambda: bug_service.run_batch([
+            BatchAction(action="get_bug_statistics", params={"project_id": "1"}),
+            BatchAction(action="get_active_bugs", params={"project_id": "1", "limit": 50}),
+            BatchAction(action="get_bug_fix_trends", params={"days_back": 30, "project_id": "1"}),
+        ])),
+    ]
+
+
+def endpoint_cases(client) -> List[Tuple[str, Callable[[], Any]]]:
+    """
+    (name, callable) for every router endpoint under test
+    
+    /api/ingest/upsert is left out: it writes, so repeated runs would
+    change the dataset the other cases are timed against.
+    """
+    def post(path: str, body: Dict[str, Any], headers: Dict[str, str] = None):
+        def call():
+            response = client.post(path, json=body, headers=headers or {})
+            assert response.status_code == 200, f"{path} returned {response.status_code}"
+            return response.content
+        return call
+    
+    def get(path: str):
+        def call():
+            response = client.get(path)
+            assert response.status_code == 200, f"{path} returned {response.status_code}"
+            return response.content
+        return call
+    
+    return [
+        ("http.get_bug_fix_trends", post("/api/bugs/get_bug_fix_trends", {"days_back": 30})),
+        ("http.get_bug_trends", post("/api/bugs/get_bug_trends", {"granularity": "month", "days_back": 730})),
+        ("http.get_active_bugs", post("/api/bugs/get_active_bugs", {"limit": 100})),
+        ("http.get_active_bugs.ndjson",
+         post("/api/bugs/get_active_bugs", {"project_id": "1"}, {"Accept": "application/x-ndjson"})),
+        ("http.get_bugs_by_status", post("/api/bugs/get_bugs_by_status", {"status": "Closed"})),
+        ("http.get_bugs_by_status.ndjson",
+         post("/api/bugs/get_bugs_by_status", {"status": "Closed", "project_id": "1"},
+              {"Accept": "application/x-ndjson"})),
+        ("http.get_bug_statistics", post("/api/bugs/get_bug_statistics", {})),
+        ("http.get_time_to_fix", post("/api/bugs/get_time_to_fix", {"days_back": 365})),
+        ("http.get_pipeline_health", post("/api/pipelines/get_pipeline_health", {"days_back": 30})),
+        ("http.get_commit_activity", post("/api/commits/get_commit_activity", {"days_back": 90})),
+        ("http.get_fix_commits", post("/api/commits/get_fix_commits", {"bug_ids": list(range(1, 201))})),
+        ("http.search", post("/api/bugs/search", {"query": "null reference"})),
+        ("http.batch", post("/api/bugs/batch", {"actions": [
+            {"action": "get_bug_statistics"}, {"action": "get_active_bugs", "params": {"limit": 20}}
+        ]})),
+        ("http.bugs_health", get("/api/bugs/health")),
+        ("http.health", get("/health")),
+    ]
+
+
+def time_case(func: Callable[[], Any], repeat: int, warmup: int = 2) -> Dict[str, float]:
+    """Run ``func`` and summarise the wall-clock time per call in milliseconds"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "runs": repeat,
+        "min_ms": round(samples[0], 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "mean_ms": round(statistics.fmean(samples), 3)
+    }
+
+
+def run_scale(repeat: int, only: str = None) -> Dict[str, Dict[str, float]]:
+    """Time every case against the database named by DB_PATH (child process)"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    
+    results = {}
+    with TestClient(app) as client:
+        for name, func in service_cases() + endpoint_cases(client):
+            if only and only not in name:
+                continue
+            results[name] = time_case(func, repeat)
+            print(f"  {name:<45} median {results[name]['median_ms']:>9.3f} ms", file=sys.stderr)
+    return results
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    List the cases whose median regressed beyond the threshold
+    
+    Args:
+        current: Results document of this run
+        baseline: Results document to compare against
+        threshold: Allowed relative slowdown (0.25 = 25%)
+    """
+    regressions = []
+    for scale, cases in current["results"].items():
+        for name, timing in cases.items():
+            before = baseline.get("results", {}).get(scale, {}).get(name)
+            if not before:
+                continue
+            limit = before["median_ms"] * (1 + threshold)
+            if timing["median_ms"] > limit and timing["median_ms"] - before["median_ms"] > MIN_REGRESSION_MS:
+                regressions.append(
+                    f"{scale} {name}: {before['median_ms']:.3f} ms -> {timing['median_ms']:.3f} ms "
+                    f"(+{(timing['median_ms'] / before['median_ms'] - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def dataset_path(bugs: int, seed: int) -> Path:
+    return DATA_DIR / f"bench_{bugs}_{seed}.db"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="Benchmark DevOpsMCP at several data scales")
+    parser.add_argument("--scales", default="10000,100000", help="Comma-separated bug counts")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per case")
+    parser.add_argument("--only", default=None, help="Only run cases whose name contains this text")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--baseline", default=None, help=f"Results file to compare against (default: {DEFAULT_BASELINE.name})")
+    parser.add_argument("--no-baseline", action="store_true", help="Skip the regression check")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed median slowdown before failing")
+    parser.add_argument("--regenerate", action="store_true", help="Rebuild cached datasets")
+    parser.add_argument("--child-output", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    
+    if args.child_output:
+        # Logs go to stdout, so the child hands its results back in a file
+        Path(args.child_output).write_text(json.dumps(run_scale(args.repeat, args.only)))
+        return 0
+    
+    from benchmarks.generator import generate, dataset_size
+    
+    document = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "datasets": {},
+        "results": {}
+    }
+    for bugs in [int(scale) for scale in args.scales.split(",")]:
+        path = dataset_path(bugs, args.seed)
+        if args.regenerate or not path.exists():
+            print(f"Generating {bugs} bugs into {path} ...", file=sys.stderr)
+            generate(str(path), bugs, args.seed)
+        document["datasets"][str(bugs)] = dataset_size(bugs)
+        
+        print(f"Benchmarking {bugs} bugs", file=sys.stderr)
+        env = {
+            **os.environ,
+            "DB_PATH": str(path.resolve()),
+            "RESPONSE_CACHE_ENABLED": "false",  # measure the work, not cache hits
+            "LOG_LEVEL": "WARNING"
+        }
+        child_output = DATA_DIR / f"results_{bugs}.json"
+        command = [
+            sys.executable, "-m", "benchmarks.run",
+            "--child-output", str(child_output), "--repeat", str(args.repeat)
+        ]
+        if args.only:
+            command += ["--only", args.only]
+        subprocess.run(command, env=env, check=True, cwd=BENCH_DIR.parent)
+        document["results"][str(bugs)] = json.loads(child_output.read_text())
+        child_output.unlink()
+    
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(document, indent=2))
+    print(f"Results written to {output}", file=sys.stderr)
+    
+    baseline_path = None if args.no_baseline else Path(args.baseline) if args.baseline else DEFAULT_BASELINE
+    if baseline_path is not None and (args.baseline or baseline_path.exists()):
+        baseline = json.loads(baseline_path.read_text())
+        regressions = compare(document, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
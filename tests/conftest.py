@@ -0,0 +1,82 @@
+"""
+Shared test configuration
+
+Points the application at a throwaway SQLite database (created by the
+schema migrations, with the sample data, on first use) so tests never
+touch devops_mcp.db.
+"""
+import os
+import tempfile
+import uuid
+from typing import Optional, List, Tuple, Dict, Any
+
+_test_db_dir = tempfile.mkdtemp(prefix="devops_mcp_test_")
+os.environ["DB_PATH"] = os.path.join(_test_db_dir, "devops_mcp_test.db")
+
+# Imported after DB_PATH is set: the database manager binds it on import
+import pytest  # noqa: E402
+from app.database import db_manager  # noqa: E402
+
+
+class ScratchRows:
+    """
+    Rows a test adds to the shared test database, deleted again afterwards
+    
+    Keys come from the database (autoincrement ids, fresh labels or the
+    next free value of a column), so tests never rely on hand-picked ids
+    staying clear of the sample data and of each other. Rows are deleted
+    newest first, which also fires the rollup triggers in reverse.
+    """
+    
+    def __init__(self, db):
+        self.db = db
+        self._added: List[Tuple[str, Dict[str, Any]]] = []
+    
+    @staticmethod
+    def label(prefix: str = "SCRATCH") -> str:
+        """A unique text value for natural-key columns such as AzureBugId"""
+        return f"{prefix}-{uuid.uuid4().hex[:12]}"
+    
+    def next_value(self, table: str, column: str) -> int:
+        """An integer above every value of ``column`` in ``table``"""
+        return self.db.execute_query(f"SELECT COALESCE(MAX({column}), 0) + 1 AS n FROM {table}")[0]["n"]
+    
+    def insert(self, table: str, key: Optional[Tuple[str, ...]] = None, **values: Any) -> Any:
+        """
+        Insert one row and remember it for cleanup
+        
+        Args:
+            table: Table to insert into
+            key: Key columns of a WITHOUT ROWID table (default: the rowid)
+            **values: Column values
+        
+        Returns:
+            The new rowid (the BugId, CommitId, ... of the row), or the key
+            values for a WITHOUT ROWID table
+        """
+        columns = ", ".join(values)
+        placeholders = ", ".join("?" for _ in values)
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", tuple(values.values()))
+            conn.commit()
+        if key is None:
+            self._added.append((table, {"rowid": cursor.lastrowid}))
+            return cursor.lastrowid
+        row_key = {column: values[column] for column in key}
+        self._added.append((table, row_key))
+        return tuple(row_key.values())
+    
+    def clear(self):
+        """Delete every remembered row, newest first"""
+        while self._added:
+            table, row_key = self._added.pop()
+            where = " AND ".join(f"{column} = ?" for column in row_key)
+            self.db.execute_non_query(f"DELETE FROM {table} WHERE {where}", tuple(row_key.values()))
+
+
+@pytest.fixture
+def scratch():
+    """ScratchRows on the shared test database, cleaned up after the test"""
+    rows = ScratchRows(db_manager)
+    yield rows
+    rows.clear()
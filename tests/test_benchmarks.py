@@ -0,0 +1,72 @@
+"""
+Unit tests for the synthetic dataset generator and benchmark comparison
+"""
+import sqlite3
+from datetime import date
+from benchmarks.generator import generate, dataset_size
+from benchmarks.run import compare
+
+ANCHOR = date(2025, 12, 1)
+
+
+def _dump(path):
+    conn = sqlite3.connect(path)
+    try:
+        return {
+            table: conn.execute(f"SELECT * FROM {table} ORDER BY 1").fetchall()
+            for table in ("Projects", "WorkItems", "Bugs", "Commits", "Pipelines", "PipelineRuns")
+        }
+    finally:
+        conn.close()
+
+
+def test_generator_is_deterministic(tmp_path):
+    """Same scale, seed and anchor produce identical rows"""
+    first = generate(str(tmp_path / "a.db"), 300, seed=7, anchor=ANCHOR)
+    generate(str(tmp_path / "b.db"), 300, seed=7, anchor=ANCHOR)
+    generate(str(tmp_path / "c.db"), 300, seed=8, anchor=ANCHOR)
+    
+    a, b, c = (_dump(tmp_path / name) for name in ("a.db", "b.db", "c.db"))
+    assert a == b
+    assert a["Bugs"] != c["Bugs"]
+    
+    assert first["rows"] == dataset_size(300)
+    assert {table: len(rows) for table, rows in a.items()} == dataset_size(300)
+
+
+def test_generator_keeps_references_valid(tmp_path):
+    """Every bug points at a Bug work item of an existing project"""
+    path = tmp_path / "refs.db"
+    generate(str(path), 200, seed=1, anchor=ANCHOR)
+    conn = sqlite3.connect(path)
+    try:
+        orphans = conn.execute("""
+            SELECT COUNT(*) FROM Bugs b
+            LEFT JOIN WorkItems w ON b.WorkItemId = w.WorkItemId
+            LEFT JOIN Projects p ON w.ProjectId = p.ProjectId
+            WHERE w.WorkItemType IS NOT 'Bug' OR p.ProjectId IS NULL
+        """).fetchone()[0]
+        latest = conn.execute("SELECT MAX(FixedDate) FROM Bugs").fetchone()[0]
+    finally:
+        conn.close()
+    assert orphans == 0
+    assert latest <= "2025-12-01 23:59:59"
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    """Slowdowns past the threshold are reported; small absolute changes are noise"""
+    baseline = {"results": {"1000": {
+        "slow": {"median_ms": 10.0},
+        "ok": {"median_ms": 10.0},
+        "tiny": {"median_ms": 0.5}
+    }}}
+    current = {"results": {"1000": {
+        "slow": {"median_ms": 14.0},
+        "ok": {"median_ms": 12.0},
+        "tiny": {"median_ms": 1.2},
+        "new": {"median_ms": 99.0}
+    }}}
+    
+    regressions = compare(current, baseline, threshold=0.25)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("1000 slow:")
@@ -0,0 +1,71 @@
+"""
+Unit tests for the BugSearch full-text index
+"""
+import pytest
+from app.database import db_manager
+from app.schemas.bug_schemas import SearchBugsRequest
+from app.services.bug_search import build_match_query
+from app.services.bug_service import bug_service
+
+
+@pytest.fixture
+def scratch_bug():
+    """Insert a bug with distinctive notes and remove it afterwards"""
+    db_manager.execute_non_query(
+        "INSERT INTO Bugs (WorkItemId, AzureBugId, Severity, Status, Notes) VALUES (?, ?, ?, ?, ?)",
+        (1, "SEARCH-TEST", "Low", "Active", "Zanzibar gateway rejects refunds")
+    )
+    yield "SEARCH-TEST"
+    db_manager.execute_non_query("DELETE FROM Bugs WHERE AzureBugId = ?", ("SEARCH-TEST",))
+
+
+def search(query, **filters):
+    return bug_service.search_bugs(SearchBugsRequest(query=query, **filters))
+
+
+def test_match_query_quotes_operators():
+    """Caller input cannot inject FTS5 syntax"""
+    assert build_match_query('checkout "timeout" OR NEAR(') == '"checkout" AND "timeout" AND "OR" AND "NEAR"*'
+    assert build_match_query("login timeout", match_all=False) == '"login" OR "timeout"*'
+    assert build_match_query("?!") is None
+
+
+def test_triggers_keep_index_current(scratch_bug):
+    """Inserted, edited and deleted bugs are reflected in search results"""
+    assert [b.azure_bug_id for b in search("zanzibar refund").bugs] == [scratch_bug]
+    
+    db_manager.execute_non_query("UPDATE Bugs SET Notes = 'Madagascar outage' WHERE AzureBugId = ?", (scratch_bug,))
+    assert search("zanzibar").total_matches == 0
+    assert search("madagascar").total_matches == 1
+    
+    db_manager.execute_non_query("DELETE FROM Bugs WHERE AzureBugId = ?", (scratch_bug,))
+    assert search("madagascar").total_matches == 0
+
+
+def test_work_item_title_changes_are_indexed(scratch_bug):
+    """Renaming a work item updates the titles of its bugs in the index"""
+    title = db_manager.execute_query("SELECT Title FROM WorkItems WHERE WorkItemId = 1")[0]["Title"]
+    try:
+        db_manager.execute_non_query("UPDATE WorkItems SET Title = 'Quokka crash on checkout' WHERE WorkItemId = 1")
+        hits = search("quokka").bugs
+        assert scratch_bug in [b.azure_bug_id for b in hits]
+        assert all(b.title == "Quokka crash on checkout" for b in hits)
+    finally:
+        db_manager.execute_non_query("UPDATE WorkItems SET Title = ? WHERE WorkItemId = 1", (title,))
+
+
+def test_ranked_pages_cover_all_matches():
+    """Following next_cursor walks every match exactly once, best first"""
+    everything = search("timeout login", match="any", limit=100)
+    assert everything.total_matches == len(everything.bugs) > 2
+    ranks = [b.rank for b in everything.bugs]
+    assert ranks == sorted(ranks)
+    
+    seen, cursor = [], None
+    while True:
+        page = search("timeout login", match="any", limit=2, cursor=cursor)
+        seen.extend(b.bug_id for b in page.bugs)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert seen == [b.bug_id for b in everything.bugs]
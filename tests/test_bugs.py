@@ -1,6 +1,7 @@
 """
 Unit tests for bug-related endpoints
 """
+import json
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
@@ -80,5 +81,211 @@ def test_get_bug_fix_trends_validation_error():
     assert response.status_code == 422
 
 
+def test_get_bug_statistics_is_consistent():
+    """Test statistics totals agree with the per-project breakdown"""
+    response = client.post("/api/bugs/get_bug_statistics", json={})
+    assert response.status_code == 200
+    stats = response.json()["statistics"]
+    assert stats["total_bugs"] == sum(p["count"] for p in stats["by_project"])
+    assert stats["total_bugs"] == sum(stats["by_severity"].values())
+    for project in stats["by_project_breakdown"]:
+        assert project["total"] == sum(project["by_status"].values())
+        assert project["total"] == sum(
+            sum(severities.values()) for severities in project["by_status_severity"].values()
+        )
+
+
+def test_get_bug_statistics_project_filter():
+    """Test project filter applies to the by-project breakdown too"""
+    response = client.post("/api/bugs/get_bug_statistics", json={"project_name": "MobileApp"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["project_id"] == "3"
+    assert [p["project"] for p in data["statistics"]["by_project"]] == ["MobileApp"]
+
+
+def test_get_active_bugs_keyset_pagination():
+    """Test paging through active bugs returns every bug exactly once"""
+    seen = []
+    cursor = None
+    while True:
+        body = {"limit": 5}
+        if cursor:
+            body["cursor"] = cursor
+        response = client.post("/api/bugs/get_active_bugs", json=body)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["bugs"]) <= 5
+        seen.extend(bug["bug_id"] for bug in data["bugs"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    
+    everything = client.post("/api/bugs/get_active_bugs", json={"limit": 500}).json()
+    assert seen == sorted(seen)
+    assert seen == [bug["bug_id"] for bug in everything["bugs"]]
+
+
+def test_get_bugs_by_status_invalid_cursor():
+    """Test a tampered cursor is rejected as a validation error"""
+    response = client.post(
+        "/api/bugs/get_bugs_by_status",
+        json={"status": "Closed", "cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 422
+
+
+def test_get_bugs_by_status_ndjson_stream():
+    """Test NDJSON streaming returns the same bugs as the paged JSON response"""
+    response = client.post(
+        "/api/bugs/get_bugs_by_status",
+        json={"status": "Closed", "limit": 1},
+        headers={"Accept": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    streamed = [json.loads(line) for line in response.text.splitlines()]
+    
+    paged = client.post("/api/bugs/get_bugs_by_status", json={"status": "Closed", "limit": 500}).json()
+    assert streamed == paged["bugs"]
+
+
+def test_get_bug_statistics_conditional_request(monkeypatch):
+    """Test If-None-Match with a current ETag returns 304 without running the service"""
+    from app.database import db_manager
+    from app.services.bug_service import bug_service
+    
+    first = client.post("/api/bugs/get_bug_statistics", json={"project_id": "2"})
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    
+    async def fail(request):
+        raise AssertionError("service must not run for a matching ETag")
+    
+    with monkeypatch.context() as patch:
+        patch.setattr(bug_service, "get_bug_statistics_async", fail)
+        cached = client.post(
+            "/api/bugs/get_bug_statistics",
+            json={"project_id": "2"},
+            headers={"If-None-Match": etag}
+        )
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    
+    # Any write changes the data version and therefore the ETag
+    db_manager.execute_non_query("UPDATE SyncLog SET RecordsFetched = RecordsFetched + 1 WHERE SyncId = 1")
+    try:
+        changed = client.post(
+            "/api/bugs/get_bug_statistics",
+            json={"project_id": "2"},
+            headers={"If-None-Match": etag}
+        )
+    finally:
+        db_manager.execute_non_query("UPDATE SyncLog SET RecordsFetched = RecordsFetched - 1 WHERE SyncId = 1")
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_batch_matches_individual_calls():
+    """Test a batch returns the same results as calling each action separately"""
+    params = {"project_name": "HotRetailSys"}
+    response = client.post(
+        "/api/bugs/batch",
+        json={"actions": [
+            {"action": "get_bug_statistics", "params": params},
+            {"action": "get_active_bugs", "params": params},
+            {"action": "get_bugs_by_status", "params": {"limit": 10}}
+        ]}
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status_code"] for r in results] == [200, 200, 422]
+    
+    active = client.post("/api/bugs/get_active_bugs", json=params).json()
+    assert results[1]["result"] == active
+    stats = client.post("/api/bugs/get_bug_statistics", json=params).json()
+    assert results[0]["result"]["statistics"] == stats["statistics"]
+
+
+def test_batch_rejects_unknown_action():
+    """Test unknown action names fail request validation"""
+    response = client.post("/api/bugs/batch", json={"actions": [{"action": "drop_tables"}]})
+    assert response.status_code == 422
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+def test_search_bugs_endpoint():
+    """Search returns ranked hits with snippets and honours filters"""
+    response = client.post("/api/bugs/search", json={"query": "null reference", "status": "Closed"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_matches"] > 0
+    assert all(bug["status"] == "Closed" for bug in data["bugs"])
+    assert "[null]" in data["bugs"][0]["snippet"]
+    
+    unknown = client.post("/api/bugs/search", json={"query": "null", "project_name": "NoSuchProject"}).json()
+    assert unknown["total_matches"] == 0 and unknown["bugs"] == []
+    assert (unknown["project_id"], unknown["project_name"]) == (None, "NoSuchProject")
+    unknown = client.post("/api/bugs/search", json={"query": "null", "project_id": "999999"}).json()
+    assert (unknown["project_id"], unknown["project_name"]) == ("999999", None)
+    
+    assert client.post("/api/bugs/search", json={"query": "x", "cursor": "bogus"}).status_code == 422
+
+
+def test_fast_json_path_matches_response_model():
+    """Bodies serialized without FastAPI re-validation still match the declared response_model"""
+    from app.schemas.bug_schemas import GetBugsByStatusRequest, GetBugsByStatusResponse
+    from app.services.bug_service import bug_service
+    
+    response = client.post("/api/bugs/get_bugs_by_status", json={"status": "Closed", "limit": 500})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    expected = bug_service.get_bugs_by_status(GetBugsByStatusRequest(status="Closed", limit=500))
+    assert GetBugsByStatusResponse.model_validate_json(response.content) == expected
+    assert response.json() == json.loads(expected.model_dump_json())
+    
+    schema = app.openapi()["paths"]["/api/bugs/get_bugs_by_status"]["post"]["responses"]["200"]
+    assert schema["content"]["application/json"]["schema"] == {"$ref": "#/components/schemas/GetBugsByStatusResponse"}
+
+
+def test_columnar_format_round_trips_rows():
+    """format=columnar carries the same bugs as the row format, keys once and status/severity dictionary-encoded"""
+    rows = client.post("/api/bugs/get_bugs_by_status", json={"status": "Closed", "limit": 20})
+    columnar = client.post("/api/bugs/get_bugs_by_status", json={"status": "Closed", "limit": 20, "format": "columnar"})
+    assert columnar.status_code == 200
+    assert columnar.headers["ETag"] != rows.headers["ETag"]
+    assert len(columnar.content) < len(rows.content)
+    
+    data = columnar.json()
+    assert data["format"] == "columnar"
+    columns = data.pop("bugs")
+    expected = rows.json()
+    assert data.pop("next_cursor") == expected.pop("next_cursor")
+    assert {key: value for key, value in data.items() if key != "format"} == {
+        key: value for key, value in expected.items() if key != "bugs"
+    }
+    
+    decoded = {
+        key: [value["dictionary"][code] if code is not None else None for code in value["codes"]]
+        if isinstance(value, dict) else value
+        for key, value in columns.items()
+    }
+    assert [dict(zip(decoded, values)) for values in zip(*decoded.values())] == expected["bugs"]
+    assert columns["status"]["dictionary"] == ["Closed"]
+
+
+def test_compact_drops_redundant_sections():
+    """compact=true leaves out the SQL text and the chart copy of the daily data"""
+    full = client.post("/api/bugs/get_bug_fix_trends", json={"days_back": 30}).json()
+    compact = client.post("/api/bugs/get_bug_fix_trends", json={"days_back": 30, "compact": True}).json()
+    assert "sql_query" not in compact and "trend_graph_data" not in compact
+    assert compact == {key: value for key, value in full.items() if key not in ("sql_query", "trend_graph_data")}
+    
+    stats = client.post("/api/bugs/batch", json={"actions": [
+        {"action": "get_bug_statistics", "params": {"compact": True, "format": "columnar"}}
+    ]}).json()["results"][0]["result"]
+    assert "by_project" not in stats["statistics"]
+    assert isinstance(stats["statistics"]["by_project_breakdown"]["total"], list)
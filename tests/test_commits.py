@@ -0,0 +1,96 @@
+"""
+Unit tests for commit activity and bug-to-commit analytics
+"""
+from datetime import datetime, timedelta
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.commit_service import batches
+
+client = TestClient(app)
+
+# (days ago, author, branch) of scratch commits in project 6
+SCRATCH_COMMITS = (
+    (1, "ann@example.local", "main"), (1, "ann@example.local", "main"),
+    (3, "ben@example.local", "main"), (10, "ann@example.local", "feature/x"),
+)
+
+
+def add_commit(scratch, author: str, commit_date: str, branch: str = "main") -> int:
+    """Insert a scratch commit of project 6 and return its CommitId"""
+    return scratch.insert(
+        "Commits", AzureCommitId=scratch.label("COMMIT"), ProjectId=6, Author=author,
+        CommitDate=commit_date, Comment="Scratch commit", Branch=branch
+    )
+
+
+@pytest.fixture
+def scratch_commits(scratch):
+    """Recent commits of project 6, removed afterwards"""
+    now = datetime.now()
+    for days_ago, author, branch in SCRATCH_COMMITS:
+        add_commit(scratch, author, (now - timedelta(days=days_ago)).strftime('%Y-%m-%d %H:%M:%S'), branch)
+
+
+def test_batches_split_in_order():
+    """IN lists are cut into consecutive chunks of the batch size"""
+    assert [len(batch) for batch in batches(list(range(1201)))] == [500, 500, 201]
+    assert list(batches([3, 1, 2], 2)) == [[3, 1], [2]]
+
+
+def test_get_commit_activity_endpoint(scratch_commits):
+    """Dense daily series per author, most active first, the rest summed"""
+    response = client.post("/api/commits/get_commit_activity", json={
+        "group_by": "author", "granularity": "day", "days_back": 20, "project_id": "6"
+    })
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["bucket_starts"]) == 21
+    assert data["total_commits"] == 4
+    ann, ben = data["series"]
+    assert (ann["name"], ann["total_commits"], ben["name"], ben["total_commits"]) == (
+        "ann@example.local", 3, "ben@example.local", 1
+    )
+    assert ann["counts"][-2] == 2 and ann["counts"][-11] == 1 and sum(ann["counts"]) == 3
+    assert ben["counts"][-4] == 1
+    assert data["other_commits"] == 0
+    
+    branches = client.post("/api/commits/get_commit_activity", json={
+        "group_by": "branch", "granularity": "month", "days_back": 20, "project_name": "AltshulerCustomers", "top": 1
+    }).json()
+    assert [(series["name"], series["total_commits"]) for series in branches["series"]] == [("main", 3)]
+    assert branches["other_commits"] == 1
+
+
+def test_get_fix_commits_endpoint():
+    """Each found bug lists its work item's commits; unknown BugIds are reported"""
+    response = client.post("/api/commits/get_fix_commits", json={"bug_ids": [56, 1, 6, 999999, 1]})
+    assert response.status_code == 200
+    data = response.json()
+    assert [bug["bug_id"] for bug in data["bugs"]] == [1, 6, 56]
+    assert [commit["azure_commit_id"] for commit in data["bugs"][0]["commits"]] == ["c44b1ab0"]
+    assert data["bugs"][1]["commits"] == []
+    assert data["bugs"][2]["commits"][0]["comment"] == "Fix duplicate customer search results"
+    assert data["missing_bug_ids"] == [999999]
+    assert data["total_commits"] == 2
+    
+    # More BugIds than one IN-list batch
+    many = client.post("/api/commits/get_fix_commits", json={"bug_ids": list(range(1, 1001))}).json()
+    assert {1, 56} <= {bug["bug_id"] for bug in many["bugs"]}
+    assert len(many["bugs"]) + len(many["missing_bug_ids"]) == 1000
+    
+    assert client.post("/api/commits/get_fix_commits", json={"bug_ids": []}).status_code == 422
+
+
+def test_commit_activity_skips_dates_outside_buckets(scratch):
+    """Offset-suffixed dates that DATE() moves past the period are skipped, not a 500"""
+    today = datetime.now().strftime('%Y-%m-%d')
+    for commit_date in (f"{today}T23:30:00-05:00", f"{today}Z", f"{today} 09:00:00"):
+        add_commit(scratch, "cat@example.local", commit_date)
+    
+    response = client.post("/api/commits/get_commit_activity", json={
+        "group_by": "author", "granularity": "day", "days_back": 2, "project_id": "6"
+    })
+    assert response.status_code == 200
+    series = {series["name"]: series for series in response.json()["series"]}
+    assert series["cat@example.local"]["counts"][-1] == series["cat@example.local"]["total_commits"] == 1
@@ -0,0 +1,91 @@
+"""
+Unit tests for the time-to-fix sketches
+"""
+import random
+from datetime import datetime, timedelta
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.database import db_manager
+from app.services.cycle_time import cycle_time_sketches, RELATIVE_ACCURACY
+
+client = TestClient(app)
+
+# Hours from work item creation to fix for the scratch bugs
+SCRATCH_HOURS = (2, 2, 30, 30, 30, 100, 400, 1000)
+
+
+def exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+@pytest.fixture
+def scratch_bugs(scratch):
+    """BugIds of closed bugs in project 1, fixed within the last 60 days after known durations"""
+    created = datetime.now() - timedelta(days=1, hours=max(SCRATCH_HOURS))
+    # A work item of its own: the sketch triggers read CreatedDate as bugs land
+    work_item_id = scratch.insert(
+        "WorkItems", AzureWorkItemId=scratch.next_value("WorkItems", "AzureWorkItemId"), ProjectId=1,
+        Title="Time-to-fix scratch", WorkItemType="Bug", CreatedDate=created.strftime('%Y-%m-%d %H:%M:%S')
+    )
+    bug_ids = []
+    for hours in SCRATCH_HOURS:
+        fixed = created + timedelta(hours=hours)
+        bug_ids.append(scratch.insert(
+            "Bugs", WorkItemId=work_item_id, AzureBugId=scratch.label("TTF"), Severity="TTF",
+            FixedDate=fixed.strftime('%Y-%m-%d %H:%M:%S'),
+            VerifiedDate=(fixed + timedelta(hours=5)).strftime('%Y-%m-%d %H:%M:%S'), Status="Closed"
+        ))
+    return bug_ids
+
+
+def test_sketch_quantiles_within_accuracy_and_mergeable():
+    """Percentiles of merged sketches stay within the advertised relative error"""
+    rng = random.Random(7)
+    bounds = cycle_time_sketches.bounds()
+    uppers = sorted((upper, bucket) for bucket, (lower, upper) in bounds.items())
+    
+    def bucket_of(hours):
+        return next(bucket for upper, bucket in uppers if upper >= hours)
+    
+    samples = [rng.lognormvariate(4, 1.5) for _ in range(5000)]
+    first, second = cycle_time_sketches.sketch(), cycle_time_sketches.sketch()
+    for index, hours in enumerate(samples):
+        (first if index % 2 else second).add(bucket_of(hours))
+    first.merge(second)
+    
+    assert first.total == len(samples)
+    for q in (0.5, 0.9, 0.99):
+        exact = exact_quantile(samples, q)
+        assert abs(first.quantile(q) - exact) <= exact * RELATIVE_ACCURACY * 1.01
+
+
+def test_triggers_keep_sketches_consistent(scratch_bugs):
+    """Inserted, re-dated, reopened and deleted bugs keep the sketches exact"""
+    assert cycle_time_sketches.check()["consistent"]
+    first, second, third, fourth = scratch_bugs[:4]
+    db_manager.execute_non_query("UPDATE Bugs SET FixedDate = datetime(FixedDate, '+3 hours') WHERE BugId = ?", (first,))
+    db_manager.execute_non_query("UPDATE Bugs SET Status = 'Active' WHERE BugId = ?", (second,))
+    db_manager.execute_non_query("UPDATE Bugs SET VerifiedDate = NULL, Severity = NULL WHERE BugId = ?", (third,))
+    db_manager.execute_non_query("DELETE FROM Bugs WHERE BugId = ?", (fourth,))
+    assert cycle_time_sketches.check()["consistent"]
+
+
+def test_get_time_to_fix_endpoint(scratch_bugs):
+    """Percentiles, histogram and breakdowns for bugs fixed in the period"""
+    response = client.post("/api/bugs/get_time_to_fix", json={"days_back": 60, "severity": "TTF", "project_id": "1"})
+    assert response.status_code == 200
+    data = response.json()
+    overall = data["overall"]
+    assert overall["count"] == len(SCRATCH_HOURS)
+    assert overall["p50_hours"] == pytest.approx(30, rel=RELATIVE_ACCURACY)
+    assert overall["p99_hours"] == pytest.approx(400, rel=RELATIVE_ACCURACY)
+    assert {row["label"]: row["count"] for row in data["histogram"]} == {
+        "< 1h": 0, "1-4h": 2, "4-24h": 0, "1-3d": 3, "3-7d": 1, "1-2w": 0, "2-4w": 1, "1-3mo": 1, "> 3mo": 0
+    }
+    assert [row["severity"] for row in data["by_severity"]] == ["TTF"]
+    assert data["by_project"][0]["project_id"] == 1 and data["by_project"][0]["count"] == len(SCRATCH_HOURS)
+    
+    verify = client.post("/api/bugs/get_time_to_fix", json={"days_back": 60, "severity": "TTF", "metric": "verify"}).json()
+    assert verify["overall"]["p90_hours"] == pytest.approx(5, rel=RELATIVE_ACCURACY)
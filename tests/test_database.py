@@ -0,0 +1,104 @@
+"""
+Unit tests for the SQLite connection pool and async execution layer
+"""
+import asyncio
+import threading
+import pytest
+from app.database import ConnectionPool, PoolTimeoutError, db_manager
+
+
+@pytest.fixture
+def pool(tmp_path):
+    """Small pool over a scratch database"""
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=2, timeout=0.05)
+    yield pool
+    pool.close()
+
+
+def test_connections_are_reused(pool):
+    """Released connections are handed out again instead of reopened"""
+    conn = pool.acquire()
+    pool.release(conn)
+    assert pool.acquire() is conn
+    assert pool.stats()["connections_open"] == 1
+
+
+def test_connections_are_preconfigured(pool):
+    """New connections get WAL journaling and the tuned PRAGMAs"""
+    conn = pool.acquire()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -16384
+    pool.release(conn)
+
+
+def test_exhausted_pool_times_out(pool):
+    """Acquiring beyond capacity waits and then raises PoolTimeoutError"""
+    first, second = pool.acquire(), pool.acquire()
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+    stats = pool.stats()
+    assert stats["connections_in_use"] == 2
+    assert stats["waits"] == 0
+    assert stats["timeouts"] == 1
+    pool.release(first)
+    pool.release(second)
+
+
+def test_release_rolls_back_open_transaction(pool):
+    """Uncommitted work is discarded before a connection is reused"""
+    conn = pool.acquire()
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.commit()
+    conn.execute("INSERT INTO t VALUES (1)")
+    pool.release(conn)
+    conn = pool.acquire()
+    assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+    pool.release(conn)
+
+
+def test_db_manager_reports_pool_stats():
+    """The application database manager exposes pool statistics"""
+    db_manager.execute_query("SELECT 1")
+    stats = db_manager.pool_stats()
+    assert stats["pool_size"] >= 1
+    assert stats["acquisitions"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_run_async_executes_off_the_event_loop():
+    """Blocking calls run concurrently on worker threads, not the loop thread"""
+    barrier = threading.Barrier(2, timeout=5)
+    loop_thread = threading.get_ident()
+    
+    def blocking_call():
+        barrier.wait()  # Deadlocks unless both calls run at the same time
+        return threading.get_ident()
+    
+    first, second = await asyncio.gather(
+        db_manager.run_async(blocking_call),
+        db_manager.run_async(blocking_call)
+    )
+    assert loop_thread not in (first, second)
+    assert first != second
+
+
+@pytest.mark.asyncio
+async def test_execute_query_async():
+    """Async query helper returns the same rows as the blocking one"""
+    rows = await db_manager.execute_query_async("SELECT ? AS value", (42,))
+    assert rows == [{"value": 42}]
+
+
+def test_read_snapshot_shares_one_connection():
+    """Queries inside a snapshot reuse its connection and transaction"""
+    acquisitions = db_manager.pool_stats()["acquisitions"]
+    with db_manager.read_snapshot() as snapshot:
+        with db_manager.get_connection() as conn:
+            assert conn is snapshot
+            assert conn.in_transaction
+        db_manager.execute_query("SELECT COUNT(*) FROM Bugs")
+        db_manager.execute_query("SELECT COUNT(*) FROM Projects")
+    assert db_manager.pool_stats()["acquisitions"] == acquisitions + 1
+    assert not snapshot.in_transaction
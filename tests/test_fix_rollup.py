@@ -0,0 +1,55 @@
+"""
+Unit tests for the BugDailyFixes rollup
+"""
+import pytest
+from app.cli import main
+from app.database import db_manager
+from app.services.fix_rollup import bug_fix_rollup
+
+
+@pytest.fixture
+def scratch_bug(scratch):
+    """BugId of a closed bug of project 1 on a far-off day, removed afterwards"""
+    return scratch.insert(
+        "Bugs", WorkItemId=1, AzureBugId=scratch.label("ROLLUP"), Severity="Low",
+        FixedDate="2001-02-03 10:00:00", Status="Closed"
+    )
+
+
+def fixed_count(project_id, day):
+    rows = db_manager.execute_query(
+        "SELECT FixedCount FROM BugDailyFixes WHERE ProjectId = ? AND Day = ?",
+        (project_id, day)
+    )
+    return rows[0]["FixedCount"] if rows else 0
+
+
+def test_rollup_matches_bugs():
+    """The rollup built from the seed data agrees with a fresh aggregation"""
+    assert bug_fix_rollup.check()["consistent"]
+
+
+def test_triggers_track_insert_update_delete(scratch_bug):
+    """Inserting, moving and deleting a closed bug updates the rollup in place"""
+    assert fixed_count(1, "2001-02-03") == 1
+
+    db_manager.execute_non_query(
+        "UPDATE Bugs SET FixedDate = ? WHERE BugId = ?", ("2001-02-04 09:00:00", scratch_bug)
+    )
+    assert fixed_count(1, "2001-02-03") == 0
+    assert fixed_count(1, "2001-02-04") == 1
+
+    db_manager.execute_non_query("UPDATE Bugs SET Status = 'Active' WHERE BugId = ?", (scratch_bug,))
+    assert fixed_count(1, "2001-02-04") == 0
+    assert bug_fix_rollup.check()["consistent"]
+
+
+def test_check_detects_and_repairs_drift(capsys):
+    """The rollup-check command reports drift and rebuilds the table"""
+    db_manager.execute_non_query(
+        "INSERT INTO BugDailyFixes (ProjectId, Day, FixedCount) VALUES (?, ?, ?)", (1, "1999-01-01", 5)
+    )
+    assert main(["rollup-check"]) == 1
+    assert '"1999-01-01"' in capsys.readouterr().out
+    assert main(["rollup-check", "--repair"]) == 0
+    assert bug_fix_rollup.check()["consistent"]
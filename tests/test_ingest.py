@@ -0,0 +1,85 @@
+"""
+Unit tests for bulk upsert ingestion
+"""
+import json
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.cli import main
+from app.database import db_manager
+from app.services.project_catalog import project_catalog
+
+client = TestClient(app)
+
+PROJECT_GUID = "00000000-0000-4000-8000-00000000beef"
+
+
+@pytest.fixture
+def batch():
+    """A batch introducing a project with one work item and its bug; removed afterwards"""
+    yield {
+        "source": "test-sync",
+        "projects": [{"azure_project_id": PROJECT_GUID, "project_name": "IngestTestProject"}],
+        "work_items": [
+            {
+                "azure_work_item_id": 990001,
+                "azure_project_id": PROJECT_GUID,
+                "title": "Ingested work item",
+                "work_item_type": "Bug",
+                "state": "Active",
+                "changed_date": "2025-11-20T10:00:00"
+            },
+            {"azure_work_item_id": 990002, "azure_project_id": "no-such-project", "title": "Orphan"}
+        ],
+        "bugs": [{"azure_bug_id": "990001", "azure_work_item_id": 990001, "severity": "High", "status": "Active"}]
+    }
+    db_manager.execute_non_query("DELETE FROM Bugs WHERE AzureBugId = ?", ("990001",))
+    db_manager.execute_non_query("DELETE FROM WorkItems WHERE AzureWorkItemId IN (990001, 990002)")
+    db_manager.execute_non_query("DELETE FROM Projects WHERE AzureProjectId = ?", (PROJECT_GUID,))
+    db_manager.execute_non_query("DELETE FROM SyncLog WHERE Source IN ('test-sync', 'test-cli')")
+    project_catalog.invalidate()
+
+
+def test_upsert_inserts_then_updates(batch):
+    """Re-sending a batch updates rows in place instead of duplicating them"""
+    response = client.post("/api/ingest/upsert", json=batch)
+    assert response.status_code == 200
+    results = {r["entity_type"]: r for r in response.json()["results"]}
+    assert results["Project"]["records_upserted"] == 1
+    assert results["WorkItem"]["records_upserted"] == 1
+    assert results["WorkItem"]["records_skipped"] == 1  # unknown project
+    assert results["Bug"]["records_upserted"] == 1
+    
+    batch["bugs"][0].update(status="Closed", fixed_date="2025-11-21T09:30:00")
+    assert client.post("/api/ingest/upsert", json=batch).status_code == 200
+    
+    bugs = db_manager.execute_query(
+        "SELECT b.Status, b.FixedDate, w.Title FROM Bugs b JOIN WorkItems w ON b.WorkItemId = w.WorkItemId "
+        "WHERE b.AzureBugId = ?",
+        ("990001",)
+    )
+    assert bugs == [{"Status": "Closed", "FixedDate": "2025-11-21 09:30:00", "Title": "Ingested work item"}]
+
+
+def test_upsert_records_sync_log_and_refreshes_catalog(batch):
+    """Each entity type gets a SyncLog row and new projects become resolvable"""
+    assert client.post("/api/ingest/upsert", json=batch).status_code == 200
+    
+    log = db_manager.execute_query(
+        "SELECT EntityType, RecordsFetched, RecordsUpdated, IsSuccess FROM SyncLog "
+        "WHERE Source = 'test-sync' ORDER BY SyncId"
+    )
+    assert [row["EntityType"] for row in log] == ["Project", "WorkItem", "Bug"]
+    assert log[1]["RecordsFetched"] == 2 and log[1]["RecordsUpdated"] == 1
+    assert all(row["IsSuccess"] == 1 for row in log)
+    
+    assert project_catalog.resolve(None, "IngestTestProject") is not None
+
+
+def test_cli_ingest(batch, tmp_path, capsys):
+    """The ingest command loads a batch file"""
+    batch["source"] = "test-cli"
+    path = tmp_path / "batch.json"
+    path.write_text(json.dumps(batch))
+    assert main(["ingest", str(path)]) == 0
+    assert '"records_upserted": 1' in capsys.readouterr().out
@@ -0,0 +1,76 @@
+"""
+Unit tests for the logging pipeline
+"""
+import json
+import logging
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.database import db_manager
+from app.logging_setup import CorrelationIdFilter, SamplingFilter, JsonFormatter, correlation_id
+
+client = TestClient(app)
+
+
+class RecordCollector(logging.Handler):
+    """Collect records stamped with the correlation id"""
+    
+    def __init__(self):
+        super().__init__(level=logging.DEBUG)
+        self.addFilter(CorrelationIdFilter())
+        self.records = []
+    
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def collector():
+    handler = RecordCollector()
+    db_logger = logging.getLogger("app.database")
+    previous = db_logger.level
+    db_logger.addHandler(handler)
+    db_logger.setLevel(logging.DEBUG)
+    yield handler
+    db_logger.removeHandler(handler)
+    db_logger.setLevel(previous)
+
+
+@pytest.mark.asyncio
+async def test_correlation_id_reaches_worker_threads(collector):
+    """Records logged by queries on the worker pool carry the caller's id"""
+    token = correlation_id.set("req-123")
+    try:
+        await db_manager.execute_query_async("SELECT 1 AS One")
+    finally:
+        correlation_id.reset(token)
+    
+    query_records = [r for r in collector.records if r.getMessage().startswith("Query executed")]
+    assert query_records
+    assert all(r.correlation_id == "req-123" for r in query_records)
+
+
+def test_request_id_is_echoed():
+    """A supplied X-Request-ID is echoed back, and one is generated otherwise"""
+    assert client.get("/", headers={"X-Request-ID": "abc"}).headers["X-Request-ID"] == "abc"
+    assert client.get("/").headers["X-Request-ID"]
+
+
+def test_sampling_keeps_warnings():
+    """Sampling drops low-severity records but never warnings or errors"""
+    drop_all = SamplingFilter(0.0)
+    debug = logging.LogRecord("app.database", logging.DEBUG, __file__, 1, "query", None, None)
+    warning = logging.LogRecord("app.database", logging.WARNING, __file__, 1, "slow", None, None)
+    assert not drop_all.filter(debug)
+    assert drop_all.filter(warning)
+    assert SamplingFilter(1.0).filter(debug)
+
+
+def test_json_formatter_renders_lazily_formatted_message():
+    """Arguments are merged into the message only when the record is formatted"""
+    record = logging.LogRecord("app.test", logging.INFO, __file__, 1, "returned %s rows", (3,), None)
+    record.correlation_id = "req-9"
+    payload = json.loads(JsonFormatter().format(record))
+    assert payload["message"] == "returned 3 rows"
+    assert payload["correlation_id"] == "req-9"
+    assert payload["level"] == "INFO"
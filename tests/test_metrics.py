@@ -0,0 +1,60 @@
+"""
+Unit tests for request and query metrics
+"""
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.metrics import MetricsRegistry, http_requests_total, db_query_duration_seconds
+
+client = TestClient(app)
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Histogram buckets are cumulative and end with +Inf, _sum and _count"""
+    registry = MetricsRegistry()
+    latency = registry.histogram("test_latency_seconds", "Test latency", ("route",), buckets=(0.1, 1.0))
+    latency.observe(0.05, route="/a")
+    latency.observe(0.5, route="/a")
+    latency.observe(5, route="/a")
+    
+    text = registry.render()
+    assert "# TYPE test_latency_seconds histogram" in text
+    assert 'test_latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'test_latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'test_latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'test_latency_seconds_count{route="/a"} 3' in text
+
+
+def test_labels_must_match_declaration():
+    """Observing with the wrong label set is rejected"""
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "Test counter", ("kind",))
+    with pytest.raises(ValueError):
+        counter.inc(route="/a")
+
+
+def test_metrics_endpoint_reports_requests_and_queries():
+    """Endpoint latency is labelled by route template and queries are timed"""
+    before = http_requests_total.value(method="POST", route="/api/bugs/get_active_bugs", status="200")
+    queries_before = db_query_duration_seconds.count(kind="query")
+    
+    assert client.post("/api/bugs/get_active_bugs", json={"limit": 5}).status_code == 200
+    
+    assert http_requests_total.value(method="POST", route="/api/bugs/get_active_bugs", status="200") == before + 1
+    assert db_query_duration_seconds.count(kind="query") > queries_before
+    
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    assert 'devops_mcp_http_request_duration_seconds_bucket{method="POST",route="/api/bugs/get_active_bugs",le="+Inf"}' in text
+    assert 'devops_mcp_db_connections{state="open"}' in text
+    assert "devops_mcp_response_cache_lookups_total" in text
+    assert 'devops_mcp_http_requests_in_flight{route="/metrics"} 1' in text
+
+
+def test_unknown_paths_share_one_series():
+    """Unmatched paths do not create a series per URL"""
+    client.get("/no/such/path/1")
+    client.get("/no/such/path/2")
+    assert http_requests_total.value(method="GET", route="unmatched", status="404") >= 2
@@ -0,0 +1,147 @@
+"""
+Unit tests for the versioned schema migrations
+"""
+import sqlite3
+import pytest
+from app.cli import main
+from app.database import db_manager
+from app.migrations import (
+    MIGRATIONS, LATEST_VERSION, MAX_REPORTED_DUPLICATES, SCHEMA_PATH, UPSERT_KEYS_DDL, DuplicateKeyError,
+    Migration, apply_migration, get_version, migrate, migration_status, split_statements
+)
+
+
+@pytest.fixture
+def conn(tmp_path):
+    connection = sqlite3.connect(tmp_path / "migrate.db")
+    connection.execute("PRAGMA journal_mode=WAL")
+    yield connection
+    connection.close()
+
+
+def names(conn, kind):
+    return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = ?", (kind,))}
+
+
+def test_split_statements_keeps_trigger_bodies_whole():
+    """Semicolons inside trigger bodies and string literals do not split statements"""
+    statements = split_statements("""
+        -- comment
+        CREATE TABLE T (A TEXT);
+        CREATE TRIGGER TR AFTER INSERT ON T BEGIN
+            UPDATE T SET A = 'x;y';
+            DELETE FROM T WHERE A = '';
+        END;
+        INSERT INTO T VALUES ('a;b');
+    """)
+    assert len(statements) == 3
+    assert statements[1].startswith("CREATE TRIGGER") and statements[1].endswith("END;")
+
+
+def test_fresh_database_gets_schema_and_seed(conn):
+    """A new database is built up to the latest version with the sample data"""
+    assert migrate(conn, seed=True) == [migration.version for migration in MIGRATIONS]
+    assert get_version(conn) == LATEST_VERSION
+    assert {"BugDailyFixes", "BugSearch", "SyncWatermarks", "BugCycleTimeSketches", "PipelineRuns", "PipelineDailyRuns"} <= names(conn, "table")
+    assert {"IX_Bugs_Status_FixedDate", "UX_Bugs_AzureBugId"} <= names(conn, "index")
+    
+    bugs = conn.execute("SELECT COUNT(*) FROM Bugs").fetchone()[0]
+    assert bugs > 0
+    # Triggers filled the derived tables while the seed rows went in
+    assert conn.execute("SELECT COUNT(*) FROM BugSearch").fetchone()[0] == bugs
+    assert conn.execute("SELECT COUNT(*) FROM BugDailyFixes").fetchone()[0] > 0
+
+
+def test_production_skips_seed(conn):
+    """Without seeding the schema is complete but empty"""
+    migrate(conn, seed=False)
+    assert get_version(conn) == LATEST_VERSION
+    assert conn.execute("SELECT COUNT(*) FROM Bugs").fetchone()[0] == 0
+
+
+def test_migrate_is_idempotent(conn):
+    """Running again applies nothing and never re-seeds"""
+    migrate(conn, seed=True)
+    bugs = conn.execute("SELECT COUNT(*) FROM Bugs").fetchone()[0]
+    assert migrate(conn, seed=True) == []
+    assert conn.execute("SELECT COUNT(*) FROM Bugs").fetchone()[0] == bugs
+    assert migration_status(conn)["pending"] == []
+
+
+def test_legacy_database_is_upgraded_and_backfilled(conn):
+    """A version-0 database created from the old script gains the later objects with its data"""
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.executescript("""
+        INSERT INTO Projects (ProjectId, AzureProjectId, ProjectName) VALUES (1, 'p-1', 'Legacy');
+        INSERT INTO WorkItems (WorkItemId, AzureWorkItemId, ProjectId, Title) VALUES (1, 11, 1, 'Checkout timeout');
+        INSERT INTO Bugs (WorkItemId, AzureBugId, Status, FixedDate) VALUES (1, 'B-1', 'Closed', '2025-03-04 10:00:00');
+    """)
+    assert get_version(conn) == 0
+    
+    migrate(conn, seed=True)
+    assert get_version(conn) == LATEST_VERSION
+    # Not a fresh database, so no sample data was added
+    assert conn.execute("SELECT COUNT(*) FROM Bugs").fetchone()[0] == 1
+    assert conn.execute("SELECT ProjectId, Day, FixedCount FROM BugDailyFixes").fetchall() == [(1, "2025-03-04", 1)]
+    assert conn.execute("SELECT rowid FROM BugSearch WHERE BugSearch MATCH 'timeout'").fetchall() == [(1,)]
+
+
+def test_failed_step_rolls_back_and_keeps_version(conn):
+    """An index build failing partway through an online step rolls back without recording the version"""
+    migrate(conn, target=2)
+    conn.executescript("""
+        INSERT INTO Bugs (AzureBugId, Status) VALUES ('dup', 'Active');
+        INSERT INTO Bugs (AzureBugId, Status) VALUES ('dup', 'Closed');
+    """)
+    # Migration 3 without its duplicate check: the last index build fails
+    step = Migration(3, "test", UPSERT_KEYS_DDL, online=True)
+    with pytest.raises(sqlite3.IntegrityError):
+        apply_migration(conn, step)
+    assert get_version(conn) == 2
+    assert not conn.in_transaction
+    assert {"UX_Projects_AzureProjectId", "UX_WorkItems_AzureWorkItemId"} <= names(conn, "index")
+    assert "UX_Bugs_AzureBugId" not in names(conn, "index")
+    
+    conn.execute("DELETE FROM Bugs WHERE Status = 'Closed'")
+    conn.commit()
+    assert migrate(conn) == [3, 4, 5, 6, 7, 8, 9]
+
+
+def test_duplicate_natural_keys_are_named(conn):
+    """Migration 3 refuses duplicate Azure ids up front, listing them per key"""
+    migrate(conn, target=2)
+    conn.execute("INSERT INTO Projects (AzureProjectId, ProjectName) VALUES ('p-1', 'A')")
+    conn.execute("INSERT INTO Projects (AzureProjectId, ProjectName) VALUES ('p-1', 'B')")
+    for index in range(MAX_REPORTED_DUPLICATES + 1):
+        for _ in range(2):
+            conn.execute("INSERT INTO Bugs (AzureBugId) VALUES (?)", (f"B-{index:02d}",))
+    conn.commit()
+    
+    with pytest.raises(DuplicateKeyError) as error:
+        migrate(conn)
+    message = str(error.value)
+    assert "Projects.AzureProjectId: 'p-1' (2 rows)" in message
+    assert "'B-09' (2 rows), ..." in message
+    assert "B-10" not in message
+    assert get_version(conn) == 2
+    assert "UX_Projects_AzureProjectId" not in names(conn, "index")
+
+
+def test_online_step_commits_each_statement(conn):
+    """An interrupted online step keeps the indexes it built and finishes on the next run"""
+    migrate(conn, target=1)
+    step = Migration(2, "test", """
+        CREATE INDEX IF NOT EXISTS IX_Test_A ON Bugs(Status);
+        CREATE INDEX IF NOT EXISTS IX_Test_B ON Bugs(NoSuchColumn);
+    """, online=True)
+    with pytest.raises(sqlite3.OperationalError):
+        apply_migration(conn, step)
+    assert "IX_Test_A" in names(conn, "index")
+    assert get_version(conn) == 1
+
+
+def test_cli_migrate_status(capsys):
+    """migrate --status reports the test database as current"""
+    assert db_manager.migrate() == []
+    assert main(["migrate", "--status"]) == 0
+    assert f'"current_version": {LATEST_VERSION}' in capsys.readouterr().out
@@ -0,0 +1,97 @@
+"""
+Unit tests for the pipeline run history, daily rollup and health endpoint
+"""
+import sqlite3
+from datetime import datetime, timedelta
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.migrations import migrate, EXPECTED_PIPELINE_ROLLUP_SQL
+from app.services.cycle_time import RELATIVE_ACCURACY
+
+client = TestClient(app)
+
+# (pipeline, status, duration seconds) of scratch runs in project 1 (pipeline 1) and project 2 (pipeline 2)
+SCRATCH_RUNS = (
+    (1, "Succeeded", 300), (1, "Succeeded", 320), (1, "Failed", 60), (1, "Canceled", None),
+    (2, "Succeeded", 1800), (2, "Failed", 2400),
+)
+
+
+@pytest.fixture
+def scratch_runs(scratch):
+    """Runs of pipelines 1 and 2 from yesterday, under RunIds above any recorded run"""
+    run_date = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S')
+    first_run_id = scratch.next_value("PipelineRuns", "RunId")
+    for index, (pipeline_id, status, seconds) in enumerate(SCRATCH_RUNS):
+        scratch.insert(
+            "PipelineRuns", key=("PipelineId", "RunId"), PipelineId=pipeline_id, RunId=first_run_id + index,
+            ProjectId=pipeline_id, Status=status, RunDate=run_date, DurationSeconds=seconds
+        )
+
+
+def test_pipeline_updates_record_history():
+    """Every last run reported through Pipelines is kept and rolled up exactly"""
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    migrate(conn, seed=True)
+    pipelines = conn.execute("SELECT COUNT(*) FROM Pipelines").fetchone()[0]
+    assert conn.execute("SELECT COUNT(*) FROM PipelineRuns").fetchone()[0] == pipelines
+    
+    conn.execute(
+        "UPDATE Pipelines SET LastRunId = LastRunId + 1, LastRunStatus = 'Failed', "
+        "LastRunDate = '2025-11-26 10:00:00', DurationSeconds = 500 WHERE PipelineId = 1"
+    )
+    # A status change of the same run replaces it instead of adding another one
+    conn.execute("UPDATE Pipelines SET LastRunStatus = 'Succeeded' WHERE PipelineId = 1")
+    conn.execute("UPDATE Pipelines SET DurationSeconds = NULL WHERE PipelineId = 2")
+    conn.execute("DELETE FROM PipelineRuns WHERE PipelineId = 3")
+    
+    assert conn.execute("SELECT COUNT(*) FROM PipelineRuns").fetchone()[0] == pipelines
+    assert conn.execute(
+        "SELECT Status FROM PipelineRuns WHERE PipelineId = 1 ORDER BY RunId"
+    ).fetchall() == [("Succeeded",), ("Succeeded",)]
+    stored = conn.execute("SELECT * FROM PipelineDailyRuns ORDER BY 1, 2, 3, 4, 5").fetchall()
+    expected = conn.execute(f"SELECT * FROM ({EXPECTED_PIPELINE_ROLLUP_SQL}) ORDER BY 1, 2, 3, 4, 5").fetchall()
+    assert stored == expected
+    conn.close()
+
+
+def test_get_pipeline_health_endpoint(scratch_runs):
+    """Outcomes are exact, percentiles within the sketch accuracy, slowest pipeline first"""
+    response = client.post("/api/pipelines/get_pipeline_health", json={"days_back": 3, "top": 2})
+    assert response.status_code == 200
+    data = response.json()
+    
+    by_project = {row["project_id"]: row for row in data["by_project"]}
+    first = by_project[1]
+    assert (first["runs"], first["succeeded"], first["failed"], first["canceled"]) == (4, 2, 1, 1)
+    assert first["failure_rate"] == 0.25
+    # The canceled run has no duration and only counts as an outcome
+    assert first["mean_seconds"] == pytest.approx((300 + 320 + 60) / 3, abs=0.1)
+    assert first["p50_seconds"] == pytest.approx(300, rel=RELATIVE_ACCURACY)
+    
+    slowest = data["slowest_pipelines"][0]
+    assert (slowest["pipeline_id"], slowest["pipeline_name"], slowest["project"]) == (2, "PaymentsGateway.Release", "PaymentsGateway")
+    # Lower-rank percentile of two runs, as in the time-to-fix sketches
+    assert slowest["p90_seconds"] == pytest.approx(1800, rel=RELATIVE_ACCURACY)
+    assert len(data["slowest_pipelines"]) == 2
+
+
+def test_get_pipeline_health_filters(scratch_runs):
+    """Project filters narrow the rollup; unknown projects answer with no runs"""
+    data = client.post("/api/pipelines/get_pipeline_health", json={"days_back": 3, "project_name": "HotRetailSys"}).json()
+    assert [row["project_id"] for row in data["by_project"]] == [1]
+    assert data["overall"]["runs"] == 4
+    assert data["project_id"] == "1"
+    
+    unknown = client.post("/api/pipelines/get_pipeline_health", json={"project_name": "NoSuchProject"}).json()
+    assert unknown["overall"] == {
+        "runs": 0, "succeeded": 0, "failed": 0, "canceled": 0, "failure_rate": None,
+        "mean_seconds": None, "p50_seconds": None, "p90_seconds": None, "p99_seconds": None
+    }
+    assert unknown["slowest_pipelines"] == []
+    
+    columnar = client.post("/api/pipelines/get_pipeline_health", json={
+        "days_back": 3, "project_id": "2", "format": "columnar"
+    }).json()
+    assert columnar["slowest_pipelines"]["pipeline_id"] == [2]
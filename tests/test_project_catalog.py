@@ -0,0 +1,71 @@
+"""
+Unit tests for the in-memory project catalog
+"""
+from types import SimpleNamespace
+import pytest
+from app.database import db_manager
+from app.services.project_catalog import ProjectCatalog
+
+
+class CountingDb:
+    """Wraps the database manager and counts queries issued"""
+
+    def __init__(self, db):
+        self.db = db
+        self.queries = 0
+
+    def execute_query(self, query, params=None):
+        self.queries += 1
+        return self.db.execute_query(query, params)
+
+
+@pytest.fixture
+def catalog():
+    db = CountingDb(db_manager)
+    catalog = ProjectCatalog(db=db, refresh_interval=60)
+    catalog.load()
+    db.queries = 0
+    return catalog
+
+
+def test_resolve_by_id_and_name(catalog):
+    """Both filters resolve to the same (id, name) pair from memory"""
+    assert catalog.resolve(project_id="1") == (1, "HotRetailSys")
+    assert catalog.resolve(project_name="HotRetailSys") == (1, "HotRetailSys")
+    assert catalog.db.queries == 0
+
+
+def test_resolve_request_filter(catalog):
+    """A request's filter resolves to (id, name, matched); unknown ids and names alike resolve to nothing"""
+    request = SimpleNamespace(project_id=None, project_name=None)
+    assert catalog.resolve_request(request) == (None, None, True)
+    request = SimpleNamespace(project_id="1", project_name=None)
+    assert catalog.resolve_request(request) == (1, "HotRetailSys", True)
+    request = SimpleNamespace(project_id=None, project_name="NoSuchProject")
+    assert catalog.resolve_request(request) == (None, None, False)
+    request = SimpleNamespace(project_id="999999", project_name=None)
+    assert catalog.resolve_request(request) == (None, None, False)
+
+
+def test_unknown_project_is_negatively_cached(catalog):
+    """An unknown name costs one signature check, then never hits the database"""
+    assert catalog.resolve(project_name="NoSuchProject") is None
+    queries_after_first_miss = catalog.db.queries
+    assert catalog.resolve(project_name="NoSuchProject") is None
+    assert catalog.resolve(project_id="PROJ001") is None
+    assert catalog.db.queries == queries_after_first_miss
+
+
+def test_reload_when_projects_change(catalog):
+    """A new project becomes resolvable once the Projects signature changes"""
+    assert catalog.resolve(project_name="CatalogTestProject") is None
+    db_manager.execute_non_query(
+        "INSERT INTO Projects (AzureProjectId, ProjectName) VALUES (?, ?)",
+        ("catalog-test", "CatalogTestProject")
+    )
+    try:
+        catalog.refresh(force=True)
+        project = catalog.resolve(project_name="CatalogTestProject")
+        assert project is not None and project[1] == "CatalogTestProject"
+    finally:
+        db_manager.execute_non_query("DELETE FROM Projects WHERE AzureProjectId = ?", ("catalog-test",))
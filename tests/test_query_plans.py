@@ -0,0 +1,103 @@
+"""
+Query plan tests: every analytics service query must be served by an index
+
+Each service method is run against the test database with a recording
+wrapper around the database manager; every captured statement is then
+explained and the plan is checked for full table scans.
+"""
+import re
+import pytest
+from app.database import db_manager
+from app.schemas.bug_schemas import (
+    GetBugFixTrendsRequest,
+    GetBugTrendsRequest,
+    GetActiveBugsRequest,
+    GetBugsByStatusRequest,
+    GetBugStatisticsRequest,
+    GetTimeToFixRequest,
+    SearchBugsRequest
+)
+from app.schemas.commit_schemas import GetCommitActivityRequest, GetFixCommitsRequest
+from app.schemas.pipeline_schemas import GetPipelineHealthRequest
+from app.services.bug_service import bug_service
+from app.services.commit_service import commit_service
+from app.services.pipeline_service import pipeline_service
+
+# "SCAN t" without an index; "SCAN t USING COVERING INDEX ..." is acceptable
+FULL_SCAN = re.compile(r"\bSCAN (\w+)$")
+
+
+class RecordingDb:
+    """Delegates to the database manager and records every query issued"""
+    
+    def __init__(self, db):
+        self.db = db
+        self.queries = []
+    
+    def execute_query(self, query, params=None, **kwargs):
+        self.queries.append((query, params))
+        return self.db.execute_query(query, params, **kwargs)
+    
+    def __getattr__(self, name):
+        return getattr(self.db, name)
+
+
+def explain(query, params):
+    """Return the EXPLAIN QUERY PLAN detail lines for a statement"""
+    rows = db_manager.execute_query(f"EXPLAIN QUERY PLAN {query}", params)
+    return [row["detail"] for row in rows]
+
+
+def table_names():
+    rows = db_manager.execute_query("SELECT name FROM sqlite_master WHERE type = 'table'")
+    return {row["name"] for row in rows}
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    recorder = RecordingDb(db_manager)
+    monkeypatch.setattr(bug_service, "db", recorder)
+    monkeypatch.setattr(bug_service.trends, "db", recorder)
+    monkeypatch.setattr(pipeline_service, "db", recorder)
+    monkeypatch.setattr(commit_service, "db", recorder)
+    return recorder
+
+
+SERVICE_CALLS = [
+    (bug_service.get_bug_fix_trends, GetBugFixTrendsRequest(days_back=365)),
+    (bug_service.get_bug_fix_trends, GetBugFixTrendsRequest(days_back=30, project_id="6")),
+    (bug_service.get_bug_trends, GetBugTrendsRequest(days_back=3000, granularity="month", compare_previous=True)),
+    (bug_service.get_bug_trends, GetBugTrendsRequest(rolling_window=4, project_name="AltshulerCustomers")),
+    (bug_service.get_active_bugs, GetActiveBugsRequest()),
+    (bug_service.get_active_bugs, GetActiveBugsRequest(project_name="AltshulerCustomers", severity="High")),
+    (bug_service.get_bugs_by_status, GetBugsByStatusRequest(status="Closed")),
+    (bug_service.get_bugs_by_status, GetBugsByStatusRequest(status="New", project_id="6")),
+    (bug_service.get_bug_statistics, GetBugStatisticsRequest()),
+    (bug_service.get_bug_statistics, GetBugStatisticsRequest(project_id="1")),
+    (bug_service.get_time_to_fix, GetTimeToFixRequest(days_back=365)),
+    (bug_service.get_time_to_fix, GetTimeToFixRequest(metric="verify", severity="High", project_id="1")),
+    (pipeline_service.get_pipeline_health, GetPipelineHealthRequest(days_back=365)),
+    (pipeline_service.get_pipeline_health, GetPipelineHealthRequest(project_id="1")),
+    (commit_service.get_commit_activity, GetCommitActivityRequest(days_back=730, granularity="month")),
+    (commit_service.get_commit_activity, GetCommitActivityRequest(group_by="branch", project_id="3")),
+    (commit_service.get_fix_commits, GetFixCommitsRequest(bug_ids=[1, 31, 56, 999])),
+    (bug_service.search_bugs, SearchBugsRequest(query="null reference")),
+    (bug_service.search_bugs, SearchBugsRequest(query="timeout login", match="any", status="Active", project_id="1")),
+]
+
+
+@pytest.mark.parametrize("method,request_model", SERVICE_CALLS)
+def test_service_queries_use_indexes(recorder, method, request_model):
+    """No statement issued by the service falls back to a full table scan"""
+    method(request_model)
+    assert recorder.queries, "service method issued no queries"
+    tables = table_names()
+    for query, params in recorder.queries:
+        plan = explain(query, params)
+        # Scans of CTEs (such as a generated calendar series) read no table
+        scans = [match.group(0) for match in map(FULL_SCAN.search, plan) if match and match.group(1) in tables]
+        assert not scans, f"Full table scan in plan {plan} for query:\n{query}"
+        # Ordered results (keyset pages) must come straight from an index;
+        # calendar series only sort their generated buckets
+        if "WITH RECURSIVE" not in query:
+            assert "USE TEMP B-TREE FOR ORDER BY" not in plan, f"Sort step in plan {plan} for query:\n{query}"
@@ -0,0 +1,100 @@
+"""
+Unit tests for the read-only snapshot replicas
+"""
+import sqlite3
+from datetime import date
+import pytest
+from app.database import db_manager
+from app.replica import SnapshotReplica, RETAINED_SNAPSHOTS
+from app.services.trend_engine import TrendEngine
+
+
+@pytest.fixture
+def replica(tmp_path):
+    replica = SnapshotReplica(db_manager, str(tmp_path / "snapshots"))
+    yield replica
+    replica.close()
+
+
+def add_scratch_bug(scratch) -> int:
+    return scratch.insert(
+        "Bugs", WorkItemId=1, AzureBugId=scratch.label("REPLICA"), Severity="Low",
+        FixedDate="2002-03-04 10:00:00", Status="Closed"
+    )
+
+
+def count_bugs(db, bug_ids) -> int:
+    placeholders = ", ".join("?" for _ in bug_ids)
+    return db.execute_query(f"SELECT COUNT(*) AS n FROM Bugs WHERE BugId IN ({placeholders})", tuple(bug_ids))[0]["n"]
+
+
+def test_reads_fall_back_to_primary_until_published(replica, scratch):
+    """Before the first snapshot the replica reads the primary database"""
+    bug_ids = [add_scratch_bug(scratch)]
+    assert replica.status()["generation"] is None
+    assert count_bugs(replica, bug_ids) == 1
+    assert replica.data_version() == db_manager.data_version()
+
+
+def test_snapshot_is_isolated_until_next_publish(replica, scratch):
+    """Writes reach readers with the next snapshot, which the data version tracks"""
+    bug_ids = [add_scratch_bug(scratch)]
+    assert replica.publish()["published"] is True
+    version = replica.data_version()
+    
+    bug_ids.append(add_scratch_bug(scratch))
+    assert count_bugs(db_manager, bug_ids) == 2
+    assert count_bugs(replica, bug_ids) == 1
+    assert replica.data_version() == version
+    
+    # Services read through the replica like through the primary manager
+    trends = TrendEngine(db=replica)
+    assert trends.series(date(2002, 3, 4), date(2002, 3, 4), "day", (1,))[0][1] == 1
+    
+    status = replica.publish()
+    assert status["published"] is True and status["generation"] == 2
+    assert count_bugs(replica, bug_ids) == 2
+    assert trends.series(date(2002, 3, 4), date(2002, 3, 4), "day", (1,))[0][1] == 2
+    assert replica.data_version() != version
+    
+    # Nothing changed since: no new snapshot
+    assert replica.publish()["published"] is False
+    assert replica.status()["skipped"] == 1
+
+
+def test_snapshots_are_read_only_and_retired(replica):
+    """Writes are refused; old snapshots keep serving open readers and are then removed"""
+    replica.publish()
+    with pytest.raises(sqlite3.OperationalError):
+        replica.execute_non_query("DELETE FROM Bugs")
+    
+    total = replica.execute_query("SELECT COUNT(*) AS n FROM Bugs")[0]["n"]
+    stream = replica.iter_query("SELECT BugId FROM Bugs ORDER BY BugId", batch_size=5)
+    first = next(stream)
+    for _ in range(RETAINED_SNAPSHOTS + 1):
+        replica.publish(force=True)
+    # The stream started on a retired snapshot still finishes
+    assert len(first) + sum(len(batch) for batch in stream) == total
+    
+    files = sorted(path.name for path in replica.directory.glob("snapshot-*.db"))
+    assert files == ["snapshot-000003.db", "snapshot-000004.db"]
+    assert replica.pool_stats()["connections_open"] <= 1
+
+
+def test_publish_after_restart_continues_generations(tmp_path):
+    """A new replica on the same directory numbers past and retires the old snapshots"""
+    directory = str(tmp_path / "snapshots")
+    first = SnapshotReplica(db_manager, directory)
+    for _ in range(3):
+        first.publish(force=True)
+    first.close()
+    
+    second = SnapshotReplica(db_manager, directory)
+    try:
+        status = second.publish()
+        assert status["published"] is True and status["generation"] == 4
+        assert second.execute_query("SELECT COUNT(*) AS n FROM Bugs")[0]["n"] > 0
+        files = sorted(path.name for path in second.directory.glob("snapshot-*.db"))
+        assert files == ["snapshot-000003.db", "snapshot-000004.db"]
+    finally:
+        second.close()
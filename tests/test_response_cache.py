@@ -0,0 +1,84 @@
+"""
+Unit tests for the data-version-aware response cache
+"""
+import pytest
+from app.database import db_manager
+from app.schemas.bug_schemas import GetBugStatisticsRequest
+from app.services.response_cache import ResponseCache, make_etag
+
+
+class Counter:
+    """Async compute function that counts how often it runs"""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def __call__(self, request):
+        self.calls += 1
+        return {"call": self.calls, "project_id": request.project_id}
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache(db=db_manager, ttl_seconds=60, max_entries=2, enabled=True)
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_hit(cache):
+    """Equivalent requests share one entry and the service runs once"""
+    compute = Counter()
+    first = await cache.get_or_compute("stats", GetBugStatisticsRequest(), compute)
+    second = await cache.get_or_compute("stats", GetBugStatisticsRequest(project_id=None), compute)
+    assert first is second
+    assert compute.calls == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+
+@pytest.mark.asyncio
+async def test_response_shapes_share_an_entry(cache):
+    """format/compact only shape the response: one cache entry, distinct ETags"""
+    compute = Counter()
+    rows = GetBugStatisticsRequest()
+    columnar = GetBugStatisticsRequest(format="columnar", compact=True)
+    first = await cache.get_or_compute("stats", rows, compute)
+    second = await cache.get_or_compute("stats", columnar, compute)
+    assert first is second
+    assert compute.calls == 1
+    assert make_etag("stats", rows, 1) != make_etag("stats", columnar, 1)
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted(cache):
+    """The cache holds max_entries and evicts the least recently used"""
+    compute = Counter()
+    for project_id in ("1", "2", "1", "3"):
+        await cache.get_or_compute("stats", GetBugStatisticsRequest(project_id=project_id), compute)
+    assert cache.stats()["evictions"] == 1
+    await cache.get_or_compute("stats", GetBugStatisticsRequest(project_id="1"), compute)
+    assert compute.calls == 3  # "1" survived, "2" was evicted
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_recomputed():
+    """Entries older than the TTL are treated as misses"""
+    cache = ResponseCache(db=db_manager, ttl_seconds=0, max_entries=8, enabled=True)
+    compute = Counter()
+    await cache.get_or_compute("stats", GetBugStatisticsRequest(), compute)
+    await cache.get_or_compute("stats", GetBugStatisticsRequest(), compute)
+    assert compute.calls == 2
+    assert cache.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_database_write_invalidates(cache):
+    """A commit to the database drops every cached response"""
+    compute = Counter()
+    await cache.get_or_compute("stats", GetBugStatisticsRequest(), compute)
+    db_manager.execute_non_query("UPDATE SyncLog SET RecordsFetched = RecordsFetched + 1 WHERE SyncId = 1")
+    try:
+        await cache.get_or_compute("stats", GetBugStatisticsRequest(), compute)
+    finally:
+        db_manager.execute_non_query("UPDATE SyncLog SET RecordsFetched = RecordsFetched - 1 WHERE SyncId = 1")
+    assert compute.calls == 2
+    assert cache.stats()["invalidations"] == 1
@@ -0,0 +1,109 @@
+"""
+Unit tests for the incremental sync engine
+"""
+import json
+import pytest
+from app.database import db_manager
+from app.services.fix_rollup import bug_fix_rollup
+from app.services.sync_engine import SyncEngine
+from app.services.sync_sources import FileSyncSource, SyncSource
+
+PROJECT_GUID = "00000000-0000-4000-8000-00000000face"
+
+
+def work_item(item_id, changed, item_type="Bug", state="Active", **fields):
+    return {
+        "id": item_id,
+        "fields": {
+            "System.TeamProject": "SyncTestProject",
+            "System.Title": f"Synced item {item_id}",
+            "System.WorkItemType": item_type,
+            "System.State": state,
+            "System.ChangedDate": changed,
+            "System.AssignedTo": {"displayName": "Dev", "uniqueName": "dev@example.com"},
+            "Microsoft.VSTS.Common.Severity": "2 - High",
+            **fields
+        }
+    }
+
+
+@pytest.fixture
+def export(tmp_path):
+    """A fake Azure DevOps export with one project and three work items"""
+    path = tmp_path / "export.json"
+    data = {
+        "projects": [{"id": PROJECT_GUID, "name": "SyncTestProject", "state": "wellFormed"}],
+        "workItems": [
+            work_item(880001, "2025-11-01T08:00:00Z", item_type="Task"),
+            work_item(880002, "2025-11-02T08:00:00Z"),
+            work_item(880003, "2025-11-03T08:00:00.250Z")
+        ]
+    }
+    path.write_text(json.dumps(data))
+    yield path, data
+    db_manager.execute_non_query("DELETE FROM Bugs WHERE AzureBugId IN ('880001', '880002', '880003')")
+    db_manager.execute_non_query("DELETE FROM WorkItems WHERE AzureWorkItemId IN (880001, 880002, 880003)")
+    db_manager.execute_non_query("DELETE FROM Projects WHERE AzureProjectId = ?", (PROJECT_GUID,))
+    db_manager.execute_non_query("DELETE FROM SyncWatermarks WHERE AzureProjectId = ?", (PROJECT_GUID,))
+    db_manager.execute_non_query("DELETE FROM SyncLog WHERE Source = 'File'")
+
+
+def project_summary(result):
+    return next(p for p in result["projects"] if p["azure_project_id"] == PROJECT_GUID)
+
+
+def test_full_then_incremental_sync(export):
+    """The first run loads everything; later runs only fetch changed items"""
+    path, data = export
+    engine = SyncEngine(FileSyncSource(str(path)), batch_size=2)
+    
+    first = project_summary(engine.run())
+    assert first["error"] is None
+    assert first["batches"] == 2
+    assert first["work_items_upserted"] == 3
+    assert first["bugs_upserted"] == 2
+    assert first["watermark"] == "2025-11-03 08:00:00"
+    
+    # Nothing changed: only the item on the watermark boundary is re-read
+    second = project_summary(engine.run())
+    assert second["work_items_fetched"] == 1
+    
+    data["workItems"][1] = work_item(
+        880002, "2025-11-05T09:00:00Z", state="Closed",
+        **{"Microsoft.VSTS.Common.ClosedDate": "2025-11-05T09:00:00Z"}
+    )
+    path.write_text(json.dumps(data))
+    third = project_summary(engine.run())
+    assert third["work_items_fetched"] == 2  # the changed item plus the boundary item
+    assert third["watermark"] == "2025-11-05 09:00:00"
+    
+    rows = db_manager.execute_query(
+        "SELECT Status, Severity, FixedDate FROM Bugs WHERE AzureBugId = ?", ("880002",)
+    )
+    assert rows == [{"Status": "Closed", "Severity": "High", "FixedDate": "2025-11-05 09:00:00"}]
+    assert bug_fix_rollup.check()["consistent"]
+
+
+def test_failed_batch_keeps_earlier_batches(export):
+    """A bad item stops the project after the last committed batch and is logged"""
+    path, data = export
+    data["workItems"][2]["id"] = "not-a-number"
+    path.write_text(json.dumps(data))
+    
+    summary = project_summary(SyncEngine(FileSyncSource(str(path)), batch_size=1).run())
+    assert summary["error"]
+    assert summary["batches"] == 2
+    assert summary["watermark"] == "2025-11-02 08:00:00"
+    
+    failures = db_manager.execute_query("SELECT COUNT(*) AS n FROM SyncLog WHERE Source = 'File' AND IsSuccess = 0")
+    assert failures[0]["n"] > 0
+
+
+def test_incomplete_source_fails_on_creation():
+    """A source missing part of the interface cannot be instantiated"""
+    class ProjectsOnlySource(SyncSource):
+        def fetch_projects(self):
+            return []
+    
+    with pytest.raises(TypeError):
+        ProjectsOnlySource()
@@ -0,0 +1,84 @@
+"""
+Unit tests for the calendar-bucketed trend engine
+"""
+from datetime import date
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.trend_engine import trend_engine, bucket_start, bucket_count, shift_buckets
+
+client = TestClient(app)
+
+# Closed bugs of project 1 on far-off days: (FixedDate, count)
+SCRATCH_FIXES = (("2001-01-31 10:00:00", 2), ("2001-02-05 09:00:00", 1), ("2001-03-20 12:00:00", 3))
+
+
+@pytest.fixture
+def scratch_fixes(scratch):
+    """Closed bugs in early 2001, removed afterwards"""
+    for fixed_date, count in SCRATCH_FIXES:
+        for _ in range(count):
+            scratch.insert(
+                "Bugs", WorkItemId=1, AzureBugId=scratch.label("TREND"), Severity="Low",
+                FixedDate=fixed_date, Status="Closed"
+            )
+
+
+def test_calendar_helpers():
+    """Bucket starts, shifts and counts follow ISO weeks and calendar months"""
+    assert bucket_start(date(2001, 2, 4), "week") == date(2001, 1, 29)
+    assert bucket_start(date(2001, 2, 4), "month") == date(2001, 2, 1)
+    assert shift_buckets(date(2001, 1, 1), "month", -2) == date(2000, 11, 1)
+    assert shift_buckets(date(2001, 1, 29), "week", 2) == date(2001, 2, 12)
+    assert bucket_count(date(2001, 1, 29), date(2001, 2, 4), "week") == 1
+    assert bucket_count(date(2000, 11, 1), date(2001, 2, 1), "month") == 4
+
+
+def test_series_fills_gaps_per_bucket(scratch_fixes):
+    """Every bucket is present, empty ones as zero, counts summed per bucket"""
+    daily = trend_engine.series(date(2001, 1, 30), date(2001, 2, 5), "day", (1,))
+    assert [row[:2] for row in daily] == [
+        ("2001-01-30", 0), ("2001-01-31", 2), ("2001-02-01", 0), ("2001-02-02", 0),
+        ("2001-02-03", 0), ("2001-02-04", 0), ("2001-02-05", 1)
+    ]
+    
+    monthly = trend_engine.series(date(2001, 1, 1), date(2001, 4, 30), "month", (1,), rolling_window=2)
+    assert monthly == [("2001-01-01", 2, 2.0), ("2001-02-01", 1, 1.5), ("2001-03-01", 3, 2.0), ("2001-04-01", 0, 1.5)]
+    
+    assert [row[1] for row in trend_engine.series(date(2001, 1, 1), date(2001, 4, 30), "month", ())] == [0, 0, 0, 0]
+
+
+def test_get_bug_trends_endpoint(scratch_fixes):
+    """Weekly buckets with rolling average and previous-period comparison"""
+    response = client.post("/api/bugs/get_bug_trends", json={
+        "granularity": "week", "start_date": "2001-02-01", "end_date": "2001-03-25",
+        "rolling_window": 2, "compare_previous": True, "project_id": "1"
+    })
+    assert response.status_code == 200
+    data = response.json()
+    assert data["period_start"] == "2001-01-29"
+    assert len(data["buckets"]) == 8
+    assert data["total_fixed_bugs"] == 6
+    assert data["buckets"][1] == {
+        "bucket_start": "2001-02-05", "fixed_count": 1, "rolling_average": 1.5, "previous_count": 0
+    }
+    assert data["previous_period"] == {
+        "period_start": "2000-12-04", "period_end": "2001-01-28",
+        "total_fixed_bugs": 0, "change": 6, "change_pct": None
+    }
+    
+    columnar = client.post("/api/bugs/get_bug_trends", json={
+        "granularity": "month", "start_date": "2001-01-15", "end_date": "2001-03-31", "project_id": "1",
+        "format": "columnar"
+    }).json()
+    assert columnar["buckets"]["fixed_count"] == [2, 1, 3]
+
+
+def test_get_bug_trends_validation():
+    """Reversed or over-long periods are rejected"""
+    assert client.post("/api/bugs/get_bug_trends", json={
+        "start_date": "2001-02-01", "end_date": "2001-01-01"
+    }).status_code == 422
+    assert client.post("/api/bugs/get_bug_trends", json={
+        "start_date": "1990-01-01", "end_date": "2001-01-01"
+    }).status_code == 422